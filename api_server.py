@@ -0,0 +1,326 @@
+# api_server.py — Headless HTTP API for the analyzer (for ATS integrations)
+#
+#   python api_server.py --port 8600 --workers 4
+#
+#   POST /v1/analyze?field=Technology      resume as multipart "file" or raw body + ?filename=cv.pdf
+#                                          (field=all scores every field; profile=cprofile|sampling adds a report)
+#   POST /v1/batch?field=Technology        .zip/.tar of resumes -> NDJSON, one row per resume as it finishes
+#   GET  /v1/jobs?q=data+analyst&location=India&page=1
+#   GET  /v1/events?country=India
+#   GET  /healthz
+#   GET  /metrics                          Prometheus text (per-stage latency, bytes, cache outcomes)
+#
+# Parsing runs in a bounded process pool through the same functions the app and
+# batch_analyze.py use. When the pool's queue is full the server answers 503 with
+# Retry-After instead of queueing without limit; batch responses keep a small
+# window of resumes in flight and only submit more as the client reads rows.
+import os
+import sys
+import json
+import time
+import zlib
+import asyncio
+import tarfile
+import zipfile
+import tempfile
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+import tornado.web
+import tornado.ioloop
+import tornado.httpserver
+from tornado.iostream import StreamClosedError
+
+from batch_analyze import RESUME_EXTS, profile_one, analyze_one, iter_jobs
+from resume_analysis import MAX_UPLOAD_BYTES, load_term_index
+from field_rules import load_rules
+from catalogue import load_catalogue
+from opportunity_cache import OpportunityCache
+from cache_backend import make_backend
+from job_store import JobStore
+from tracing import tracer, profiled, sampled
+
+MAX_BATCH_BYTES = 200 * 1024 * 1024
+# What a truncated or corrupt archive raises partway through iter_jobs (ArchiveTooLarge is a ValueError).
+ARCHIVE_ERRORS = (ValueError, zipfile.BadZipFile, tarfile.TarError, zlib.error, EOFError, OSError)
+PROFILERS = {"cprofile": profiled, "sampling": sampled}
+
+
+class Service:
+    """Pools, admission counters and shared stores; one per server process."""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 max_batches: int = 2, cache_dir: Optional[str] = ".cache"):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.max_batches = max_batches
+        self.resume_cache_dir = os.path.join(cache_dir, "resumes") if cache_dir else None
+        # forkserver (spawn where unavailable): never fork the threaded server process itself;
+        # workers build the skill index once at startup instead of on their first request
+        method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        self.cpu_pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context(method),
+                                            initializer=load_term_index)
+        self.io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api-io")
+        self.pending = 0
+        self.batches = 0
+        # same backend choice as the app, so the API and the app replicas share snapshots and fetches
+        self.backend = make_backend(cache_dir=cache_dir)
+        self.jobs = JobStore(os.path.join(cache_dir, "jobs.sqlite") if cache_dir else
+                             os.path.join(tempfile.gettempdir(), "jobs.sqlite"), leases=self.backend)
+        self.opportunities = OpportunityCache(self.backend, ttl=1800)
+
+    async def cpu(self, fn, *args):
+        """Run fn in the process pool, counting it against max_pending while it runs."""
+        self.pending += 1
+        try:
+            return await asyncio.wrap_future(self.cpu_pool.submit(fn, *args))
+        finally:
+            self.pending -= 1
+
+    async def io(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.io_pool, fn, *args)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"workers": self.workers, "pending": self.pending, "max_pending": self.max_pending,
+                "batches": self.batches, "max_batches": self.max_batches}
+
+
+# ----------------------------- Handlers ----------------------------- #
+class ApiHandler(tornado.web.RequestHandler):
+    def initialize(self, service: Service):
+        self.service = service
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+
+    def write_error(self, status_code: int, **kwargs):
+        if getattr(self, "retry_after", None):
+            self.set_header("Retry-After", str(self.retry_after))   # send_error() cleared it
+        reason = self._reason
+        exc = kwargs.get("exc_info", (None, None))[1]
+        if isinstance(exc, tornado.web.HTTPError) and exc.log_message:
+            reason = exc.log_message
+        self.finish({"error": reason})
+
+    def field_arg(self) -> str:
+        field = self.get_argument("field", "Technology")
+        if field != "all" and field not in load_rules().names:
+            raise tornado.web.HTTPError(400, f"Unknown field {field!r}; choose from all, {', '.join(load_rules().names)}")
+        return field
+
+    def int_arg(self, name: str, default: int, lo: int, hi: Optional[int] = None) -> int:
+        """Integer query argument clamped to [lo, hi]; 400 when it is not an integer."""
+        raw = self.get_argument(name, str(default))
+        try:
+            value = int(raw)
+        except ValueError:
+            raise tornado.web.HTTPError(400, f"{name} must be an integer, got {raw!r}")
+        value = max(lo, value)
+        return min(hi, value) if hi is not None else value
+
+    def busy(self, message: str, retry_after: int):
+        """503 with Retry-After (write_error adds the header to the error response)."""
+        self.retry_after = retry_after
+        raise tornado.web.HTTPError(503, message)
+
+    def admit(self):
+        """Backpressure: refuse new CPU work once the pool's queue is full."""
+        if self.service.pending >= self.service.max_pending:
+            self.busy("Analyzer busy, retry shortly", 1)
+
+    def upload(self):
+        """(bytes, filename) from a multipart "file" part or the raw body + ?filename=."""
+        files = self.request.files.get("file")
+        if files:
+            return files[0]["body"], files[0]["filename"]
+        name = self.get_argument("filename", "")
+        if not name or not self.request.body:
+            raise tornado.web.HTTPError(400, "Send the resume as multipart 'file' or as the body with ?filename=")
+        return self.request.body, name
+
+
+class HealthHandler(ApiHandler):
+    def get(self):
+        self.finish(dict(self.service.stats(), ok=True))
+
+
+class MetricsHandler(ApiHandler):
+    def get(self):
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.finish(tracer.prometheus_text())
+
+
+def _profiled_call(kind: str, fn, *args):
+    """Run fn under a profiler in the calling (io) thread; (value, report)."""
+    with PROFILERS[kind]() as capture:
+        value = fn(*args)
+    return value, capture["report"]
+
+class AnalyzeHandler(ApiHandler):
+    async def post(self):
+        field = self.field_arg()
+        profiler = self.get_argument("profile", "")
+        if profiler and profiler not in PROFILERS:
+            raise tornado.web.HTTPError(400, f"profile must be one of {', '.join(PROFILERS)}")
+        data, name = self.upload()
+        if not name.lower().endswith(RESUME_EXTS):
+            raise tornado.web.HTTPError(415, "Supported formats: .pdf, .docx, .txt")
+        if len(data) > MAX_UPLOAD_BYTES:
+            raise tornado.web.HTTPError(413, f"Resume larger than {MAX_UPLOAD_BYTES} bytes")
+        self.admit()
+        t0 = time.perf_counter()
+        report = None
+        with tracer.span("api.analyze", bytes=len(data), field=field) as span:
+            try:
+                if profiler:
+                    # profiled requests skip the process pool (and the resume cache) so the
+                    # report covers the real parse, in a thread this process can observe
+                    prof, report = await self.service.io(_profiled_call, profiler, profile_one, data, name, None)
+                else:
+                    prof = await self.service.cpu(profile_one, data, name, self.service.resume_cache_dir)
+            except Exception as e:
+                raise tornado.web.HTTPError(422, f"Could not parse resume: {type(e).__name__}: {e}")
+            rules = load_rules()
+            out = {"file": name, "field": field, "profile": prof}
+            if field == "all":
+                out["fields"] = rules.evaluate_all(prof)
+            else:
+                out.update(rules.evaluate(prof, field))
+            span["profiled"] = profiler or None
+        out["seconds"] = round(time.perf_counter() - t0, 4)
+        if report:
+            out["profile_report"] = report
+        self.finish(out)
+
+
+class BatchHandler(ApiHandler):
+    async def post(self):
+        field = self.field_arg()
+        if field == "all":
+            raise tornado.web.HTTPError(400, "Batch analysis takes a single field")
+        svc = self.service
+        if svc.batches >= svc.max_batches:
+            self.busy("Too many batch jobs running, retry shortly", 5)
+        svc.batches += 1
+        fd, path = tempfile.mkstemp(suffix=".archive")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.request.body)
+            await self._stream(path, field)
+        finally:
+            svc.batches -= 1
+            os.unlink(path)
+
+    async def _stream(self, path: str, field: str):
+        svc = self.service
+        try:
+            jobs = iter_jobs(path)
+            first = await svc.io(next, jobs, None)
+        except ARCHIVE_ERRORS:
+            raise tornado.web.HTTPError(400, "Send a .zip or .tar archive of PDF/DOCX/TXT resumes")
+        self.admit()
+        self.set_header("Content-Type", "application/x-ndjson")
+        window = svc.workers
+        running: Dict[asyncio.Future, int] = {}
+        job, index, done, failed, error = first, 0, 0, 0, None
+        t0 = time.perf_counter()
+        try:
+            while job is not None or running:
+                # keep at most `window` resumes in flight for this request, and none past the
+                # service-wide max_pending (the 503 threshold of single analyses)
+                while job is not None and len(running) < window and svc.pending < svc.max_pending:
+                    running[asyncio.ensure_future(svc.cpu(analyze_one, job, field, svc.resume_cache_dir))] = index
+                    index += 1
+                    try:
+                        job = await svc.io(next, jobs, None)
+                    except ARCHIVE_ERRORS as e:
+                        # corrupt or oversized archive: finish what is running, then report it
+                        job, error = None, f"{type(e).__name__}: {e}"
+                if not running:
+                    await asyncio.sleep(0.05)  # the pool is full of other requests' work
+                    continue
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for fut in finished:
+                    row = dict(fut.result(), index=running.pop(fut))
+                    done += 1
+                    failed += bool(row["error"])
+                    self.write(json.dumps(row) + "\n")
+                await self.flush()  # waits for the client, so a slow reader slows submission
+            elapsed = time.perf_counter() - t0
+            summary = {"resumes": done, "failed": failed, "seconds": round(elapsed, 3)}
+            if error:
+                summary["error"] = error
+            self.finish(json.dumps({"summary": summary}) + "\n")
+        except StreamClosedError:
+            for fut in running:
+                fut.cancel()
+        finally:
+            jobs.close()
+
+
+class JobsHandler(ApiHandler):
+    async def get(self):
+        svc = self.service
+        query = self.get_argument("q", "")
+        location = self.get_argument("location", "") or None
+        page = self.int_arg("page", 1, 1)
+        per_page = self.int_arg("per_page", 20, 1, 100)
+        sort = self.get_argument("sort", "relevance")
+        descending = self.get_argument("desc", "0") == "1"
+        svc.jobs.refresh_in_background()
+        if await svc.io(svc.jobs.count):
+            rows, total = await svc.io(svc.jobs.search, query, location, per_page, (page - 1) * per_page,
+                                       sort, descending)
+            self.finish({"source": "index", "total": total, "page": page, "items": rows})
+            return
+        snap = await svc.io(lambda: svc.opportunities.get("remotive", query=query, location=location or "Remote"))
+        self.finish({"source": "live", "total": len(snap["items"]), "page": 1, "items": snap["items"],
+                     "status": snap["status"], "age": snap["age"]})
+
+
+class EventsHandler(ApiHandler):
+    async def get(self):
+        country = self.get_argument("country", "India")
+        snaps = await self.service.io(self.service.opportunities.get_many, {"devpost": {}, "sports": {}})
+        catalogue = load_catalogue()
+        leagues = snaps["sports"]
+        catalogue.sync_leagues(leagues["fetched_at"], leagues["items"])
+        snaps["sports"] = dict(leagues, items=catalogue.find("event", field="Sports", country=country, source="sports"))
+        self.finish({source: {k: snap[k] for k in ("items", "status", "age", "error")}
+                     for source, snap in snaps.items()})
+
+
+def make_app(service: Service) -> tornado.web.Application:
+    args = {"service": service}
+    return tornado.web.Application([
+        (r"/healthz", HealthHandler, args),
+        (r"/metrics", MetricsHandler, args),
+        (r"/v1/analyze", AnalyzeHandler, args),
+        (r"/v1/batch", BatchHandler, args),
+        (r"/v1/jobs", JobsHandler, args),
+        (r"/v1/events", EventsHandler, args),
+    ])
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Career Gap Mapper analysis API.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8600)
+    ap.add_argument("--workers", type=int, default=None, help="Parser processes (default: all cores)")
+    ap.add_argument("--max-pending", type=int, default=None,
+                    help="Resumes queued or parsing before new requests get 503 (default: 4 x workers)")
+    ap.add_argument("--max-batches", type=int, default=2, help="Concurrent batch jobs")
+    ap.add_argument("--cache-dir", default=os.environ.get("GAP_MAPPER_CACHE_DIR", ".cache"),
+                    help="Shared with the Streamlit app; empty disables the disk caches")
+    args = ap.parse_args(argv)
+
+    service = Service(args.workers, args.max_pending, args.max_batches, args.cache_dir or None)
+    server = tornado.httpserver.HTTPServer(make_app(service), max_body_size=MAX_BATCH_BYTES)
+    server.listen(args.port, args.host)
+    print(f"Listening on http://{args.host}:{args.port} with {service.workers} parser workers", file=sys.stderr)
+    tornado.ioloop.IOLoop.current().start()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
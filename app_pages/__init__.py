@@ -0,0 +1,21 @@
+# app_pages — One module per sidebar page, each exposing render().
+#
+# Page modules are imported on first use, so a session that never opens Home, the
+# live-data pages or the Tips Bot never loads pdfplumber, pandas, requests or
+# NumPy. Python caches the import, so later reruns only pay for the page's render().
+import importlib
+from typing import Dict
+
+PAGES: Dict[str, str] = {
+    "🏠 Home + Resume Analyzer": "home",
+    "🌍 Location Selector": "location",
+    "🏆 Events & Competitions": "events",
+    "🎓 Courses & Internships": "courses",
+    "🤖 Career Tips Bot": "tips_bot",
+    "📚 Resources": "resources",
+}
+
+
+def render(page: str) -> None:
+    """Import the page's module (first time only) and draw it."""
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render()
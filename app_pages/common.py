@@ -0,0 +1,60 @@
+# common.py — Lightweight UI helpers shared by every page
+# (Streamlit + stdlib only, so importing it never pulls in pandas, PDF or HTTP libraries)
+import os
+import datetime as dt
+from typing import List, Dict, Optional
+
+import streamlit as st
+
+
+@st.cache_data(show_spinner=False)
+def load_countries() -> Dict[str, List[str]]:
+    """Static country -> city lists, extend as needed."""
+    return {
+        "India": ["Delhi", "Mumbai", "Bengaluru", "Chennai", "Hyderabad", "Pune", "Kolkata", "Ahmedabad", "Jaipur", "Lucknow"],
+        "USA": ["New York", "San Francisco", "Chicago", "Seattle", "Austin", "Los Angeles", "Boston", "Atlanta", "Dallas", "Miami"],
+        "UK": ["London", "Manchester", "Birmingham", "Leeds", "Edinburgh", "Glasgow", "Bristol", "Liverpool", "Cardiff"],
+    }
+
+def cache_subdir(name: str) -> Optional[str]:
+    """On-disk cache location under GAP_MAPPER_CACHE_DIR (default .cache; set empty to disable)."""
+    root = os.environ.get("GAP_MAPPER_CACHE_DIR", ".cache")
+    return os.path.join(root, name) if root else None
+
+def debug_enabled() -> bool:
+    """Debug panel on when GAP_MAPPER_DEBUG=1 or the URL has ?debug=1."""
+    return os.environ.get("GAP_MAPPER_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+def section_title(title: str, emoji: str = "✨"):
+    st.markdown(f"### {emoji} {title}")
+
+def pill(text: str, color: str = "#0ea5e9"):
+    st.markdown(
+        f"""
+        <span style="
+            background:{color};
+            color:white;
+            padding:4px 10px;
+            border-radius:999px;
+            font-size:0.85rem;">
+            {text}
+        </span>
+        """,
+        unsafe_allow_html=True
+    )
+
+def pretty_date(date_str: str) -> str:
+    try:
+        return dt.datetime.fromisoformat(date_str).strftime("%d %b %Y")
+    except:
+        return date_str
+
+def course_search_links(keyword: str):
+    """Generate universal search links (Coursera/edX/Udemy/ClassCentral)."""
+    q = keyword.replace(" ", "+")
+    return {
+        "Coursera": f"https://www.coursera.org/search?query={q}",
+        "edX": f"https://www.edx.org/search?q={q}",
+        "Udemy": f"https://www.udemy.com/courses/search/?q={q}",
+        "Class Central": f"https://www.classcentral.com/search?q={q}"
+    }
@@ -0,0 +1,90 @@
+# courses.py — 🎓 Courses & Internships (local job index, resume matching, course links)
+import time
+
+import streamlit as st
+import pandas as pd
+
+from field_rules import load_rules
+from catalogue import load_catalogue
+from opportunity_cache import format_age
+from app_pages.common import load_countries, section_title, course_search_links
+from app_pages.live_data import (JOBS_PER_PAGE, get_job_store, get_job_matcher, paged_table,
+                                 fetch_remotive_jobs, freshness_note, live_data_status)
+
+JOB_SORTS = {"Relevance": "relevance", "Date posted": "published", "Title": "title", "Company": "company"}
+
+
+def render():
+    live_data_status()
+    st.title("🎓 Recommended Courses & Internships (Live where possible)")
+
+    field = st.selectbox("Choose field", load_rules().names)
+    rule = load_rules().rule(field)
+    catalogue = load_catalogue()
+    query = st.text_input("Search keyword", value=rule.search_query)
+
+    # Internships/Jobs for fields whose rules expect them; others show competitions/training
+    if rule.internships:
+        section_title("Live Internships & Jobs (Remotive)", "💼")
+        job_store = get_job_store()
+        job_store.refresh_in_background()
+        location = st.selectbox("Candidate location", ["Anywhere"] + list(load_countries().keys()))
+        location = None if location == "Anywhere" else location
+        if job_store.count():
+            # Local full-text index: ranked, sorted, paginated, location-aware, no network round-trip
+            if st.session_state.get("jobs_search") != (query, location):
+                st.session_state["jobs_search"] = (query, location)
+                st.session_state["jobs_page"] = 1
+            timing = {}
+
+            def search(sort, descending, limit, offset):
+                t0 = time.perf_counter()
+                rows, total = job_store.search(query, location, limit=limit, offset=offset,
+                                               sort=sort, descending=descending)
+                timing["ms"] = (time.perf_counter() - t0) * 1000
+                return rows, total
+
+            total = paged_table("jobs", search, JOB_SORTS, per_page=JOBS_PER_PAGE)
+            if not total:
+                st.info("No matching jobs in the local index — try a broader keyword.")
+            st.caption(f"{total} matches of {job_store.count()} indexed jobs · {timing['ms']:.1f} ms · "
+                       f"index updated {format_age(job_store.age() or 0)}")
+
+            resume_text = st.session_state.get("resume_match_text")
+            if resume_text:
+                section_title("Best Matches for Your Resume", "🎯")
+                jobs, matcher = get_job_matcher(job_store.ingested_at() or 0.0)
+                t0 = time.perf_counter()
+                idx, scores = matcher.top_k_jobs([resume_text], k=10)
+                took_ms = (time.perf_counter() - t0) * 1000
+                best = [dict(jobs[i], match=f"{s:.0%}") for i, s in zip(idx[0], scores[0])]
+                if best:
+                    st.dataframe(pd.DataFrame(best).drop(columns=["id"]), use_container_width=True)
+                    st.caption(f"Ranked {len(jobs)} postings against your analyzed resume in {took_ms:.1f} ms")
+                else:
+                    st.info("No indexed postings to rank yet — they appear once the job index is filled.")
+            else:
+                st.caption("Analyze your resume on the Home page to see the postings that match it best.")
+        else:
+            jobs = fetch_remotive_jobs(query, location or "Remote")
+            if jobs["items"]:
+                freshness_note(jobs)
+                st.dataframe(pd.DataFrame(jobs["items"]), use_container_width=True)
+            else:
+                st.warning("Couldn’t fetch live jobs. Showing curated roles.")
+                st.dataframe(pd.DataFrame(catalogue.find("job")), use_container_width=True)
+    else:
+        section_title("Competitions/Training Instead of Internships", "🏅")
+        programs = catalogue.find("program", field=field) or catalogue.find("program", field="Other")
+        st.dataframe(pd.DataFrame(programs), use_container_width=True)
+
+    section_title("Courses (links + curated picks)", "📚")
+    linkset = course_search_links(query)
+    cols = st.columns(4)
+    for i, (name, url) in enumerate(linkset.items()):
+        with cols[i % 4]:
+            st.markdown(f"[{name}]({url})")
+
+    st.markdown("#### Curated Courses with Dates & Requirements")
+    courses = catalogue.find("course", field=field) or catalogue.find("course", field="Other")
+    st.dataframe(pd.DataFrame(courses), use_container_width=True)
@@ -0,0 +1,43 @@
+# debug.py — Sidebar debug panel: pipeline traces, Prometheus export, one-run profiler
+# (only imported when debug_enabled(); see app_pages.common)
+import contextlib
+
+import streamlit as st
+
+from tracing import tracer, profiled, sampled
+
+PROFILERS = {"cProfile": profiled, "Stack sampling": sampled}
+
+
+def _arm_profiler():
+    st.session_state["profile_next"] = st.session_state.get("profiler_kind", "cProfile")
+
+def run_profiler():
+    """Profiler context for this run if one was armed (the arming click's own rerun), else a no-op."""
+    kind = st.session_state.pop("profile_next", None)
+    if kind in PROFILERS:
+        return PROFILERS[kind]()
+    return contextlib.nullcontext({})
+
+def render_sidebar(capture: dict, session_sizes: dict):
+    with st.sidebar.expander("🔧 Debug: pipeline traces", expanded=bool(capture.get("report"))):
+        stats = tracer.stats()
+        if stats:
+            st.dataframe([dict(stage=name, **{k: v for k, v in s.items() if k != "cache"},
+                               cache=", ".join(f"{k}={v}" for k, v in s["cache"].items()))
+                          for name, s in stats.items()], use_container_width=True, hide_index=True)
+            st.caption("Last spans")
+            st.dataframe(tracer.recent(15), use_container_width=True, hide_index=True)
+            st.download_button("Prometheus metrics", tracer.prometheus_text(), file_name="gap_mapper.prom")
+        else:
+            st.caption("No spans recorded yet.")
+        st.caption(f"This session's state: {sum(session_sizes.values()) / 1024:.1f} KiB")
+        st.dataframe([{"key": k, "KiB": round(n / 1024, 1)}
+                      for k, n in sorted(session_sizes.items(), key=lambda kv: -kv[1])[:10]],
+                     use_container_width=True, hide_index=True)
+        st.selectbox("Profiler", list(PROFILERS), key="profiler_kind")
+        st.button("Profile the next run", on_click=_arm_profiler,
+                  help="Reruns the current page once under the profiler (interacting with a widget does the same after arming).")
+        if capture.get("report"):
+            st.caption("Profile of this run")
+            st.code(capture["report"], language=None)
@@ -0,0 +1,63 @@
+# events.py — 🏆 Events & Competitions (live Devpost / TheSportsDB, curated catalogue fallbacks)
+import datetime as dt
+
+import streamlit as st
+import pandas as pd
+
+from field_rules import load_rules
+from catalogue import load_catalogue
+from app_pages.common import load_countries, pill
+from app_pages.live_data import (event_feeds, freshness_note, live_data_status,
+                                 get_opportunity_store, paged_table)
+
+SORT_OPTIONS = {"Start date": "start", "Name": "name", "Organizer": "org", "Category": "category", "City": "city"}
+
+
+def live_events(partition: str, snap, field: str, country: str, city: str, **defaults) -> int:
+    """Sync one feed snapshot into the columnar store and show it filtered, sorted and paginated."""
+    store = get_opportunity_store()
+    store.sync(partition, snap["fetched_at"], snap["items"], field=field, **defaults)
+    upcoming = st.checkbox("Upcoming only", value=True, key=f"{partition}_upcoming")
+    return paged_table(
+        f"events_{partition}",
+        lambda sort, desc, limit, offset: store.query(
+            field=field, partitions=[partition], country=country, city=city,
+            since=dt.date.today() if upcoming else None,
+            sort=sort, descending=desc, limit=limit, offset=offset),
+        SORT_OPTIONS,
+    )
+
+
+def render():
+    live_data_status()
+    st.title("🏆 Events & Competitions (Live where possible)")
+
+    field = st.selectbox("Choose field", load_rules().names)
+    countries = load_countries()
+    country = st.selectbox("Country", list(countries.keys()), index=0)
+    city = st.selectbox("City", countries[country], index=0)
+    catalogue = load_catalogue()
+    pill(catalogue.heading(field))
+
+    if field == "Technology":
+        live = event_feeds()["devpost"]
+        if live["items"]:
+            st.success("Loaded upcoming Devpost hackathons (beta).")
+            freshness_note(live)
+            live_events("devpost", live, field, country, city)
+            return
+        st.warning("Couldn’t fetch Devpost (network/API). Showing curated list.")
+
+    elif field == "Sports":
+        leagues = event_feeds()["sports"]
+        catalogue.sync_leagues(leagues["fetched_at"], leagues["items"])
+        trials = catalogue.find("event", field=field, country=country, source="sports")
+        if trials:
+            st.success("Loaded federation/league calendars (sample).")
+            freshness_note(leagues)
+            live_events(f"sports:{country}", dict(leagues, items=trials), field, country, city, country=country)
+            return
+        st.warning("Couldn’t fetch sports events live. Showing curated city list.")
+
+    curated = catalogue.find("event", field=field, country=country, city=city, source="curated")
+    st.dataframe(pd.DataFrame(curated), use_container_width=True)
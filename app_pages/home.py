@@ -0,0 +1,161 @@
+# home.py — 🏠 Home + Resume Analyzer (upload, preview, gap analysis)
+import os
+import time
+
+import streamlit as st
+
+from ocr import OCR_WORKERS
+from resume_analysis import FIELDS, MAX_UPLOAD_BYTES, UploadTooLarge, read_upload
+from resume_cache import ResumeCache
+from pipeline import AnalysisPipeline
+from app_pages.common import cache_subdir, section_title, course_search_links
+
+# Characters of resume text shown in the preview box (and extracted before first paint).
+PREVIEW_CHARS = 4000
+
+
+@st.cache_resource(show_spinner=False)
+def get_resume_cache() -> ResumeCache:
+    """
+    Process-wide parsed-resume cache shared by all sessions and reruns.
+    GAP_MAPPER_PDF_WORKERS > 1 extracts large PDFs in parallel processes;
+    scanned pages are OCR'd by GAP_MAPPER_OCR_WORKERS Tesseract processes (if installed).
+    """
+    pdf_workers = int(os.environ.get("GAP_MAPPER_PDF_WORKERS", "1"))
+    return ResumeCache(disk_dir=cache_subdir("resumes"), pdf_workers=pdf_workers, ocr_workers=OCR_WORKERS)
+
+
+def ocr_progress(resume_cache: ResumeCache, digest: str, bar=None):
+    """Show (or update) a progress bar while the background parse OCRs scanned pages."""
+    progress = resume_cache.progress(digest)
+    if progress:
+        done, total = progress
+        bar = bar or st.progress(0.0)
+        bar.progress(done / max(total, 1), text=f"Reading scanned pages (OCR): {done}/{total}")
+    return bar
+
+
+def wait_for_text(resume_cache: ResumeCache, digest: str, data: bytes, name: str):
+    """Join the background full parse, keeping the OCR progress bar current meanwhile."""
+    bar = None
+    with st.spinner("Finishing text extraction…"):
+        while not resume_cache.ready(digest):
+            bar = ocr_progress(resume_cache, digest, bar)
+            time.sleep(0.25)
+        if bar:
+            bar.empty()
+        return resume_cache.resume_text(data, name)
+
+
+def scanned_pages_note(resume_cache: ResumeCache, digest: str) -> None:
+    """Warn when image-only pages could not be read, since the score then misses their content."""
+    report = resume_cache.page_report(digest)
+    missing = report["image_pages"] - report["ocr_pages"] if report else 0
+    if missing <= 0:
+        return
+    if resume_cache.ocr is None:
+        st.warning(f"{missing} page(s) look scanned and have no text layer, so they were skipped — "
+                   "install Tesseract OCR on the server, or upload a text-based PDF, for a complete analysis.")
+    else:
+        st.warning(f"OCR could not read {missing} scanned page(s); the analysis below may miss their content.")
+
+
+def get_pipeline() -> AnalysisPipeline:
+    """This session's memoized analysis stages (over the shared resume cache)."""
+    if "pipeline" not in st.session_state:
+        st.session_state["pipeline"] = AnalysisPipeline(get_resume_cache(), links=course_search_links)
+    return st.session_state["pipeline"]
+
+
+def render():
+    st.title("🧭 Career Gap Mapper")
+    st.subheader("Upload your resume and we’ll map your gaps with field-aware suggestions.")
+
+    c1, c2 = st.columns([2, 1])
+    with c1:
+        field = st.selectbox("Your field", FIELDS)
+
+        resume_file = st.file_uploader(
+            "Upload Resume (PDF/DOCX/TXT)", 
+            type=["pdf", "docx", "txt"]
+        )
+
+        resume_cache = get_resume_cache()
+        data = b""
+        if resume_file:
+            try:
+                data = read_upload(resume_file)
+            except UploadTooLarge:
+                st.error(f"{resume_file.name} is larger than {MAX_UPLOAD_BYTES // (1024 * 1024)} MB — "
+                         "please upload a shorter resume.")
+                resume_file = None
+        digest, raw_text, complete = (
+            resume_cache.resume_preview(data, resume_file.name, PREVIEW_CHARS)
+            if resume_file else (None, "", True)
+        )
+        if resume_file:
+            st.success(f"Parsed: {resume_file.name}")
+            st.text_area("Extracted Text (preview)", raw_text[:PREVIEW_CHARS], height=180)
+            if not complete:
+                st.caption("Showing the first pages — the rest is still being extracted in the background.")
+                ocr_progress(resume_cache, digest)
+
+        # Once analyzed, the results follow the field selectbox without another click;
+        # only the field-dependent stages rerun (see pipeline.AnalysisPipeline).
+        analyzed = st.session_state.get("analyzed_digest")
+        if st.button("Analyze Resume", type="primary"):
+            if not resume_file:     # a scanned one-page PDF previews as empty text
+                st.warning("Please upload a resume first.")
+            else:
+                if not complete:
+                    digest, raw_text = wait_for_text(resume_cache, digest, data, resume_file.name)
+                    complete = True
+                analyzed = st.session_state["analyzed_digest"] = digest
+        elif analyzed and analyzed != digest:
+            analyzed = None
+
+        if analyzed:
+            if not complete:
+                digest, raw_text = resume_cache.resume_text(data, resume_file.name)
+            pipe = get_pipeline()
+            result = pipe.gaps(digest, raw_text, field)
+            # kept for the Courses page, which ranks indexed jobs against this resume
+            st.session_state["resume_match_text"] = pipe.match_text(digest, raw_text)
+            # and for the Tips Bot, which answers with this resume's gaps in mind
+            prof = pipe.profile(digest, raw_text)
+            st.session_state["resume_context"] = {"field": field, "profile": {
+                k: prof[k] for k in ("skills", "has_projects", "has_internship", "has_certifications")}}
+
+            scanned_pages_note(resume_cache, digest)
+            st.success(f"Overall Readiness Score: {result['score']}/100")
+            if result["flags"]:
+                section_title("Key Gaps", "🚩")
+                for f in result["flags"]:
+                    st.markdown(f"- {f}")
+
+            section_title("Recommendations", "🛠️")
+            for r in result["recommendations"]:
+                st.markdown(f"- {r}")
+
+            # Field-aware quick links
+            section_title("Next Steps", "➡️")
+            links = pipe.next_steps(field)
+
+            cols = st.columns(4)
+            for i, (name, url) in enumerate(links.items()):
+                with cols[i % 4]:
+                    st.markdown(f"[{name}]({url})")
+
+            with st.expander("Compare across all fields"):
+                rows = pipe.compare(digest, raw_text)
+                st.dataframe([{"Field": r["field"], "Score": r["score"], "Gaps": r["gaps"],
+                               "Key gaps": "; ".join(r["flags"])} for r in rows],
+                             use_container_width=True, hide_index=True)
+                st.caption("Every field scored from the same extracted profile.")
+
+    with c2:
+        st.markdown("### Why use Career Gap Mapper?")
+        st.write("- Field-aware gap analysis")
+        st.write("- Live internships & events (where possible)")
+        st.write("- Curated plans + course links")
+        st.write("- Works for tech, business, medical, sports, arts & more")
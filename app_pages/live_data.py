@@ -0,0 +1,112 @@
+# live_data.py — Process-wide live-feed caches and the local job index (Events + Courses pages)
+import os
+import tempfile
+from typing import Dict, Any, Tuple, Callable
+
+import streamlit as st
+import pandas as pd
+
+from opportunity_cache import OpportunityCache, format_age
+from cache_backend import CacheBackend, make_backend
+from job_store import JobStore
+from job_matching import JobMatcher
+from opportunity_store import OpportunityStore
+from circuit_breaker import breaker_stats
+from app_pages.common import cache_subdir
+
+JOBS_PER_PAGE = 20
+ROWS_PER_PAGE = 20
+
+
+@st.cache_resource(show_spinner=False)
+def get_cache_backend() -> CacheBackend:
+    """
+    Backend for feed snapshots and fetch leases. GAP_MAPPER_CACHE_BACKEND picks it
+    ("memory" or "sqlite:/shared/path.sqlite"); by default a SQLite file under the
+    cache dir, so replicas sharing that directory share snapshots and fetches.
+    """
+    return make_backend(cache_dir=cache_subdir(""))
+
+@st.cache_resource(show_spinner=False)
+def get_job_store() -> JobStore:
+    """Local FTS index of the full Remotive feed, re-ingested in the background every 6 h."""
+    return JobStore(os.path.join(cache_subdir("") or tempfile.gettempdir(), "jobs.sqlite"),
+                    leases=get_cache_backend())
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_job_matcher(ingested_at: float):
+    """Hashed TF-IDF vectors for every indexed posting; rebuilt only when the store is re-ingested."""
+    jobs, texts = get_job_store().documents()
+    return jobs, JobMatcher().fit(texts)
+
+@st.cache_resource(show_spinner=False)
+def get_opportunity_cache() -> OpportunityCache:
+    """
+    Last-good snapshots of the live feeds (30 min TTL), kept in the shared cache backend.
+    Expired snapshots are served immediately and refreshed in the background; failures
+    keep serving the old data.
+    """
+    return OpportunityCache(get_cache_backend(), ttl=1800)
+
+@st.cache_resource(show_spinner=False)
+def get_opportunity_store() -> OpportunityStore:
+    """Process-wide columnar copy of the live event feeds, reloaded from Parquet on restart."""
+    return OpportunityStore(os.path.join(cache_subdir("") or tempfile.gettempdir(), "opportunities.parquet"))
+
+def fetch_remotive_jobs(query: str, location: str) -> Dict[str, Any]:
+    """Remotive jobs/internships snapshot; empty items means show curated roles."""
+    return get_opportunity_cache().get("remotive", query=query, location=location)
+
+def event_feeds() -> Dict[str, Dict[str, Any]]:
+    """
+    Devpost hackathons and TheSportsDB leagues; on a cold cache both are fetched
+    concurrently (one wait, not two), so switching field never adds a round-trip.
+    The league list is country-independent, so changing country never refetches it.
+    """
+    return get_opportunity_cache().get_many({"devpost": {}, "sports": {}})
+
+def freshness_note(snap: Dict[str, Any]):
+    """Caption with the snapshot's age, flagging data kept after a failed refresh."""
+    if snap["age"] is None:
+        return
+    age = format_age(snap["age"])
+    if snap["error"]:
+        st.caption(f"⚠️ Live source unavailable — showing data fetched {age}.")
+    elif snap["status"] == "stale":
+        st.caption(f"Data fetched {age} — refreshing in the background.")
+    else:
+        st.caption(f"Updated {age}.")
+
+def live_data_status():
+    """Sidebar expander with per-source cache counters, fetch latency and circuit breaker state."""
+    source_stats = get_opportunity_cache().stats()
+    for source, b in breaker_stats().items():
+        if source in source_stats:
+            source_stats[source].update(breaker=b["state"], retry_in_s=b["retry_in_s"])
+    if source_stats:
+        with st.sidebar.expander("Live data status"):
+            st.dataframe(pd.DataFrame(source_stats).T, use_container_width=True)
+
+def paged_table(key: str, query: Callable[[str, bool, int, int], Tuple[Any, int]],
+                sort_options: Dict[str, str], per_page: int = ROWS_PER_PAGE) -> int:
+    """
+    Sort selector, page number and one page of rows around a server-side
+    query(sort, descending, limit, offset) -> (rows, total); only that page is sent
+    to the browser. sort_options maps labels to sort keys. Returns the total.
+    """
+    c1, c2, c3 = st.columns([2, 1, 1])
+    with c1:
+        label = st.selectbox("Sort by", list(sort_options), key=f"{key}_sort")
+    with c2:
+        descending = st.toggle("Descending", key=f"{key}_desc")
+    page_no = st.session_state.get(f"{key}_page", 1)
+    rows, total = query(sort_options[label], descending, per_page, (page_no - 1) * per_page)
+    n_pages = max(1, -(-total // per_page))
+    if page_no > n_pages:
+        # the filters shrank the result set; go back to the first page
+        st.session_state[f"{key}_page"] = page_no = 1
+        rows, total = query(sort_options[label], descending, per_page, 0)
+    with c3:
+        st.number_input("Page", min_value=1, max_value=n_pages, key=f"{key}_page")
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+    return total
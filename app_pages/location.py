@@ -0,0 +1,31 @@
+# location.py — 🌍 Location Selector
+import streamlit as st
+
+from field_rules import load_rules
+from app_pages.common import load_countries, section_title
+
+
+def render():
+    st.title("🌍 Choose your Location & Field")
+    countries = load_countries()
+    field = st.selectbox("Field", load_rules().names)
+    country = st.selectbox("Country", list(countries.keys()))
+    city = st.selectbox("City", countries[country])
+    # widget values are dropped when the page is left; this copy feeds the Tips Bot
+    st.session_state["location"] = {"field": field, "country": country, "city": city}
+
+    st.info(f"Selected: **{city}, {country}** — Field: **{field}**")
+
+    # Show something meaningful immediately
+    if load_rules().rule(field).internships:
+        section_title(f"Top Picks in {city}", "💼")
+        st.write("- Leading employers, internship hotspots, and meetups in your city.")
+        st.write("- Try the **Events & Competitions** and **Courses & Internships** pages for live data.")
+    elif field == "Sports":
+        section_title(f"Sports High-Performance Centers in/near {city}", "🥇")
+        st.write("- Check national/state associations & stadium academies.")
+        st.write("- Visit **Events & Competitions** for live trials and tournaments.")
+    else:
+        section_title(f"Creative & Cultural Hubs in {city}", "🎨")
+        st.write("- Community centers, art schools, local theaters.")
+        st.write("- Explore **Events & Competitions** for exhibitions & fests.")
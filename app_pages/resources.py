@@ -0,0 +1,10 @@
+# resources.py — 📚 Resources
+import streamlit as st
+
+
+def render():
+    st.title("📚 Resources")
+    st.write("- Resume templates: Google Docs, Overleaf CV, CANVA")
+    st.write("- Portfolio hosting: GitHub Pages, Notion, Behance")
+    st.write("- Practice: LeetCode / HackerRank (tech), CaseCoach (business), SAI Calendar (sports)")
+    st.write("- Networking: LinkedIn – alumni search, local meetups")
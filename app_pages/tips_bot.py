@@ -0,0 +1,67 @@
+# tips_bot.py — 🤖 Career Tips Bot (BM25 retrieval over data/tips.json, see tips_index.py)
+from collections import deque
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+from tips_index import TipsIndex, load_index
+from app_pages.common import cache_subdir
+
+# Messages kept per session (oldest evicted first), messages drawn per rerun, characters per question.
+CHAT_HISTORY = 60
+CHAT_VISIBLE = 20
+CHAT_MAX_CHARS = 1000
+# Tips quoted per answer.
+ANSWER_TIPS = 3
+GREETING = {"role": "assistant", "content": "Hi! Ask me about resumes, courses, internships, or events."}
+FALLBACK = ("Great question! Tailor your resume to the field, fill missing skills with short "
+            "projects/certifications, and keep applying weekly.")
+
+
+@st.cache_resource(show_spinner=False)
+def get_tips_index() -> TipsIndex:
+    """
+    Process-wide tips index, memory-mapped from the offline build under GAP_MAPPER_CACHE_DIR
+    (`python tips_index.py build`); built there on first use if missing or stale.
+    """
+    return load_index(directory=cache_subdir("tips_index"))
+
+
+def bot_reply(msg: str, field: Optional[str] = None, city: Optional[str] = None,
+              profile: Optional[Dict[str, Any]] = None) -> str:
+    """Top-ranked tips for the question, leaning towards the user's field, resume gaps and city."""
+    hits = get_tips_index().search(msg, field=field, city=city, profile=profile, k=ANSWER_TIPS)
+    if not hits:
+        return FALLBACK
+    return "\n".join(f"- {h['text']}" for h in hits)
+
+def render():
+    st.title("🤖 Career Tips Bot")
+    st.write("Ask about gaps, resumes, interviews, or city-specific ideas.")
+
+    # context from the Home analysis and the Location page, when the user has been there
+    resume = st.session_state.get("resume_context") or {}
+    location = st.session_state.get("location") or {}
+    field = resume.get("field") or location.get("field")
+    city = location.get("city")
+    basis = [f"your {field} resume" if resume else field, city]
+    if any(basis):
+        st.caption("Answers take into account " + " and ".join(b for b in basis if b) + ".")
+
+    if "chat" not in st.session_state:
+        st.session_state.chat = deque([GREETING], maxlen=CHAT_HISTORY)
+    chat = st.session_state.chat
+
+    if len(chat) > CHAT_VISIBLE:
+        st.caption(f"Showing the last {CHAT_VISIBLE} of {len(chat)} messages.")
+    for m in list(chat)[-CHAT_VISIBLE:]:
+        with st.chat_message(m["role"]):
+            st.write(m["content"])
+
+    user_msg = st.chat_input("Type your question…", max_chars=CHAT_MAX_CHARS)
+    if user_msg:
+        chat.append({"role":"user", "content": user_msg})
+        ans = bot_reply(user_msg, field=field, city=city, profile=resume.get("profile"))
+        chat.append({"role":"assistant", "content": ans})
+        with st.chat_message("user"): st.write(user_msg)
+        with st.chat_message("assistant"): st.write(ans)
@@ -0,0 +1,213 @@
+# batch_analyze.py — Headless batch resume analysis over a process pool
+#
+#   python batch_analyze.py resumes/ -o results.csv --field Technology
+#   python batch_analyze.py intake.zip -o results.parquet --workers 8
+import os
+import sys
+import csv
+import time
+import tarfile
+import zipfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterator, Tuple, Optional, Union
+
+from resume_analysis import (FIELDS, MAX_UPLOAD_BYTES, NamedBytesIO, UploadTooLarge,
+                             parse_resume, extract_profile, analyze_gaps, load_term_index)
+from resume_cache import ResumeCache
+from ocr import OCR_WORKERS, default_queue
+
+RESUME_EXTS = (".pdf", ".docx", ".txt")
+RESULT_COLUMNS = ["file", "field", "score", "flags", "skills", "exp_years", "error", "seconds"]
+
+# Archives are cut off past this many resume members or decompressed bytes (zip bombs);
+# GAP_MAPPER_MAX_ARCHIVE_MEMBERS (default 5000) and GAP_MAPPER_MAX_ARCHIVE_MB (default 512).
+MAX_ARCHIVE_MEMBERS = int(os.environ.get("GAP_MAPPER_MAX_ARCHIVE_MEMBERS", "5000"))
+MAX_ARCHIVE_BYTES = int(float(os.environ.get("GAP_MAPPER_MAX_ARCHIVE_MB", "512")) * 1024 * 1024)
+
+# A job is (display name, source) where source is a filesystem path or raw bytes, or the
+# UploadTooLarge an oversized archive member was refused with (reported in its row).
+Job = Tuple[str, Union[str, bytes, UploadTooLarge]]
+
+
+class ArchiveTooLarge(ValueError):
+    """An archive has more than MAX_ARCHIVE_MEMBERS resumes or MAX_ARCHIVE_BYTES of them."""
+
+_worker_caches: Dict[str, ResumeCache] = {}
+
+# ----------------------------- Input Discovery ----------------------------- #
+def _is_resume(name: str) -> bool:
+    return name.lower().endswith(RESUME_EXTS) and not os.path.basename(name).startswith(".")
+
+def _member_job(name: str, declared: int, open_member, budget: Dict[str, int]) -> Job:
+    """
+    Read one archive member, refusing it from its declared size before decompressing and
+    reading at most MAX_UPLOAD_BYTES + 1 bytes (headers can understate the real size).
+    """
+    budget["members"] += 1
+    if budget["members"] > MAX_ARCHIVE_MEMBERS:
+        raise ArchiveTooLarge(f"More than {MAX_ARCHIVE_MEMBERS} resumes in one archive")
+    if declared > MAX_UPLOAD_BYTES:
+        return name, UploadTooLarge(f"{declared} bytes; the limit is {MAX_UPLOAD_BYTES}")
+    with open_member() as f:
+        data = f.read(MAX_UPLOAD_BYTES + 1)
+    budget["bytes"] += len(data)
+    if budget["bytes"] > MAX_ARCHIVE_BYTES:
+        raise ArchiveTooLarge(f"Archive expands past {MAX_ARCHIVE_BYTES} bytes of resumes")
+    return name, data
+
+def iter_jobs(source: str) -> Iterator[Job]:
+    """
+    Yield resume jobs from a directory (recursive), a .zip/.tar(.gz) archive or a single file.
+    Directory entries are passed as paths so workers read them; archive members as bytes,
+    each capped at MAX_UPLOAD_BYTES and all together at MAX_ARCHIVE_MEMBERS / MAX_ARCHIVE_BYTES
+    (ArchiveTooLarge stops the iteration).
+    """
+    budget = {"members": 0, "bytes": 0}
+    if os.path.isdir(source):
+        for root, _dirs, files in os.walk(source):
+            for fname in sorted(files):
+                path = os.path.join(root, fname)
+                if _is_resume(path):
+                    yield os.path.relpath(path, source), path
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            for info in zf.infolist():
+                if not info.is_dir() and _is_resume(info.filename):
+                    yield _member_job(info.filename, info.file_size, lambda: zf.open(info), budget)
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as tf:
+            for member in tf:
+                if member.isfile() and _is_resume(member.name):
+                    yield _member_job(member.name, member.size, lambda: tf.extractfile(member), budget)
+    elif _is_resume(source):
+        yield os.path.basename(source), source
+    else:
+        raise ValueError(f"Not a directory, archive or resume file: {source}")
+
+# ----------------------------- Worker ----------------------------- #
+def _worker_cache(cache_dir: str) -> ResumeCache:
+    """One cache per worker process; the disk tier is shared between workers and runs."""
+    if cache_dir not in _worker_caches:
+        _worker_caches[cache_dir] = ResumeCache(disk_dir=cache_dir, ocr_workers=OCR_WORKERS)
+    return _worker_caches[cache_dir]
+
+def profile_one(data: bytes, name: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    parse_resume -> extract_profile for one resume's bytes (the CPU-heavy part).
+    With `cache_dir`, resumes already seen (same bytes) skip parsing and extraction.
+    Scanned PDF pages are OCR'd when Tesseract is available (see ocr.py).
+    """
+    if cache_dir:
+        cache = _worker_cache(cache_dir)
+        digest, text = cache.resume_text(data, name)
+        return cache.resume_profile(digest, text)
+    return extract_profile(parse_resume(NamedBytesIO(data, name), ocr_queue=default_queue()))
+
+def analyze_one(job: Job, field: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run parse_resume -> extract_profile -> analyze_gaps for one resume and flatten to a row.
+    Errors are reported in the row instead of aborting the batch.
+    """
+    name, src = job
+    t0 = time.perf_counter()
+    row = {"file": name, "field": field, "score": None, "flags": "", "skills": "",
+           "exp_years": None, "error": ""}
+    try:
+        if isinstance(src, UploadTooLarge):
+            raise src
+        size = len(src) if isinstance(src, bytes) else os.path.getsize(src)
+        if size > MAX_UPLOAD_BYTES:
+            raise UploadTooLarge(f"{size} bytes; the limit is {MAX_UPLOAD_BYTES}")
+        if isinstance(src, bytes):
+            data = src
+        else:
+            with open(src, "rb") as f:
+                data = f.read()
+        prof = profile_one(data, name, cache_dir)
+        result = analyze_gaps(prof, field)
+        row.update({
+            "score": result["score"],
+            "flags": "; ".join(result["flags"]),
+            "skills": ", ".join(prof["skills"]),
+            "exp_years": prof["exp_years"],
+        })
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["seconds"] = round(time.perf_counter() - t0, 4)
+    return row
+
+def _analyze_star(args: Tuple[Job, str, Optional[str]]) -> Dict[str, Any]:
+    return analyze_one(*args)
+
+# ----------------------------- Engine ----------------------------- #
+def analyze_batch(source: str, field: str = "Technology", workers: Optional[int] = None,
+                  chunksize: int = 4, cache_dir: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Analyze every resume under `source` and yield one result row per resume, in input order.
+    workers=1 runs in-process (handy for debugging); otherwise a process pool uses all cores.
+    The skill index is built here, before the pool starts, so forked workers share it; under
+    spawn each worker builds it once at startup rather than on its first resume.
+    """
+    if field not in FIELDS:
+        raise ValueError(f"Unknown field {field!r}; choose from {', '.join(FIELDS)}")
+    load_term_index()
+    tasks = ((job, field, cache_dir) for job in iter_jobs(source))
+    if workers == 1:
+        yield from map(_analyze_star, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_term_index) as pool:
+        yield from pool.map(_analyze_star, tasks, chunksize=chunksize)
+
+def write_results(rows: List[Dict[str, Any]], out_path: str) -> None:
+    """Write rows to CSV, or Parquet when the path ends in .parquet."""
+    if out_path.lower().endswith(".parquet"):
+        import pandas as pd
+        pd.DataFrame(rows, columns=RESULT_COLUMNS).to_parquet(out_path, index=False)
+        return
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def run(source: str, out_path: str, field: str = "Technology",
+        workers: Optional[int] = None, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Analyze a batch, write the results and return throughput stats."""
+    t0 = time.perf_counter()
+    rows = list(analyze_batch(source, field=field, workers=workers, cache_dir=cache_dir))
+    elapsed = time.perf_counter() - t0
+    write_results(rows, out_path)
+    failed = sum(1 for r in rows if r["error"])
+    return {
+        "resumes": len(rows),
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "resumes_per_sec": round(len(rows) / elapsed, 2) if elapsed > 0 else 0.0,
+        "workers": workers or os.cpu_count(),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Batch resume gap analysis (Career Gap Mapper).")
+    ap.add_argument("source", help="Directory, .zip/.tar archive or single PDF/DOCX/TXT file")
+    ap.add_argument("-o", "--output", default="results.csv", help="Output .csv or .parquet path")
+    ap.add_argument("--field", default="Technology", choices=FIELDS)
+    ap.add_argument("--workers", type=int, default=None, help="Process count (default: all cores)")
+    ap.add_argument("--cache-dir", default=None,
+                    help="Reuse parsed text/profiles across runs (content-hash cache directory)")
+    args = ap.parse_args(argv)
+
+    try:
+        stats = run(args.source, args.output, field=args.field, workers=args.workers,
+                    cache_dir=args.cache_dir)
+    except ArchiveTooLarge as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(
+        f"Analyzed {stats['resumes']} resumes ({stats['failed']} failed) in {stats['seconds']}s "
+        f"— {stats['resumes_per_sec']} resumes/s on {stats['workers']} workers -> {args.output}",
+        file=sys.stderr,
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
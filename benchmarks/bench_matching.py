@@ -0,0 +1,83 @@
+# bench_matching.py — Scaling benchmark for job_matching.JobMatcher
+#
+#   python benchmarks/bench_matching.py                      # quick grid
+#   python benchmarks/bench_matching.py --full               # up to 100k postings x 10k resumes
+#   python benchmarks/bench_matching.py --jobs 50000 --resumes 2000 --out matching.jsonl
+#
+# Prints one JSON object per (postings, resumes) size with fit/encode/match timings.
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from job_matching import JobMatcher, DEFAULT_DIM
+
+SKILLS = ["python", "sql", "excel", "java", "react", "tableau", "power bi", "aws", "docker", "git",
+          "machine learning", "data analysis", "marketing", "sales", "finance", "accounting",
+          "nursing", "clinical", "patient care", "communication", "leadership", "football",
+          "cricket", "athletics", "design", "figma", "branding", "seo", "statistics", "r"]
+FILLER = ["team", "remote", "senior", "junior", "intern", "manager", "analyst", "engineer",
+          "developer", "support", "growth", "product", "health", "operations", "startup", "global"]
+
+QUICK_GRID = [(1_000, 100), (10_000, 100), (10_000, 1_000), (100_000, 1_000)]
+FULL_GRID = QUICK_GRID + [(100_000, 10_000)]
+
+
+def synthetic_texts(n: int, n_skills: int, n_filler: int, rng: random.Random) -> list:
+    return [" ".join(rng.sample(SKILLS, n_skills) + rng.choices(FILLER, k=n_filler)) for _ in range(n)]
+
+def run_case(n_jobs: int, n_resumes: int, k: int, dim: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    jobs = synthetic_texts(n_jobs, 4, 20, rng)
+    resumes = synthetic_texts(n_resumes, 8, 60, rng)
+
+    t0 = time.perf_counter()
+    matcher = JobMatcher(dim=dim).fit(jobs)
+    fit_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    matcher.encode(resumes)
+    encode_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    idx, _scores = matcher.top_k_jobs(resumes, k=k)
+    match_s = time.perf_counter() - t0
+    assert idx.shape == (n_resumes, min(k, n_jobs))
+
+    return {
+        "bench": "job_matching.top_k_jobs",
+        "jobs": n_jobs, "resumes": n_resumes, "k": k, "dim": dim,
+        "fit_s": round(fit_s, 4), "encode_resumes_s": round(encode_s, 4), "match_s": round(match_s, 4),
+        "pairs_per_s": round(n_jobs * n_resumes / match_s) if match_s else None,
+    }
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="JobMatcher scaling benchmark")
+    ap.add_argument("--full", action="store_true", help="include 100k postings x 10k resumes")
+    ap.add_argument("--jobs", type=int, help="single case: number of postings")
+    ap.add_argument("--resumes", type=int, help="single case: number of resumes")
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--dim", type=int, default=DEFAULT_DIM)
+    ap.add_argument("--out", help="append JSON lines to this file as well")
+    args = ap.parse_args(argv)
+
+    grid = [(args.jobs, args.resumes)] if args.jobs and args.resumes else (FULL_GRID if args.full else QUICK_GRID)
+    env = {"python": platform.python_version(), "numpy": np.__version__, "cpus": os.cpu_count()}
+    for n_jobs, n_resumes in grid:
+        result = dict(run_case(n_jobs, n_resumes, args.k, args.dim), **env)
+        line = json.dumps(result)
+        print(line, flush=True)
+        if args.out:
+            with open(args.out, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# bench_pipeline.py — Per-stage latency, peak memory and throughput of the analysis hot path
+#
+#   python benchmarks/bench_pipeline.py                         # pdf/docx/txt x 1/5/20/100 pages
+#   python benchmarks/bench_pipeline.py --pages 1 5 --out new.jsonl
+#   python benchmarks/bench_pipeline.py --compare old.jsonl --threshold 1.2
+#   python benchmarks/bench_pipeline.py --corpus out/           # files from benchmarks/corpus.py
+#
+# One JSON object per (format, pages) case: median seconds for parse_resume,
+# extract_profile and analyze_gaps, tracemalloc peak for parse+extract, and
+# throughput. --compare matches cases by (format, pages) against an earlier
+# results file and exits 1 if any stage got slower than --threshold x
+# (and by more than --min-delta seconds).
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from resume_analysis import NamedBytesIO, parse_resume, extract_profile, analyze_gaps, profile_version
+from corpus import make_resume, WRITERS
+
+STAGES = ("parse_s", "extract_s", "analyze_s")
+
+
+def _median_time(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+def git_version() -> str:
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT,
+                              capture_output=True, text=True, timeout=10).stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+def bench_case(fmt: str, pages: int, data: bytes, repeat: int, field: str) -> dict:
+    name = f"resume.{fmt}"
+    text = parse_resume(NamedBytesIO(data, name))
+    prof = extract_profile(text)
+
+    parse_s = _median_time(lambda: parse_resume(NamedBytesIO(data, name)), repeat)
+    extract_s = _median_time(lambda: extract_profile(text), max(repeat, 5))
+    # analyze_gaps is microseconds; time a loop and report per call
+    loops = 2000
+    analyze_s = _median_time(lambda: [analyze_gaps(prof, field) for _ in range(loops)], 3) / loops
+
+    tracemalloc.start()
+    extract_profile(parse_resume(NamedBytesIO(data, name)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = parse_s + extract_s + analyze_s
+    return {
+        "bench": "pipeline", "format": fmt, "pages": pages, "bytes": len(data), "chars": len(text),
+        "parse_s": round(parse_s, 6), "extract_s": round(extract_s, 6), "analyze_s": round(analyze_s, 8),
+        "total_s": round(total, 6),
+        "peak_mem_mb": round(peak / 2 ** 20, 2),
+        "pages_per_s": round(pages / parse_s, 1) if parse_s else None,
+        "mb_per_s": round(len(data) / 2 ** 20 / parse_s, 2) if parse_s else None,
+        "resumes_per_s": round(1 / total, 2) if total else None,
+        "skills_found": len(prof["skills"]),
+    }
+
+def iter_cases(args):
+    """(format, pages, bytes) from a corpus directory's manifest or generated in memory."""
+    if args.corpus:
+        with open(os.path.join(args.corpus, "manifest.json"), encoding="utf-8") as f:
+            for entry in json.load(f):
+                with open(os.path.join(args.corpus, entry["file"]), "rb") as rf:
+                    yield entry["format"], entry["pages"], rf.read()
+        return
+    for pages in args.pages:
+        for fmt in args.formats:
+            yield fmt, pages, make_resume(fmt, pages, args.seed)
+
+def compare(results: list, baseline_path: str, threshold: float, min_delta: float) -> int:
+    """
+    Print per-stage ratios against a previous results file; 1 if anything regressed.
+    Slowdowns smaller than min_delta seconds are timer noise and never count.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        old = {(r["format"], r["pages"]): r for r in map(json.loads, f) if r.get("bench") == "pipeline"}
+    regressed = 0
+    for r in results:
+        base = old.get((r["format"], r["pages"]))
+        if not base:
+            continue
+        for stage in STAGES:
+            ratio = r[stage] / base[stage] if base[stage] else 1.0
+            slower = ratio > threshold and r[stage] - base[stage] > min_delta
+            mark = "REGRESSION" if slower else ""
+            regressed |= slower
+            print(f"{r['format']:>4} {r['pages']:>3}p {stage:<10} {base[stage]:.6f} -> {r[stage]:.6f}  x{ratio:.2f} {mark}",
+                  file=sys.stderr)
+    return int(regressed)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Resume analysis pipeline benchmark")
+    ap.add_argument("--pages", type=int, nargs="+", default=[1, 5, 20, 100])
+    ap.add_argument("--formats", nargs="+", default=list(WRITERS), choices=list(WRITERS))
+    ap.add_argument("--corpus", help="benchmark files from a corpus.py directory instead")
+    ap.add_argument("--repeat", type=int, default=3, help="timed runs per stage (median reported)")
+    ap.add_argument("--field", default="Technology")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", help="append JSON lines to this file as well")
+    ap.add_argument("--compare", help="earlier results file to compare against")
+    ap.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio counted as a regression")
+    ap.add_argument("--min-delta", type=float, default=0.0005, help="ignore slowdowns below this many seconds")
+    args = ap.parse_args(argv)
+
+    meta = {"version": git_version(), "profile_version": profile_version(),
+            "python": platform.python_version(), "machine": platform.machine(), "cpus": os.cpu_count(),
+            "timestamp": int(time.time())}
+    results = []
+    for fmt, pages, data in iter_cases(args):
+        result = dict(bench_case(fmt, pages, data, args.repeat, args.field), **meta)
+        results.append(result)
+        line = json.dumps(result)
+        print(line, flush=True)
+        if args.out:
+            with open(args.out, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    return compare(results, args.compare, args.threshold, args.min_delta) if args.compare else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+# bench_rules.py — Throughput of the compiled field rules (field_rules.RuleBook)
+#
+#   python benchmarks/bench_rules.py                 # 100k synthetic profiles
+#   python benchmarks/bench_rules.py --profiles 1000000
+#
+# Prints one JSON object with profiles/s for evaluate(), evaluate_all() and score_matrix().
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from field_rules import load_rules
+
+SKILLS = ["python", "sql", "git", "data analysis", "excel", "communication", "leadership", "nursing",
+          "clinical", "football", "cricket", "athletics", "java", "react", "design", "marketing"]
+
+
+def synthetic_profiles(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [{"has_projects": rng.random() < 0.6, "has_internship": rng.random() < 0.4,
+             "has_certifications": rng.random() < 0.5, "skills": rng.sample(SKILLS, rng.randint(0, 6))}
+            for _ in range(n)]
+
+def rate(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return round(n / (time.perf_counter() - t0))
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Field rule engine throughput")
+    ap.add_argument("--profiles", type=int, default=100_000)
+    args = ap.parse_args(argv)
+
+    rules = load_rules()
+    profiles = synthetic_profiles(args.profiles)
+    n = len(profiles)
+    print(json.dumps({
+        "bench": "field_rules", "profiles": n, "fields": len(rules.names),
+        "evaluate_per_s": rate(lambda: [rules.evaluate(p, "Technology") for p in profiles], n),
+        "evaluate_all_per_s": rate(lambda: [rules.evaluate_all(p) for p in profiles], n),
+        "score_matrix_per_s": rate(lambda: rules.score_matrix(profiles), n),
+    }))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# bench_skills.py — Skill index build cost and scan time vs. resume length (skill_index.py)
+#
+#   python benchmarks/bench_skills.py                       # the shipped vocabulary
+#   python benchmarks/bench_skills.py --extra-skills 20000  # plus synthetic terms, to show size independence
+#
+# Prints one JSON object: index build time, terms, and the time (ms) to scan texts
+# of growing length; per-character cost should stay flat whatever the vocabulary size.
+import os
+import sys
+import json
+import time
+import random
+import string
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_analysis import KEYWORD_CATEGORIES, EXP_UNITS, load_skill_vocabulary, load_skill_aliases
+from skill_index import SkillIndex
+
+SAMPLE = """Jane Doe - B.Tech Computer Science, 2021
+Skills: PySpark, Postgres, MS-Excel, Machine Learning, HTML, CSS, JavaScript, Node.js, React.js
+5+ yrs building data pipelines for analytics teams. Led a team of 4 engineers.
+Projects: command-line tool for report automation; github.com/jane. Summer intern at Acme.
+Certified AWS Solutions Architect. Communication skills, public speaking, stakeholder updates.
+"""
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Skill index build and scan cost")
+    ap.add_argument("--extra-skills", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(7)
+    skills = load_skill_vocabulary()
+    skills += ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12))) for _ in range(args.extra_skills)]
+    t0 = time.perf_counter()
+    index = SkillIndex(dict(KEYWORD_CATEGORIES, exp=EXP_UNITS, skill=skills), load_skill_aliases())
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    scan = {}
+    for copies in (1, 10, 100, 1000):
+        text = (SAMPLE * copies).lower()
+        best = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            list(index.scan(text))
+            best = min(best, time.perf_counter() - t0)
+        scan[len(text)] = {"ms": round(best * 1000, 3), "us_per_kchar": round(best * 1e9 / len(text), 2)}
+    print(json.dumps({"bench": "skill_index", "terms": index.size, "build_ms": round(build_ms, 2), "scan": scan}))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# bench_startup.py — Cold-start and per-rerun cost of the Streamlit app, per page
+#
+#   python benchmarks/bench_startup.py                # every page, 10 reruns each
+#   python benchmarks/bench_startup.py --reruns 30 --out startup.jsonl
+#
+# For each page, in a fresh interpreter (so nothing is pre-imported):
+#   import_s   — importing the page module (what the first visit to the page pays)
+#   heavy      — which heavy libraries that import pulled in
+#   first_s    — first full script run opened on that page, via streamlit.testing AppTest
+#   rerun_ms   — median of later reruns (widget interaction cost)
+# Live sources are pointed at a closed local port so numbers never depend on the network.
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app_pages import PAGES
+
+HEAVY = ["pdfplumber", "pandas", "numpy", "requests", "pyarrow"]
+
+IMPORT_PROBE = """
+import sys, time, json
+sys.path.insert(0, {root!r})
+import streamlit
+t0 = time.perf_counter()
+import app_pages.{module}
+took = time.perf_counter() - t0
+print(json.dumps({{"import_s": round(took, 4), "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+RUN_PROBE = """
+import sys, time, json, statistics
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+t0 = time.perf_counter()
+at = AppTest.from_file({script!r}, default_timeout=120)
+at.session_state["page"] = {page!r}
+at.run()
+first = time.perf_counter() - t0
+times = []
+for _ in range({reruns}):
+    t0 = time.perf_counter()
+    at.run()
+    times.append(time.perf_counter() - t0)
+print(json.dumps({{"first_s": round(first, 4), "rerun_ms": round(statistics.median(times) * 1000, 2),
+                  "errors": [e.message[:200] for e in at.exception]}}))
+"""
+
+
+def probe(code: str, env: dict) -> dict:
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=ROOT)
+    if out.returncode:
+        return {"error": out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "failed"}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Streamlit app cold-start / rerun benchmark")
+    ap.add_argument("--reruns", type=int, default=10)
+    ap.add_argument("--out", help="append JSON lines to this file as well")
+    args = ap.parse_args(argv)
+
+    env = dict(os.environ)
+    env.setdefault("GAP_MAPPER_CACHE_DIR", "")
+    for src in ("REMOTIVE", "DEVPOST", "SPORTS"):
+        env.setdefault(f"GAP_MAPPER_{src}_URL", "http://127.0.0.1:9/")
+    script = os.path.join(ROOT, "streamlit_app3.py")
+    meta = {"python": platform.python_version(), "cpus": os.cpu_count()}
+
+    for page, module in PAGES.items():
+        result = {"bench": "startup", "page": module}
+        result.update(probe(IMPORT_PROBE.format(root=ROOT, module=module, heavy=HEAVY), env))
+        result.update(probe(RUN_PROBE.format(root=ROOT, script=script, page=page, reruns=args.reruns), env))
+        line = json.dumps(dict(result, **meta), ensure_ascii=False)
+        print(line, flush=True)
+        if args.out:
+            with open(args.out, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
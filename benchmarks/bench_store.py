@@ -0,0 +1,63 @@
+# bench_store.py — Query latency of the columnar opportunity store (opportunity_store.OpportunityStore)
+#
+#   python benchmarks/bench_store.py                 # 100k synthetic events
+#   python benchmarks/bench_store.py --rows 1000000
+#
+# Prints one JSON object with load time and filter + sort + page latency (ms).
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import datetime as dt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from opportunity_store import OpportunityStore
+
+CITIES = ["Delhi", "Mumbai", "London", "Austin", "Online", "Varies"]
+FIELDS = ["Technology", "Sports", "Business", "Medical", "Arts"]
+
+
+def synthetic_items(n: int, rng: random.Random) -> list:
+    today = dt.date.today()
+    return [{"name": f"Event {i}", "org": f"Org {i % 97}", "city": rng.choice(CITIES),
+             "start": (today + dt.timedelta(days=rng.randint(-90, 365))).isoformat()}
+            for i in range(n)]
+
+def ms(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1000, 3)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Opportunity store query latency")
+    ap.add_argument("--rows", type=int, default=100_000)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(7)
+    store = OpportunityStore()
+    per_partition = max(1, args.rows // (len(FIELDS) * 3))
+    t0 = time.perf_counter()
+    for field in FIELDS:
+        for country in ("India", "USA", "UK"):
+            store.replace(f"synthetic:{field}:{country}", synthetic_items(per_partition, rng),
+                          field=field, country=country)
+    load_s = time.perf_counter() - t0
+    today = dt.date.today()
+    print(json.dumps({
+        "bench": "opportunity_store", "rows": store.count(), "load_s": round(load_s, 3),
+        "page_ms": ms(lambda: store.query(field="Technology", limit=20)),
+        "filter_page_ms": ms(lambda: store.query(field="Technology", country="India", city="Delhi",
+                                                 since=today, limit=20, offset=40)),
+        "filter_sort_page_ms": ms(lambda: store.query(field="Technology", country="India", city="Delhi",
+                                                      since=today, sort="start", limit=20, offset=40)),
+    }))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
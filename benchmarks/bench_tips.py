@@ -0,0 +1,71 @@
+# bench_tips.py — Build, load and query latency of the Tips Bot index (tips_index.py)
+#
+#   python benchmarks/bench_tips.py                  # data/tips.json padded to 10k synthetic tips
+#   python benchmarks/bench_tips.py --tips 100000
+#
+# Prints one JSON object: offline build time, index size on disk, cold load time
+# (manifest + memory-mapped arrays) and per-question search latency (ms).
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tips_index import TipsIndex, build_index, read_tips, TIPS_FILE
+
+QUESTIONS = ["how do I find an internship", "resume tips for data roles", "hackathons near me",
+             "which certification should I get", "interview preparation", "what should I do next"]
+PROFILE = {"skills": ["python"], "has_projects": False, "has_internship": True, "has_certifications": False}
+
+
+def synthetic_tips(n: int, rng: random.Random) -> list:
+    """The real tips plus variants recombined from their words, so term statistics stay realistic."""
+    base = read_tips(TIPS_FILE)
+    words = [w for tip in base for w in tip["text"].split()]
+    out = list(base)
+    while len(out) < n:
+        tip = rng.choice(base)
+        out.append(dict(tip, text=" ".join(rng.choice(words) for _ in range(rng.randint(10, 30)))))
+    return out
+
+def ms(fn, repeat: int = 20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1000, 3)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Tips index build / load / search latency")
+    ap.add_argument("--tips", type=int, default=10_000)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "tips.jsonl")
+        with open(source, "w", encoding="utf-8") as f:
+            for tip in synthetic_tips(args.tips, rng):
+                f.write(json.dumps(tip) + "\n")
+        t0 = time.perf_counter()
+        path = build_index(source, os.path.join(tmp, "index"))
+        build_s = time.perf_counter() - t0
+        size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+        t0 = time.perf_counter()
+        index = TipsIndex.open(path)
+        load_ms = (time.perf_counter() - t0) * 1000
+        print(json.dumps({
+            "bench": "tips_index", "tips": index.docs, "terms": index.n_terms,
+            "build_s": round(build_s, 3), "index_mb": round(size / 2 ** 20, 2), "load_ms": round(load_ms, 2),
+            "search_ms": {q: ms(lambda: index.search(q, k=3)) for q in QUESTIONS},
+            "search_profile_ms": ms(lambda: index.search(QUESTIONS[0], field="Technology", city="Pune",
+                                                         profile=PROFILE, k=3)),
+        }))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+# cache_backend.py — Pluggable key/value cache shared by sessions, processes and replicas
+#
+#   backend = make_backend("sqlite:/shared/cache.sqlite")   # or "memory"
+#   value = backend.get_or_set("feed:devpost", fetch, ttl=1800)
+#   backend.single_flight("fetch:devpost", refresh, done=lambda: fresh())
+#
+# MemoryBackend keeps values in this process only. SQLiteBackend stores JSON in
+# one SQLite file (WAL mode), so every process or replica that mounts the same
+# path shares the values and the fetch leases. single_flight() / get_or_set()
+# coalesce concurrent misses: only the holder of the key's lease runs the
+# computation, the others wait for its result instead of calling upstream
+# themselves. The same acquire()/release() leases let a caller skip a background
+# refresh that another replica is already doing.
+import os
+import json
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_LEASE = 30.0
+POLL_SECONDS = 0.05
+
+
+class CacheBackend(ABC):
+    """Interface: get/set/delete plus per-key leases, on which single_flight()/get_or_set() are built."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def acquire(self, key: str, lease: float = DEFAULT_LEASE) -> bool:
+        """Take the key's lease unless someone holds an unexpired one; True if taken."""
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Drop the key's lease if this caller holds it."""
+
+    def wait(self, key: str, timeout: float) -> None:
+        """Block up to `timeout` seconds for the key's lease holder to finish (polling by default)."""
+        time.sleep(min(POLL_SECONDS, timeout))
+
+    def single_flight(self, key: str, compute: Callable[[], Any], done: Callable[[], bool],
+                      lease: float = DEFAULT_LEASE) -> bool:
+        """
+        Run compute() unless another holder of the key's lease is already doing the
+        same work, in which case wait until done() (its result has landed) instead.
+        If the holder dies or overruns its lease, the next waiter takes over.
+        Returns True if this caller ran compute().
+        """
+        while True:
+            if self.acquire(key, lease):
+                try:
+                    if not done():
+                        compute()
+                        return True
+                    return False
+                finally:
+                    self.release(key)
+            self.wait(key, lease)
+            if done():
+                return False
+
+    def get_or_set(self, key: str, compute: Callable[[], Any], ttl: Optional[float] = None,
+                   lease: float = DEFAULT_LEASE) -> Any:
+        """Cached value, else compute() it once across all concurrent callers (and replicas)."""
+        value = self.get(key)
+        if value is None:
+            self.single_flight(f"lease:{key}", lambda: self.set(key, compute(), ttl),
+                               lambda: self.get(key) is not None, lease)
+            value = self.get(key)
+        return value
+
+
+class MemoryBackend(CacheBackend):
+    """Process-local dict with expiry; waiters are woken as soon as the lease holder finishes."""
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._leases: Dict[str, Tuple[float, int]] = {}    # key -> (expires, owner thread)
+        self._cond = threading.Condition()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._cond:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            if item[1] is not None and item[1] < time.time():
+                del self._values[key]
+                return None
+            return item[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._cond:
+            self._values[key] = (value, time.time() + ttl if ttl else None)
+
+    def delete(self, key: str) -> None:
+        with self._cond:
+            self._values.pop(key, None)
+
+    def acquire(self, key: str, lease: float = DEFAULT_LEASE) -> bool:
+        with self._cond:
+            if self._leases.get(key, (0, 0))[0] > time.time():
+                return False
+            self._leases[key] = (time.time() + lease, threading.get_ident())
+            return True
+
+    def release(self, key: str) -> None:
+        """Drop the lease if this thread still holds it (not one taken over after it expired)."""
+        with self._cond:
+            if self._leases.get(key, (0, 0))[1] == threading.get_ident():
+                del self._leases[key]
+            self._cond.notify_all()
+
+    def wait(self, key: str, timeout: float) -> None:
+        with self._cond:
+            remaining = self._leases.get(key, (0, 0))[0] - time.time()
+            if remaining > 0:
+                self._cond.wait(min(remaining, timeout))
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    JSON values and leases in one SQLite file (WAL mode, set once). Each thread keeps
+    its own connection, so one instance is safe across threads without opening a
+    connection (and a file descriptor) per call.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires REAL);
+    CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT, expires REAL);
+    """
+
+    def __init__(self, path: str, prune_every: int = 500):
+        self.path = path
+        self.owner = f"{os.getpid()}:{id(self)}"
+        self.prune_every = prune_every
+        self._writes = 0
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")   # stored in the file, so once is enough
+        with conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection; `with conn:` commits (or rolls back) but leaves it open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires = time.time() + ttl if ttl else None
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, json.dumps(value), expires))
+            self._writes += 1
+            if self._writes % self.prune_every == 0:
+                conn.execute("DELETE FROM cache WHERE expires IS NOT NULL AND expires < ?", (time.time(),))
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def acquire(self, key: str, lease: float = DEFAULT_LEASE) -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND expires < ?", (key, now))
+            cur = conn.execute("INSERT OR IGNORE INTO leases VALUES (?, ?, ?)", (key, self._owner(), now + lease))
+            return cur.rowcount == 1
+
+    def release(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, self._owner()))
+
+    def _owner(self) -> str:
+        """Lease owner: this instance and thread, as in MemoryBackend."""
+        return f"{self.owner}:{threading.get_ident()}"
+
+
+def make_backend(spec: Optional[str] = None, cache_dir: Optional[str] = None) -> CacheBackend:
+    """
+    "memory" -> MemoryBackend; "sqlite:/path/cache.sqlite" -> SQLiteBackend ("sqlite" alone
+    means <cache_dir>/shared.sqlite). Without a spec, GAP_MAPPER_CACHE_BACKEND decides,
+    else SQLite when there is a cache dir and memory when there is none.
+    """
+    spec = spec or os.environ.get("GAP_MAPPER_CACHE_BACKEND") or ("sqlite" if cache_dir else "memory")
+    kind, _, path = spec.partition(":")
+    if kind == "memory":
+        return MemoryBackend()
+    if kind == "sqlite" and (path or cache_dir):
+        return SQLiteBackend(path or os.path.join(cache_dir, "shared.sqlite"))
+    raise ValueError(f"Unknown cache backend {spec!r} (use 'memory' or 'sqlite:/path/cache.sqlite')")
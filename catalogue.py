@@ -0,0 +1,220 @@
+# catalogue.py — Indexed catalogue of events, courses, programs and fallback jobs (data/catalogue.json)
+#
+#   cat = load_catalogue()
+#   cat.find("event", field="Business", country="India", city="Pune")         # curated + merged live rows
+#   cat.find("event", field="Sports", sport="Cricket", since=date(2026, 1, 1))
+#   cat.sync_leagues(fetched_at, leagues)        # TheSportsDB leagues -> per-country trial events
+#
+# Every entry is filed under (dimension, value) keys for kind, field, country,
+# city, sport, source and each month its dates cover; an entry without a value
+# for a dimension is filed under "*" and matches any query value. find()
+# intersects the matching key sets smallest first, so a lookup costs about the
+# size of its result rather than a scan. Live feeds are merged incrementally:
+# merge() diffs a source's new items against what it holds and only re-files
+# the entries that were added, changed or removed.
+import os
+import json
+import datetime as dt
+import threading
+import functools
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Iterable, Tuple, Set
+
+from tracing import traced
+
+CATALOGUE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalogue.json")
+ANY = "*"
+DIMENSIONS = ("kind", "field", "country", "city", "sport", "source")
+# Bookkeeping keys, not shown in tables.
+HIDDEN = frozenset(("kind", "field", "country", "source", "key"))
+# Entries in these cities are listed whatever city is asked for.
+ANY_CITY = frozenset(("online", "varies", "{city}"))
+# "{city}" templates when no city is given: a bare city value, and a prefix ("{city} Startup Hub").
+NO_CITY, NO_CITY_PREFIX = "Your city", "Local"
+
+
+def _date(value: Any) -> Optional[dt.date]:
+    try:
+        return dt.date.fromisoformat(str(value or "")[:10])
+    except ValueError:
+        return None
+
+def _months(start: Optional[dt.date], end: Optional[dt.date]) -> Iterable[str]:
+    """'YYYY-MM' for every month between start and end (inclusive)."""
+    end = end or start
+    if start is None or end < start:
+        return []
+    y, m, out = start.year, start.month, []
+    while (y, m) <= (end.year, end.month):
+        out.append(f"{y:04d}-{m:02d}")
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return out
+
+
+def _fill_city(value: str, city: Optional[str]) -> str:
+    """Fill "{city}" templates; without a city, reword them instead of leaving a blank."""
+    if "{city}" not in value:
+        return value
+    if city:
+        return value.replace("{city}", city)
+    if value == "{city}":
+        return NO_CITY
+    return value.replace("{city}", NO_CITY_PREFIX, 1).replace("{city}", NO_CITY.lower())
+
+def _overlaps(entry: Dict[str, Any], since: Optional[dt.date], until: Optional[dt.date]) -> bool:
+    """Exact date check behind the month buckets; undated entries always pass."""
+    start = _date(entry.get("start"))
+    end = _date(entry.get("end")) or start
+    if start is None:
+        return True
+    return (since is None or end >= since) and (until is None or start <= until)
+
+
+class Catalogue:
+    """In-memory entries plus (dimension, value) -> entry-id indexes; safe to share across sessions."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.headings: Dict[str, str] = spec.get("headings", {})
+        self.trials: Dict[str, Dict[str, Any]] = spec.get("sports_trials", {})
+        # sport -> countries whose trial calendars list it
+        self._trial_countries: Dict[str, List[str]] = defaultdict(list)
+        for country, rule in self.trials.items():
+            for sport in rule.get("sports", []):
+                self._trial_countries[sport].append(country)
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._index: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        self._by_source: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._stamps: Dict[str, float] = {}
+        self._next_id = 0
+        self.merge("curated", spec.get("entries", []))
+
+    # ----------------------------- Index maintenance ----------------------------- #
+    def _keys(self, entry: Dict[str, Any]) -> List[Tuple[str, str]]:
+        keys = []
+        for dim in DIMENSIONS:
+            values = entry.get(dim)
+            values = values if isinstance(values, list) else [values]
+            for v in values:
+                v = str(v).lower() if v not in (None, "") else ANY
+                keys.append((dim, ANY if dim == "city" and v in ANY_CITY else v))
+        months = _months(_date(entry.get("start")), _date(entry.get("end")))
+        keys += [("month", m) for m in months] or [("month", ANY)]
+        return keys
+
+    def _add(self, entry: Dict[str, Any]) -> int:
+        eid = self._next_id
+        self._next_id += 1
+        self._entries[eid] = entry
+        for key in self._keys(entry):
+            self._index[key].add(eid)
+        return eid
+
+    def _remove(self, eid: int) -> None:
+        for key in self._keys(self._entries.pop(eid)):
+            ids = self._index[key]
+            ids.discard(eid)
+            if not ids:
+                del self._index[key]
+
+    @traced("catalogue.merge", attrs=lambda self, source, items, **kw: {"source": source, "items": len(items)})
+    def merge(self, source: str, items: List[Dict[str, Any]], **defaults) -> Dict[str, int]:
+        """
+        Make `source`'s entries equal to `items` (each filled from `defaults`), touching only
+        the differences. Items are matched by their "key", else by (name/title/course/program, start).
+        Returns {"added", "updated", "removed"}.
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            held = self._by_source[source]
+            seen = {}
+            for item in items:
+                entry = {**defaults, **item, "source": source}
+                label = entry.get("name") or entry.get("title") or entry.get("course") or entry.get("program")
+                key = str(entry.get("key") or (label, entry.get("start")))
+                seen[key] = entry
+            for key in [k for k in held if k not in seen]:
+                self._remove(held.pop(key))
+                counts["removed"] += 1
+            for key, entry in seen.items():
+                eid = held.get(key)
+                if eid is not None:
+                    if self._entries[eid] == entry:
+                        continue
+                    self._remove(eid)
+                    counts["updated"] += 1
+                else:
+                    counts["added"] += 1
+                held[key] = self._add(entry)
+        return counts
+
+    def sync(self, source: str, fetched_at: Optional[float], items: List[Dict[str, Any]], **defaults) -> None:
+        """merge() only when the feed snapshot changed (by its fetch time), so reruns cost a dict lookup."""
+        if fetched_at is None or self._stamps.get(source) == fetched_at:
+            return
+        self._stamps[source] = fetched_at
+        self.merge(source, items, **defaults)
+
+    def sync_leagues(self, fetched_at: Optional[float], leagues: List[Dict[str, Any]]) -> None:
+        """TheSportsDB leagues ({"league", "sport"}) -> trial events for every country that follows the sport."""
+        if fetched_at is None or self._stamps.get("sports") == fetched_at:
+            return
+        events = []
+        for lg in leagues:
+            for country in self._trial_countries.get(lg.get("sport"), ()):
+                rule = self.trials[country]
+                fill = {"league": lg["league"], "query": lg["league"].replace(" ", "+"), "country": country}
+                events.append({"key": f"{country}:{lg['league']}", "kind": "event", "field": "Sports",
+                               "country": country, "sport": lg["sport"], "city": "Varies",
+                               "name": rule["name"].format(**fill), "dates": rule.get("dates", ""),
+                               "link": rule["link"].format(**fill)})
+        self.sync("sports", fetched_at, events)
+
+    # ----------------------------- Lookups ----------------------------- #
+    def _group(self, dim: str, values: Iterable[str]) -> List[Set[int]]:
+        """Index sets for any of `values` on one dimension (an entry matching one of them passes)."""
+        return [ids for ids in (self._index.get((dim, v)) for v in values) if ids]
+
+    def find(self, kind: str, field: Optional[str] = None, country: Optional[str] = None,
+             city: Optional[str] = None, sport: Optional[str] = None, source: Optional[str] = None,
+             since: Optional[dt.date] = None, until: Optional[dt.date] = None) -> List[Dict[str, Any]]:
+        """
+        Entries matching every given filter, in catalogue order, with "{city}" filled in (reworded
+        when no city is given) and bookkeeping keys dropped. since/until keep entries whose dates
+        overlap the range (undated ones included).
+        """
+        with self._lock:
+            groups = [self._group("kind", [kind.lower()])]
+            for dim, value in (("field", field), ("country", country), ("sport", sport), ("source", source),
+                               ("city", city)):
+                if value:
+                    groups.append(self._group(dim, [value.lower(), ANY]))
+            if since or until:
+                # an open end looks five years out, far beyond any calendar the feeds publish
+                lo = since or until - dt.timedelta(days=5 * 365)
+                hi = until or since + dt.timedelta(days=5 * 365)
+                groups.append(self._group("month", [*_months(lo, hi), ANY]))
+            # enumerate the most selective filter, then test the rest by set membership
+            groups.sort(key=lambda g: sum(map(len, g)))
+            ids = set().union(*groups[0])
+            for group in groups[1:]:
+                ids = {eid for eid in ids if any(eid in s for s in group)}
+            entries = [self._entries[eid] for eid in sorted(ids)]
+        if since or until:
+            # month buckets are coarse: drop entries that end before `since` or start after `until`
+            entries = [e for e in entries if _overlaps(e, since, until)]
+        return [{k: _fill_city(v, city) if isinstance(v, str) else v
+                 for k, v in e.items() if k not in HIDDEN} for e in entries]
+
+    def heading(self, field: str) -> str:
+        return self.headings.get(field) or self.headings.get(ANY, field)
+
+    def count(self) -> int:
+        return len(self._entries)
+
+
+@functools.lru_cache(maxsize=None)
+def load_catalogue(path: str = CATALOGUE_FILE) -> Catalogue:
+    """Parse and index the catalogue file once per process."""
+    with open(path, encoding="utf-8") as f:
+        return Catalogue(json.load(f))
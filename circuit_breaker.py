@@ -0,0 +1,156 @@
+# circuit_breaker.py — Per-source circuit breakers with latency-adaptive timeouts
+#
+#   from circuit_breaker import breaker
+#   b = breaker("devpost")
+#   if b.allow():
+#       timeout = b.timeout(8.0)      # ~2 x observed p95, never above the 8 s ceiling
+#       ... b.success(seconds) / b.failure()
+#
+# After FAILURE_THRESHOLD consecutive failures a source's breaker opens and
+# callers go straight to fallback data for the cool-down; then a single probe
+# request is let through (half-open). A failed probe re-opens the breaker with
+# a doubled cool-down (capped), a successful one closes it. Breakers live in a
+# process-wide registry, so every Streamlit session and API request shares them,
+# and their state is exported with the tracer's Prometheus metrics.
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+from tracing import tracer
+
+FAILURE_THRESHOLD = 3
+COOLDOWN_SECONDS = 30.0
+MAX_COOLDOWN_SECONDS = 600.0
+# Adaptive timeout = clamp(p95 * TIMEOUT_FACTOR, MIN_TIMEOUT, ceiling), once MIN_SAMPLES are in.
+TIMEOUT_FACTOR = 2.0
+MIN_TIMEOUT = 1.5
+MIN_SAMPLES = 5
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+_STATE_VALUE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """Failure counter, open/half-open/closed state and recent latencies for one upstream source."""
+
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 cooldown: float = COOLDOWN_SECONDS, window: int = 50):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.short_circuits = 0
+        self.trips = 0
+        self._probing = False
+        self._latencies: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    # ----------------------------- Gate ----------------------------- #
+    def allow(self) -> bool:
+        """True if a request may go upstream now; False means use fallback data."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True  # exactly one probe while half-open
+                return True
+            self.short_circuits += 1
+            return False
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def timeout(self, ceiling: float) -> float:
+        """Request timeout from observed p95 latency, bounded by `ceiling` (the caller's deadline)."""
+        with self._lock:
+            lat = sorted(self._latencies)
+        if len(lat) < MIN_SAMPLES:
+            return ceiling
+        p95 = lat[min(len(lat) - 1, int(round(0.95 * (len(lat) - 1))))]
+        return round(min(ceiling, max(MIN_TIMEOUT, p95 * TIMEOUT_FACTOR)), 3)
+
+    # ----------------------------- Outcomes ----------------------------- #
+    def success(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+            self.state = CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+            self._probing = False
+
+    def failure(self, timed_out_after: Optional[float] = None) -> None:
+        """
+        Count a failed request. A timeout also counts as a latency sample of the time waited,
+        so an upstream that slows down pushes the adaptive timeout back up instead of tripping forever.
+        """
+        with self._lock:
+            if timed_out_after is not None:
+                self._latencies.append(timed_out_after)
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self.cooldown = min(MAX_COOLDOWN_SECONDS, self.cooldown * 2)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.trips += 1
+        self._probing = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lat = sorted(self._latencies)
+            state, failures, cooldown = self.state, self.failures, self.cooldown
+            short, trips = self.short_circuits, self.trips
+        p95 = lat[min(len(lat) - 1, int(round(0.95 * (len(lat) - 1))))] if lat else 0.0
+        return {"state": state, "failures": failures, "trips": trips, "short_circuits": short,
+                "cooldown_s": cooldown, "retry_in_s": round(self.retry_in(), 1), "latency_p95": p95}
+
+
+# ----------------------------- Registry ----------------------------- #
+_registry: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+def breaker(name: str) -> CircuitBreaker:
+    """The process-wide breaker for a source (created on first use)."""
+    with _registry_lock:
+        b = _registry.get(name)
+        if b is None:
+            b = _registry[name] = CircuitBreaker(name)
+        return b
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    with _registry_lock:
+        breakers = list(_registry.values())
+    return {b.name: b.snapshot() for b in breakers}
+
+def _prometheus_lines(prefix: str) -> List[str]:
+    stats = breaker_stats()
+    lines = [f"# HELP {prefix}_breaker_state Circuit breaker state per source (0 closed, 1 half-open, 2 open).",
+             f"# TYPE {prefix}_breaker_state gauge"]
+    lines += [f'{prefix}_breaker_state{{source="{n}"}} {_STATE_VALUE[s["state"]]}' for n, s in stats.items()]
+    lines += [f"# HELP {prefix}_breaker_short_circuits_total Requests answered from fallback while open.",
+              f"# TYPE {prefix}_breaker_short_circuits_total counter"]
+    lines += [f'{prefix}_breaker_short_circuits_total{{source="{n}"}} {s["short_circuits"]}' for n, s in stats.items()]
+    lines += [f"# HELP {prefix}_breaker_trips_total Times the breaker opened.",
+              f"# TYPE {prefix}_breaker_trips_total counter"]
+    lines += [f'{prefix}_breaker_trips_total{{source="{n}"}} {s["trips"]}' for n, s in stats.items()]
+    lines += [f"# HELP {prefix}_breaker_latency_p95_seconds Recent p95 latency driving the adaptive timeout.",
+              f"# TYPE {prefix}_breaker_latency_p95_seconds gauge"]
+    lines += [f'{prefix}_breaker_latency_p95_seconds{{source="{n}"}} {s["latency_p95"]}' for n, s in stats.items()]
+    return lines
+
+tracer.add_collector(_prometheus_lines)
@@ -0,0 +1,166 @@
+# field_rules.py — Declarative per-field gap rules (data/field_rules.json)
+#
+# The rules file is compiled once into bitmasks: every profile becomes two ints
+# (failed common checks, known rule skills), so scoring it against a field is a
+# couple of AND/compare operations plus a precomputed table lookup, and scoring
+# against every field reuses the same encoding. score_matrix() does the same for
+# many profiles at once with NumPy. Adding a field only means editing the JSON.
+import os
+import json
+import functools
+from typing import List, Dict, Any, Tuple
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "field_rules.json")
+
+
+class FieldRule:
+    """One compiled field: which checks apply, required skills and page metadata."""
+
+    def __init__(self, spec: Dict[str, Any], check_ids: List[str], checks: Dict[str, Dict[str, Any]],
+                 term_bits: Dict[str, int]):
+        self.name = spec.get("name", "")
+        self.next_steps = spec.get("next_steps", "career development")
+        self.search_query = spec.get("search_query", self.name.lower())
+        self.internships = bool(spec.get("internships", False))
+
+        self.check_mask = 0
+        for cid in spec.get("checks", []):
+            if cid not in checks:
+                raise ValueError(f"Field {self.name!r} uses unknown check {cid!r}")
+            self.check_mask |= 1 << check_ids.index(cid)
+        # (penalty, flags, recommendations) for every combination of failed checks
+        self.table: List[Tuple[int, Tuple[str, ...], Tuple[str, ...]]] = []
+        for failed in range(1 << len(check_ids)):
+            penalty, flags, recs = 0, [], []
+            for i, cid in enumerate(check_ids):
+                if failed & self.check_mask & (1 << i):
+                    c = checks[cid]
+                    penalty += c.get("penalty", 0)
+                    if c.get("flag"):
+                        flags.append(c["flag"])
+                    if c.get("recommendation"):
+                        recs.append(c["recommendation"])
+            self.table.append((penalty, tuple(flags), tuple(recs)))
+
+        skills = spec.get("skills") or {}
+        self.require_all = skills.get("require", "all") == "all"
+        if skills.get("require", "all") not in ("all", "any"):
+            raise ValueError(f"Field {self.name!r}: skills.require must be 'all' or 'any'")
+        self.skill_mask = 0
+        for term in skills.get("terms", []):
+            self.skill_mask |= 1 << term_bits[term.lower()]
+        self.skill_flag = skills.get("flag", "")
+        self.skill_rec = skills.get("recommendation", "")
+        self.skill_penalty = skills.get("penalty", 0)
+        self._gap_flags: Dict[int, str] = {}
+
+    def skill_gap(self, have: int) -> int:
+        """Bitmask of the missing required skills (all) or of every option (any, none held); 0 = no gap."""
+        if not self.skill_mask:
+            return 0
+        if self.require_all:
+            return self.skill_mask & ~have
+        return 0 if self.skill_mask & have else self.skill_mask
+
+    def gap_flag(self, gap: int, terms: List[str]) -> str:
+        """skill_flag naming the skills in `gap` (bit i = terms[i]); memoized per gap mask."""
+        flag = self._gap_flags.get(gap)
+        if flag is None:
+            missing = [t for i, t in enumerate(terms) if gap >> i & 1]
+            flag = self._gap_flags[gap] = self.skill_flag.format(missing=", ".join(missing))
+        return flag
+
+
+class RuleBook:
+    """
+    Compiled rules:
+      rules = load_rules()
+      rules.evaluate(profile, "Technology")   # {"score", "flags", "recommendations"}
+      rules.evaluate_all(profile)             # {field: result} from one encoding
+      scores, gaps = rules.score_matrix(profiles)   # (n_profiles, n_fields) arrays
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.base_score = spec.get("base_score", 100)
+        self.min_score = spec.get("min_score", 0)
+        checks = spec.get("checks", {})
+        self.check_ids = list(checks)
+        self.requires = [checks[c]["requires"] for c in self.check_ids]
+        # bit order = sorted term order, so walking a mask yields names already sorted
+        self.terms = sorted({t.lower() for f in spec.get("fields", [])
+                             for t in (f.get("skills") or {}).get("terms", [])})
+        if len(self.terms) > 62:
+            raise ValueError(f"{len(self.terms)} distinct rule skills; skill masks hold at most 62")
+        self.term_bits = {t: i for i, t in enumerate(self.terms)}
+        self.fields: Dict[str, FieldRule] = {}
+        for f in spec.get("fields", []):
+            self.fields[f["name"]] = FieldRule(f, self.check_ids, checks, self.term_bits)
+        self.default = FieldRule(dict(spec.get("default", {}), name="Other"), self.check_ids, checks, self.term_bits)
+        self.names: List[str] = list(self.fields)
+
+    def rule(self, field: str) -> FieldRule:
+        """Rule for `field`; unknown fields get the default checks and no skill requirement."""
+        return self.fields.get(field, self.default)
+
+    # ----------------------------- Single profile ----------------------------- #
+    def encode(self, profile: Dict[str, Any]) -> Tuple[int, int]:
+        """(failed-check bits, held-rule-skill bits) for one profile."""
+        failed = sum(1 << i for i, key in enumerate(self.requires) if not profile.get(key))
+        bits = self.term_bits
+        have = sum(1 << bits[s] for s in set(profile.get("skills", ())) if s in bits)
+        return failed, have
+
+    def _result(self, rule: FieldRule, failed: int, have: int) -> Dict[str, Any]:
+        penalty, flags, recs = rule.table[failed]
+        flags, recs = list(flags), list(recs)
+        gap = rule.skill_gap(have)
+        if gap:
+            flags.append(rule.gap_flag(gap, self.terms))
+            recs.append(rule.skill_rec)
+            penalty += rule.skill_penalty
+        return {
+            "score": max(self.min_score, self.base_score - penalty),
+            "flags": flags,
+            "recommendations": recs,
+        }
+
+    def evaluate(self, profile: Dict[str, Any], field: str) -> Dict[str, Any]:
+        return self._result(self.rule(field), *self.encode(profile))
+
+    def evaluate_all(self, profile: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        failed, have = self.encode(profile)
+        return {name: self._result(rule, failed, have) for name, rule in self.fields.items()}
+
+    # ----------------------------- Batch ----------------------------- #
+    def score_matrix(self, profiles: List[Dict[str, Any]]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Scores (int32) and skill-gap booleans for every profile x field (columns follow `names`).
+        Check penalties are a table gather; skill gaps come from two 0/1 matrix products.
+        """
+        import numpy as np  # batch-only; UI pages that just read field metadata skip it
+
+        rules = [self.fields[name] for name in self.names]
+        encoded = np.array([self.encode(p) for p in profiles], dtype=np.int64).reshape(-1, 2)
+        failed = encoded[:, 0]
+        held = (encoded[:, 1:] >> np.arange(len(self.terms))) & 1       # (n, terms) 0/1
+
+        penalties = np.array([[p for p, _, _ in rule.table] for rule in rules], dtype=np.int32)
+        required = (np.array([[rule.skill_mask] for rule in rules], dtype=np.int64)
+                    >> np.arange(len(self.terms))) & 1                  # (fields, terms) 0/1
+        all_mode = np.array([rule.require_all for rule in rules], dtype=bool)
+        has_skills = required.any(axis=1)
+
+        missing = (1 - held) @ required.T          # required skills not held
+        hits = held @ required.T                   # required skills held
+        gaps = has_skills & np.where(all_mode, missing > 0, hits == 0)
+
+        score = self.base_score - penalties[:, failed].T
+        score -= gaps * np.array([rule.skill_penalty for rule in rules], dtype=np.int32)
+        return np.maximum(score, self.min_score).astype(np.int32), gaps
+
+
+@functools.lru_cache(maxsize=4)
+def load_rules(path: str = RULES_FILE) -> RuleBook:
+    """Parse and compile the rules file once per process."""
+    with open(path, encoding="utf-8") as f:
+        return RuleBook(json.load(f))
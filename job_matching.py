@@ -0,0 +1,149 @@
+# job_matching.py — Vectorized resume <-> job matching with hashed TF-IDF features
+#
+# Texts are hashed into a fixed number of feature columns (words + word bigrams),
+# weighted by sublinear TF x IDF and L2-normalised, so cosine similarity between
+# every resume and every posting is one float32 matrix product. Postings are kept
+# sparse and densified a chunk at a time, so 100k postings never need a dense
+# 100k x dim matrix; top-k is merged per chunk with argpartition.
+import re
+import zlib
+from typing import List, Tuple, Optional, Iterator
+
+import numpy as np
+
+DEFAULT_DIM = 2 ** 12
+# Resume text used for matching (and kept per session); the opening pages carry the signal.
+MATCH_TEXT_CHARS = 20_000
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+# Sparse rows as (indptr, indices, values), the CSR layout without a scipy dependency.
+Csr = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words plus adjacent-word bigrams ("data analysis" -> data, analysis, data_analysis)."""
+    words = _WORD.findall(text.lower())
+    return words + [f"{a}_{b}" for a, b in zip(words, words[1:])]
+
+def hash_texts(texts: List[str], dim: int = DEFAULT_DIM) -> Csr:
+    """
+    Hash each text's tokens into `dim` columns with sublinear term frequency (1 + log tf).
+    crc32 keeps column assignment stable across processes, unlike the salted built-in hash().
+    """
+    cache = {}
+    indptr = [0]
+    indices: List[np.ndarray] = []
+    values: List[np.ndarray] = []
+    for text in texts:
+        cols = []
+        for tok in tokenize(text):
+            col = cache.get(tok)
+            if col is None:
+                col = cache[tok] = zlib.crc32(tok.encode()) % dim
+            cols.append(col)
+        uniq, counts = np.unique(np.asarray(cols, dtype=np.int32), return_counts=True)
+        indices.append(uniq)
+        values.append((1.0 + np.log(counts)).astype(np.float32))
+        indptr.append(indptr[-1] + len(uniq))
+    return (np.asarray(indptr, dtype=np.int64),
+            np.concatenate(indices) if indices else np.empty(0, np.int32),
+            np.concatenate(values) if values else np.empty(0, np.float32))
+
+def densify(csr: Csr, start: int, stop: int, dim: int, idf: np.ndarray) -> np.ndarray:
+    """Rows [start, stop) as a dense, IDF-weighted, L2-normalised float32 block."""
+    indptr, indices, values = csr
+    lo, hi = indptr[start], indptr[stop]
+    rows = np.repeat(np.arange(stop - start), np.diff(indptr[start:stop + 1]))
+    block = np.zeros((stop - start, dim), dtype=np.float32)
+    block[rows, indices[lo:hi]] = values[lo:hi] * idf[indices[lo:hi]]
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    np.divide(block, norms, out=block, where=norms > 0)
+    return block
+
+def _merge_topk(best_s: np.ndarray, best_i: np.ndarray, scores: np.ndarray,
+                offset: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Fold one chunk of scores (rows x chunk) into the running top-k per row."""
+    kk = min(k, scores.shape[1])
+    part = np.argpartition(-scores, kk - 1, axis=1)[:, :kk]
+    cand_s = np.concatenate([best_s, np.take_along_axis(scores, part, axis=1)], axis=1)
+    cand_i = np.concatenate([best_i, part + offset], axis=1)
+    keep = np.argpartition(-cand_s, min(k, cand_s.shape[1]) - 1, axis=1)[:, :k]
+    return np.take_along_axis(cand_s, keep, axis=1), np.take_along_axis(cand_i, keep, axis=1)
+
+def _sorted(best_s: np.ndarray, best_i: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(-best_s, axis=1, kind="stable")
+    return np.take_along_axis(best_i, order, axis=1), np.take_along_axis(best_s, order, axis=1)
+
+def _chunks(n: int, size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, n, size):
+        yield start, min(start + size, n)
+
+
+class JobMatcher:
+    """
+    Fit once on the posting corpus (IDF + sparse posting vectors), then score resumes in batch:
+      m = JobMatcher().fit(job_texts)
+      idx, scores = m.top_k_jobs(resume_texts, k=10)        # shape (n_resumes, k)
+      idx, scores = m.top_k_candidates(resume_texts, k=5)   # shape (n_jobs, k)
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM, chunk_size: int = 4096):
+        self.dim = dim
+        self.chunk_size = chunk_size
+        self.idf: Optional[np.ndarray] = None
+        self.jobs: Optional[Csr] = None
+        self.n_jobs = 0
+
+    def fit(self, job_texts: List[str]) -> "JobMatcher":
+        self.jobs = hash_texts(job_texts, self.dim)
+        self.n_jobs = len(job_texts)
+        df = np.bincount(self.jobs[1], minlength=self.dim).astype(np.float32)
+        self.idf = (np.log((1.0 + self.n_jobs) / (1.0 + df)) + 1.0).astype(np.float32)
+        return self
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Dense normalised vectors for a batch of resumes (rows aligned with `texts`)."""
+        csr = hash_texts(texts, self.dim)
+        return densify(csr, 0, len(texts), self.dim, self.idf)
+
+    def top_k_jobs(self, resume_texts: List[str], k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Best k posting indexes (and cosine scores) per resume, highest first."""
+        resumes = self.encode(resume_texts)
+        k = min(k, self.n_jobs)
+        if k == 0:
+            return np.empty((len(resume_texts), 0), np.int64), np.empty((len(resume_texts), 0), np.float32)
+        blocks = list(_chunks(len(resume_texts), self.chunk_size))
+        best = [(np.empty((stop - start, 0), np.float32), np.empty((stop - start, 0), np.int64))
+                for start, stop in blocks]
+        # each posting chunk is densified once and scored against every resume block
+        for j0, j1 in _chunks(self.n_jobs, self.chunk_size):
+            postings = densify(self.jobs, j0, j1, self.dim, self.idf).T
+            for b, (r0, r1) in enumerate(blocks):
+                best[b] = _merge_topk(*best[b], resumes[r0:r1] @ postings, j0, k)
+        if not best:
+            return np.empty((0, k), np.int64), np.empty((0, k), np.float32)
+        idx, scores = zip(*(_sorted(s, i) for s, i in best))
+        return np.concatenate(idx), np.concatenate(scores)
+
+    def top_k_candidates(self, resume_texts: List[str], k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Best k resume indexes (and cosine scores) per posting, highest first."""
+        resumes = self.encode(resume_texts)
+        k = min(k, len(resume_texts))
+        if k == 0 or self.n_jobs == 0:
+            return np.empty((self.n_jobs, 0), np.int64), np.empty((self.n_jobs, 0), np.float32)
+        idx_parts, score_parts = [], []
+        for start, stop in _chunks(self.n_jobs, self.chunk_size):
+            block = densify(self.jobs, start, stop, self.dim, self.idf)
+            empty_s = np.full((stop - start, 0), -1.0, dtype=np.float32)
+            empty_i = np.zeros((stop - start, 0), dtype=np.int64)
+            s, i = _merge_topk(empty_s, empty_i, block @ resumes.T, 0, k)
+            i, s = _sorted(s, i)
+            idx_parts.append(i)
+            score_parts.append(s)
+        return np.concatenate(idx_parts), np.concatenate(score_parts)
+
+
+def profile_text(profile: dict, raw_text: str = "", max_chars: int = MATCH_TEXT_CHARS) -> str:
+    """Matching text for a resume: extracted skills (repeated to weight them) plus the start of the raw text."""
+    skills = " ".join(profile.get("skills", []))
+    return f"{skills} {skills} {raw_text[:max_chars]}"
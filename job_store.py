@@ -0,0 +1,240 @@
+# job_store.py — Local full-text job index (SQLite FTS5) fed from the Remotive feed
+#
+#   python job_store.py ingest                       # pull the full feed into .cache/jobs.sqlite
+#   python job_store.py search "data analyst" --location India --page 2
+#
+# The Courses & Internships page queries this index instead of calling Remotive
+# once per keyword: ranking (bm25), pagination and location filtering run locally.
+# Replicas sharing the database file (and a shared cache backend for leases)
+# ingest one at a time instead of each pulling the full feed.
+import os
+import re
+import sys
+import html
+import time
+import sqlite3
+import argparse
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+import live_sources
+from cache_backend import CacheBackend
+from tracing import traced
+
+DEFAULT_DB = os.path.join(".cache", "jobs.sqlite")
+WORLDWIDE = live_sources.WORLDWIDE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    title TEXT, company TEXT, location TEXT, category TEXT, job_type TEXT,
+    tags TEXT, url TEXT, published TEXT, description TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, tags, category, description,
+    content='jobs', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+_TAG = re.compile(r"<[^>]+>")
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+# search(sort=...) columns; "relevance" is bm25 for keyword queries, newest first otherwise.
+SORTS = {
+    "published": "j.published",
+    "title": "j.title COLLATE NOCASE",
+    "company": "j.company COLLATE NOCASE",
+}
+
+
+def _plain(text: Optional[str]) -> str:
+    return " ".join(html.unescape(_TAG.sub(" ", text or "")).split())
+
+def fts_query(text: str) -> str:
+    """User text -> safe FTS5 query: every word must match, as a prefix ("data anal" finds analyst)."""
+    return " ".join(f'"{tok}"*' for tok in _TOKEN.findall(text.lower()))
+
+
+class JobStore:
+    """
+    SQLite-backed job index (WAL mode). Each thread keeps its own connection, so one
+    instance is safe to share across Streamlit sessions and a background ingest thread.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB, leases: Optional[CacheBackend] = None):
+        self.path = path
+        self.leases = leases
+        self._ingest_lock = threading.Lock()
+        self._last_attempt = 0.0
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection; `with conn:` commits (or rolls back) but leaves it open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+        return conn
+
+    # ----------------------------- Ingestion ----------------------------- #
+    @traced("job_store.ingest", attrs=lambda self, jobs, full=False: {"items": len(jobs), "full": full})
+    def ingest(self, jobs: List[Dict[str, Any]], full: bool = False) -> int:
+        """
+        Upsert raw Remotive job dicts (keyed by their id) and keep the FTS index in sync.
+        With full=True `jobs` is the whole feed: postings missing from it have expired and are
+        deleted in the same transaction (an empty snapshot deletes nothing).
+        """
+        rows = []
+        for j in jobs:
+            if j.get("id") is None:
+                continue
+            rows.append((
+                int(j["id"]), j.get("title") or "", j.get("company_name") or "",
+                j.get("candidate_required_location") or "Remote", j.get("category") or "",
+                j.get("job_type") or "", ", ".join(j.get("tags") or []), j.get("url") or "",
+                j.get("publication_date") or "", _plain(j.get("description")),
+            ))
+        with self._connect() as conn:
+            ids = [(r[0],) for r in rows]
+            # external-content FTS: remove the old index entry before replacing the row
+            conn.executemany(
+                "INSERT INTO jobs_fts(jobs_fts, rowid, title, company, tags, category, description) "
+                "SELECT 'delete', id, title, company, tags, category, description FROM jobs WHERE id = ?", ids)
+            conn.executemany("INSERT OR REPLACE INTO jobs VALUES (?,?,?,?,?,?,?,?,?,?)", rows)
+            conn.executemany(
+                "INSERT INTO jobs_fts(rowid, title, company, tags, category, description) "
+                "SELECT id, title, company, tags, category, description FROM jobs WHERE id = ?", ids)
+            if full and rows:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS feed_ids (id INTEGER PRIMARY KEY)")
+                conn.execute("DELETE FROM feed_ids")
+                conn.executemany("INSERT OR IGNORE INTO feed_ids VALUES (?)", ids)
+                stale = "FROM jobs WHERE id NOT IN (SELECT id FROM feed_ids)"
+                conn.execute(
+                    "INSERT INTO jobs_fts(jobs_fts, rowid, title, company, tags, category, description) "
+                    f"SELECT 'delete', id, title, company, tags, category, description {stale}")
+                conn.execute(f"DELETE {stale}")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_ingest', ?)", (str(time.time()),))
+        return len(rows)
+
+    def ingest_remotive(self, timeout: float = 30) -> int:
+        """Pull the full Remotive feed into the store; one ingest at a time per process."""
+        with self._ingest_lock:
+            return self.ingest(live_sources.remotive_feed(timeout=timeout), full=True)
+
+    def refresh_in_background(self, max_age: float = 6 * 3600, retry_after: float = 60) -> bool:
+        """Start a background ingest if the store is empty or older than max_age; never blocks."""
+        age = self.age()
+        if (age is not None and age < max_age) or self._ingest_lock.locked():
+            return False
+        if time.time() - self._last_attempt < retry_after:
+            return False
+        self._last_attempt = time.time()
+
+        def job():
+            if self.leases and not self.leases.acquire(f"ingest:{self.path}", lease=600):
+                return  # another replica is ingesting into the shared index
+            try:
+                self.ingest_remotive()
+            except Exception:
+                pass  # keep serving what we have; the next page view retries
+            finally:
+                if self.leases:
+                    self.leases.release(f"ingest:{self.path}")
+
+        threading.Thread(target=job, name="job-ingest", daemon=True).start()
+        return True
+
+    # ----------------------------- Queries ----------------------------- #
+    def ingested_at(self) -> Optional[float]:
+        """Epoch time of the last successful ingest, or None if never ingested."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'last_ingest'").fetchone()
+        return float(row["value"]) if row else None
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful ingest, or None if never ingested."""
+        stamp = self.ingested_at()
+        return time.time() - stamp if stamp is not None else None
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def documents(self) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Every posting (display fields) plus its matching text, rows aligned, ordered by id."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, title, company, location, url, tags, category, description FROM jobs ORDER BY id"
+            ).fetchall()
+        meta = [{k: r[k] for k in ("id", "title", "company", "location", "url")} for r in rows]
+        texts = [f"{r['title']} {r['title']} {r['tags']} {r['category']} {r['description']}" for r in rows]
+        return meta, texts
+
+    @traced("job_store.search")
+    def search(self, query: str = "", location: Optional[str] = None,
+               limit: int = 20, offset: int = 0, sort: str = "relevance",
+               descending: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Ranked search over title/company/tags/category/description.
+        Returns (one page of rows, total matches). An empty query lists newest first.
+        `location` keeps postings naming it plus worldwide/anywhere ones; `sort` is
+        "relevance" or a key of SORTS (ties keep relevance order).
+        """
+        where, params = [], []
+        match = fts_query(query)
+        if match:
+            where.append("jobs_fts MATCH ?")
+            params.append(match)
+        if location:
+            where.append(f"(lower(j.location) LIKE ? OR lower(j.location) IN ({','.join('?' * len(WORLDWIDE))}))")
+            params += [f"%{location.lower()}%", *WORLDWIDE]
+        source = "jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid" if match else "jobs j"
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        order = "bm25(jobs_fts, 10.0, 3.0, 5.0, 2.0, 1.0)" if match else "j.published DESC"
+        if sort in SORTS:
+            order = f"{SORTS[sort]} {'DESC' if descending else 'ASC'}, {order}"
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM {source} {clause}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT j.title, j.company, j.location, j.category, j.published, j.url "
+                f"FROM {source} {clause} ORDER BY {order} LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+        return [dict(r) for r in rows], total
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Local Remotive job index (SQLite FTS5).")
+    ap.add_argument("--db", default=DEFAULT_DB)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("ingest", help="Pull the full Remotive feed into the index")
+    s = sub.add_parser("search", help="Query the index")
+    s.add_argument("query", nargs="?", default="")
+    s.add_argument("--location", default=None)
+    s.add_argument("--page", type=int, default=1)
+    s.add_argument("--per-page", type=int, default=20)
+    s.add_argument("--sort", default="relevance", choices=["relevance", *SORTS])
+    s.add_argument("--desc", action="store_true", help="Reverse the --sort column")
+    args = ap.parse_args(argv)
+
+    store = JobStore(args.db)
+    if args.cmd == "ingest":
+        t0 = time.perf_counter()
+        n = store.ingest_remotive()
+        print(f"Ingested {n} jobs in {time.perf_counter() - t0:.2f}s ({store.count()} in store)", file=sys.stderr)
+        return 0
+    t0 = time.perf_counter()
+    rows, total = store.search(args.query, args.location, args.per_page, (args.page - 1) * args.per_page,
+                               sort=args.sort, descending=args.desc)
+    for r in rows:
+        print(f"{r['title']} — {r['company']} ({r['location']}) {r['url']}")
+    print(f"{total} matches in {(time.perf_counter() - t0) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
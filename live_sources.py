@@ -0,0 +1,206 @@
+# live_sources.py — Live opportunity feeds (Remotive, Devpost, TheSportsDB)
+#
+# One pooled keep-alive HTTP session is shared by every fetch, and fetch_all()
+# runs several sources concurrently with per-source deadlines, so a page waits
+# for the slowest source instead of the sum of all of them.
+# Each source sits behind a process-wide circuit breaker (circuit_breaker.py):
+# while a source is failing, fetches return at once with ok=False so callers
+# show fallback data, and request timeouts follow the source's observed p95.
+# Base URLs can be pointed at a local stub server via GAP_MAPPER_<SOURCE>_URL
+# (tests/test_live_sources.py runs fetch_all against one).
+import os
+import time
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from typing import List, Dict, Any, Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tracing import span, tracer
+from circuit_breaker import breaker
+
+SOURCE_URLS: Dict[str, str] = {
+    "remotive": os.environ.get("GAP_MAPPER_REMOTIVE_URL", "https://remotive.com/api/remote-jobs"),
+    "devpost": os.environ.get("GAP_MAPPER_DEVPOST_URL", "https://devpost.com/api/hackathons"),
+    "sports": os.environ.get("GAP_MAPPER_SPORTS_URL", "https://www.thesportsdb.com/api/v1/json/1/all_leagues.php"),
+}
+# Postings open to candidates anywhere match every location filter.
+WORLDWIDE = ("worldwide", "anywhere", "remote", "global", "")
+# Seconds a page is willing to wait for each source before showing fallback data.
+DEFAULT_DEADLINES: Dict[str, float] = {"remotive": 10.0, "devpost": 8.0, "sports": 8.0}
+
+_session_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+# Dedicated threads for blocking HTTP: unlike the event loop's default executor,
+# asyncio.run() does not wait for these, so an abandoned fetch never delays a page.
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="live-fetch")
+
+
+class SourceUnavailable(RuntimeError):
+    """A source's circuit breaker is open, so no request was sent."""
+
+
+def http_session() -> requests.Session:
+    """Process-wide keep-alive session with a connection pool per host."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            s.headers["User-Agent"] = "career-gap-mapper/1.0"
+            _session = s
+        return _session
+
+def _get_json(url: str, params: Optional[Dict[str, Any]] = None, timeout: float = 10) -> Any:
+    with span("http.get", host=urlsplit(url).netloc) as s:
+        r = http_session().get(url, params=params, timeout=timeout)
+        s.update(status=r.status_code, bytes=len(r.content))
+        r.raise_for_status()
+        return r.json()
+
+# ----------------------------- Sources (raise on failure) ----------------------------- #
+def remotive_jobs(query: str, location: str, timeout: float = 10) -> List[Dict[str, Any]]:
+    """
+    Remotive public jobs API (works for internships & jobs). No auth required.
+    """
+    data = _get_json(SOURCE_URLS["remotive"], params={"search": query}, timeout=timeout).get("jobs", [])
+    loc = (location or "").lower()
+    if loc not in WORLDWIDE:
+        # keep postings naming the location, plus worldwide ones
+        data = [j for j in data if loc in (j.get("candidate_required_location") or "").lower()
+                or (j.get("candidate_required_location") or "").lower() in WORLDWIDE]
+    # Lightweight mapping
+    out = []
+    for j in data[:30]:
+        out.append({
+            "title": j.get("title"),
+            "company": j.get("company_name"),
+            "location": j.get("candidate_required_location") or "Remote",
+            "url": j.get("url")
+        })
+    return out
+
+def remotive_feed(timeout: float = 30) -> List[Dict[str, Any]]:
+    """
+    The full, unfiltered Remotive feed (raw job dicts) for bulk ingestion into the job store.
+    Has its own "remotive-feed" breaker (raises SourceUnavailable while it is open): a slow
+    30 s bulk pull must not raise the page searches' adaptive timeout or open their breaker.
+    """
+    guard = breaker("remotive-feed")
+    if not guard.allow():
+        raise SourceUnavailable(f"remotive: circuit open; retrying in {guard.retry_in():.0f}s")
+    t0 = time.perf_counter()
+    try:
+        jobs = _get_json(SOURCE_URLS["remotive"], timeout=timeout).get("jobs", [])
+    except requests.Timeout:
+        guard.failure(timeout)
+        raise
+    except BaseException:
+        guard.failure()
+        raise
+    guard.success(round(time.perf_counter() - t0, 3))
+    return jobs
+
+def devpost_upcoming(timeout: float = 8) -> List[Dict[str, Any]]:
+    """
+    Devpost upcoming hackathons (unofficial; may fail). Callers fall back to curated lists.
+    """
+    data = _get_json(SOURCE_URLS["devpost"], params={"status": "upcoming"}, timeout=timeout)
+    items = []
+    for h in data[:20]:
+        items.append({
+            "name": h.get("title") or h.get("name", "Hackathon"),
+            "org": h.get("organization_name") or "Devpost",
+            "start": h.get("start_date") or "",
+            "end": h.get("end_date") or "",
+            "dates": h.get("submission_period_dates") or "",
+            "city": h.get("location") or "Online",
+            "link": h.get("url") or h.get("hackathon_url")
+        })
+    return items
+
+def sports_leagues(timeout: float = 8) -> List[Dict[str, Any]]:
+    """
+    Every league in TheSportsDB's free sample feed as {"league", "sport"}; the event
+    catalogue (catalogue.py) turns them into per-country trial listings.
+    """
+    leagues = _get_json(SOURCE_URLS["sports"], timeout=timeout).get("leagues", [])
+    return [{"league": L["strLeague"], "sport": L["strSport"]}
+            for L in leagues if L.get("strLeague") and L.get("strSport")]
+
+SOURCES: Dict[str, Callable[..., List[Dict[str, Any]]]] = {
+    "remotive": remotive_jobs,
+    "devpost": devpost_upcoming,
+    "sports": sports_leagues,
+}
+
+# ----------------------------- Concurrent fetch ----------------------------- #
+async def _fetch_one(name: str, kwargs: Dict[str, Any], deadline: float) -> Dict[str, Any]:
+    """
+    Run one blocking source in the fetch pool, bounded by the source's adaptive timeout
+    (at most `deadline` seconds). Skipped without a request while its breaker is open.
+    """
+    result = {"items": [], "ok": False, "error": "", "seconds": 0.0}
+    guard = breaker(name)
+    if not guard.allow():
+        result["error"] = f"circuit open after repeated failures; retrying in {guard.retry_in():.0f}s"
+        tracer.record(f"fetch.{name}", {"seconds": 0.0, "items": 0, "error": result["error"], "cache": "short_circuit"})
+        return result
+    timeout = guard.timeout(deadline)
+    loop = asyncio.get_running_loop()
+    call = functools.partial(SOURCES[name], timeout=timeout, **kwargs)
+    t0 = time.perf_counter()
+    timed_out = False
+    try:
+        result["items"] = await asyncio.wait_for(loop.run_in_executor(_executor, call), timeout=timeout)
+        result["ok"] = True
+    except asyncio.TimeoutError:
+        timed_out = True
+        result["error"] = f"timeout of {timeout:g}s exceeded"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    except BaseException:
+        # cancelled by an outer deadline: count it, or a half-open probe would never end
+        guard.failure()
+        raise
+    result["seconds"] = round(time.perf_counter() - t0, 3)
+    if result["ok"]:
+        guard.success(result["seconds"])
+    else:
+        guard.failure(timeout if timed_out else None)
+    tracer.record(f"fetch.{name}", {"seconds": result["seconds"], "items": len(result["items"]),
+                                    "error": result["error"], "timeout": timeout})
+    return result
+
+async def fetch_all_async(calls: Dict[str, Dict[str, Any]],
+                          deadlines: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch several sources concurrently, e.g. {"devpost": {}, "sports": {}}.
+    Returns {source: {"items", "ok", "error", "seconds"}}; a source that misses its deadline
+    is cancelled and reported with ok=False instead of holding up the others.
+    """
+    deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+    names = list(calls)
+    results = await asyncio.gather(*(_fetch_one(n, calls[n], deadlines[n]) for n in names))
+    return dict(zip(names, results))
+
+def fetch_all(calls: Dict[str, Dict[str, Any]],
+              deadlines: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, Any]]:
+    """Blocking wrapper around fetch_all_async for scripts (e.g. the Streamlit thread)."""
+    return asyncio.run(fetch_all_async(calls, deadlines))
+
+# ----------------------------- Safe single-source helpers ----------------------------- #
+def fetch_remotive_jobs(query: str, location: str) -> List[Dict[str, Any]]:
+    return fetch_all({"remotive": {"query": query, "location": location}})["remotive"]["items"]
+
+def try_devpost_upcoming() -> List[Dict[str, Any]]:
+    return fetch_all({"devpost": {}})["devpost"]["items"]
+
+def try_sports_leagues() -> List[Dict[str, Any]]:
+    return fetch_all({"sports": {}})["sports"]["items"]
@@ -0,0 +1,153 @@
+# ocr.py — OCR fallback for PDF pages without a text layer (scanned resumes)
+#
+#   queue = default_queue()                         # None when OCR is off or Tesseract is missing
+#   fut = queue.submit(render_page(page))           # bounded: blocks (or returns None) when full
+#   text = fut.result()
+#
+# parse_resume renders only the pages whose text layer is empty and that carry an
+# image, and hands them to an OcrQueue: a small thread pool running the local
+# `tesseract` binary (one subprocess per page, so threads never hold the GIL while
+# it works). At most `max_pending` page images are queued or running at once, which
+# bounds memory and CPU however large the upload is. Results are cached per page
+# image (by content hash) in any get/put store — ResumeCache passes itself, so pages
+# are never OCR'd twice across reruns, sessions or restarts — and a page already in
+# flight is joined instead of queued again.
+import io
+import os
+import shutil
+import hashlib
+import threading
+import functools
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from tracing import span
+
+OCR_ENABLED = os.environ.get("GAP_MAPPER_OCR", "1") != "0"
+OCR_CMD = os.environ.get("GAP_MAPPER_OCR_CMD", "tesseract")
+OCR_LANG = os.environ.get("GAP_MAPPER_OCR_LANG", "eng")
+# Concurrent Tesseract processes, and page images allowed to wait or run at once.
+OCR_WORKERS = int(os.environ.get("GAP_MAPPER_OCR_WORKERS", "2"))
+OCR_QUEUE = int(os.environ.get("GAP_MAPPER_OCR_QUEUE", "16"))
+# 200 dpi grayscale is plenty for résumé-sized type and keeps page images around 0.5 MB.
+OCR_DPI = 200
+OCR_TIMEOUT = 60
+
+
+@functools.lru_cache(maxsize=None)
+def available() -> bool:
+    """OCR is on (GAP_MAPPER_OCR != 0) and the Tesseract binary is on PATH."""
+    return OCR_ENABLED and shutil.which(OCR_CMD) is not None
+
+def needs_ocr(page, text: Optional[str]) -> bool:
+    """A pdfplumber page with no extractable text but at least one image: likely a scan."""
+    return not (text or "").strip() and bool(page.images)
+
+def render_page(page, dpi: int = OCR_DPI) -> bytes:
+    """Rasterize a pdfplumber page to grayscale PNG bytes for the OCR engine."""
+    image = page.to_image(resolution=dpi).original.convert("L")
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+def run_tesseract(png: bytes) -> str:
+    """OCR one page image with the local Tesseract CLI (stdin -> stdout)."""
+    # one thread per process: the queue already runs several pages side by side
+    env = dict(os.environ, OMP_THREAD_LIMIT="1")
+    proc = subprocess.run([OCR_CMD, "stdin", "stdout", "-l", OCR_LANG], input=png, env=env,
+                          capture_output=True, timeout=OCR_TIMEOUT, check=True)
+    return proc.stdout.decode("utf-8", errors="ignore").strip()
+
+
+class _MemoryCache:
+    """Fallback per-page cache (LRU) when the queue is not given a shared store."""
+
+    def __init__(self, max_items: int = 256):
+        self.max_items = max_items
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+            return self._items.get(key)
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+
+class OcrQueue:
+    """Bounded background OCR of page images with a per-page result cache."""
+
+    def __init__(self, workers: int = OCR_WORKERS, max_pending: int = OCR_QUEUE, cache=None,
+                 engine: Callable[[bytes], str] = run_tesseract):
+        self.cache = cache if cache is not None else _MemoryCache()
+        self.engine = engine
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="ocr")
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"pages": 0, "cache_hits": 0, "joined": 0, "failed": 0, "rejected": 0}
+
+    def submit(self, png: bytes, block: bool = True, timeout: Optional[float] = None) -> Optional[Future]:
+        """
+        Future of the page's text. Cached pages resolve at once and pages already queued are
+        joined; otherwise wait for a free slot (or give up: None when block=False / timeout).
+        """
+        key = f"ocr:{OCR_LANG}:{hashlib.sha256(png).hexdigest()}"
+        text = self.cache.get(key)
+        if text is not None:
+            self.stats["cache_hits"] += 1
+            fut: Future = Future()
+            fut.set_result(text)
+            return fut
+        with self._lock:
+            if key in self._inflight:
+                self.stats["joined"] += 1
+                return self._inflight[key]
+        if not self._slots.acquire(blocking=block, timeout=timeout):
+            self.stats["rejected"] += 1
+            return None
+        with self._lock:
+            if key in self._inflight:          # queued by another caller while we waited
+                self._slots.release()
+                self.stats["joined"] += 1
+                return self._inflight[key]
+            fut = self._pool.submit(self._run, key, png)
+            self._inflight[key] = fut
+        fut.add_done_callback(lambda _f: self._done(key))
+        return fut
+
+    def _done(self, key: str) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        self._slots.release()
+
+    def _run(self, key: str, png: bytes) -> str:
+        with span("ocr.page") as s:
+            s["bytes"] = len(png)
+            try:
+                text = self.engine(png)
+            except Exception:
+                self.stats["failed"] += 1
+                raise
+            s["chars"] = len(text)
+        self.stats["pages"] += 1
+        self.cache.put(key, text)
+        return text
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+
+@functools.lru_cache(maxsize=None)
+def default_queue() -> Optional[OcrQueue]:
+    """Process-wide queue for callers without a ResumeCache (batch without --cache-dir), if OCR is available."""
+    return OcrQueue() if available() else None
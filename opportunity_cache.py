@@ -0,0 +1,204 @@
+# opportunity_cache.py — Stale-while-revalidate cache for live opportunity feeds
+#
+# The last good snapshot of every (source, arguments) pair is kept in a cache
+# backend (cache_backend.py): in this process by default, or in a shared SQLite
+# file so every replica serves and refreshes the same snapshots. Reads never
+# block on upstream once a snapshot exists: stale snapshots are served
+# immediately while a background worker refreshes them, and a failed refresh
+# keeps the old data (with its age) instead of dropping to fallbacks. Fetches
+# are single-flight per snapshot across threads and replicas: a cold miss waits
+# for a fetch already in flight, and a stale snapshot is refreshed only once.
+import json
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+import live_sources
+from cache_backend import CacheBackend, MemoryBackend
+from tracing import tracer
+
+# After a failed refresh, wait this long before trying upstream again.
+RETRY_AFTER_SECONDS = 60
+# Snapshots unused for this long are dropped from the backend.
+SNAPSHOT_TTL = 7 * 86400
+# Longest a fetch may hold its single-flight lease (above every source deadline).
+FETCH_LEASE = max(live_sources.DEFAULT_DEADLINES.values()) + 5
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def format_age(seconds: float) -> str:
+    """Human-readable snapshot age: 'just now', '12 min ago', '3 h ago', '2 d ago'."""
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h ago"
+    return f"{int(seconds // 86400)} d ago"
+
+
+class OpportunityCache:
+    """
+    get()/get_many() return snapshots:
+      {"items", "fetched_at", "age", "status", "error"}
+    where status is "fresh" (younger than ttl), "stale" (served while a refresh runs),
+    "miss" (fetched synchronously just now) or "unavailable" (no data ever fetched).
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 1800,
+                 refresh_workers: int = 2):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="opp-refresh")
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    # ----------------------------- Snapshot storage ----------------------------- #
+    @staticmethod
+    def _key(source: str, kwargs: Dict[str, Any]) -> str:
+        return f"{source}:{json.dumps(kwargs, sort_keys=True)}"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.backend.get(f"snapshot:{key}")
+
+    def _store(self, key: str, snap: Dict[str, Any]) -> None:
+        self.backend.set(f"snapshot:{key}", snap, ttl=SNAPSHOT_TTL)
+
+    # ----------------------------- Metrics ----------------------------- #
+    def _count(self, source: str, counter: str, latency: Optional[float] = None) -> None:
+        with self._lock:
+            s = self._stats.setdefault(source, {
+                "hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "refreshes": 0, "errors": 0,
+                "latencies": deque(maxlen=200),
+            })
+            s[counter] += 1
+            if latency is not None:
+                s["latencies"].append(latency)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source counters plus fetch latency (last / p50 / p95 seconds)."""
+        out = {}
+        with self._lock:
+            for source, s in self._stats.items():
+                lat = list(s["latencies"])
+                out[source] = {k: v for k, v in s.items() if k != "latencies"}
+                out[source].update({
+                    "latency_last": lat[-1] if lat else 0.0,
+                    "latency_p50": _percentile(lat, 50),
+                    "latency_p95": _percentile(lat, 95),
+                })
+        return out
+
+    # ----------------------------- Fetching ----------------------------- #
+    def _fetch(self, calls: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Fetch sources concurrently and fold results into snapshots; keeps old data on failure."""
+        results = live_sources.fetch_all(calls)
+        now = time.time()
+        for source, res in results.items():
+            key = self._key(source, calls[source])
+            self._count(source, "refreshes" if res["ok"] else "errors", res["seconds"])
+            if res["ok"]:
+                self._store(key, {"key": key, "items": res["items"], "fetched_at": now,
+                                  "attempted_at": now, "error": ""})
+                continue
+            # keep the last good data; with none, remember the failure so reruns don't hammer upstream
+            old = self._load(key) or {"key": key, "items": [], "fetched_at": None}
+            self._store(key, dict(old, attempted_at=now, error=res["error"]))
+        return results
+
+    def _fetch_coalesced(self, calls: Dict[str, Dict[str, Any]], since: float) -> None:
+        """
+        Fetch cold snapshots, concurrently for every source whose fetch lease we get; for
+        the rest a fetch is already in flight elsewhere, so wait for its snapshot instead.
+        """
+        leased = {s: kw for s, kw in calls.items() if self.backend.acquire(f"fetch:{self._key(s, kw)}", FETCH_LEASE)}
+        try:
+            if leased:
+                self._fetch(leased)
+        finally:
+            for source, kwargs in leased.items():
+                self.backend.release(f"fetch:{self._key(source, kwargs)}")
+        for source, kwargs in calls.items():
+            if source in leased:
+                continue
+            key = self._key(source, kwargs)
+            self._count(source, "coalesced")
+            self.backend.single_flight(
+                f"fetch:{key}", lambda: self._fetch({source: kwargs}),
+                done=lambda: (self._load(key) or {}).get("attempted_at", 0) >= since, lease=FETCH_LEASE)
+
+    def _refresh_in_background(self, source: str, kwargs: Dict[str, Any], key: str) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def job():
+            try:
+                # another replica may already be refreshing this snapshot; then leave it to them
+                if self.backend.acquire(f"fetch:{key}", FETCH_LEASE):
+                    try:
+                        self._fetch({source: kwargs})
+                    finally:
+                        self.backend.release(f"fetch:{key}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._pool.submit(job)
+
+    def _view(self, snap: Optional[Dict[str, Any]], status: str) -> Dict[str, Any]:
+        if snap is None or snap.get("fetched_at") is None:
+            return {"items": [], "fetched_at": None, "age": None, "status": "unavailable",
+                    "error": (snap or {}).get("error", "")}
+        return {"items": snap["items"], "fetched_at": snap["fetched_at"],
+                "age": time.time() - snap["fetched_at"], "status": status, "error": snap.get("error", "")}
+
+    def get_many(self, calls: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot per source for e.g. {"devpost": {}, "sports": {}}.
+        Only sources with no snapshot at all are fetched inline (concurrently);
+        stale ones are returned as-is and refreshed in the background.
+        """
+        out: Dict[str, Dict[str, Any]] = {}
+        missing: Dict[str, Dict[str, Any]] = {}
+        now = time.time()
+        for source, kwargs in calls.items():
+            key = self._key(source, kwargs)
+            snap = self._load(key)
+            if snap is None or snap["fetched_at"] is None:
+                if snap is not None and now - snap["attempted_at"] < RETRY_AFTER_SECONDS:
+                    self._count(source, "misses")
+                    out[source] = self._view(snap, "unavailable")
+                else:
+                    missing[source] = kwargs
+                continue
+            if now - snap["fetched_at"] < self.ttl:
+                self._count(source, "hits")
+                out[source] = self._view(snap, "fresh")
+                continue
+            self._count(source, "stale_hits")
+            if not snap.get("error") or now - snap.get("attempted_at", 0) >= RETRY_AFTER_SECONDS:
+                self._refresh_in_background(source, kwargs, key)
+            out[source] = self._view(snap, "stale")
+        if missing:
+            for source in missing:
+                self._count(source, "misses")
+            self._fetch_coalesced(missing, now)
+            for source, kwargs in missing.items():
+                out[source] = self._view(self._load(self._key(source, kwargs)), "miss")
+        seconds = round(time.time() - now, 6)
+        for source in calls:
+            tracer.record(f"opportunity_cache.{source}", {"seconds": seconds, "cache": out[source]["status"]})
+        return {source: out[source] for source in calls}
+
+    def get(self, source: str, **kwargs) -> Dict[str, Any]:
+        return self.get_many({source: kwargs})[source]
@@ -0,0 +1,190 @@
+# opportunity_store.py — Columnar (Arrow/Parquet) store for live events and opportunities
+#
+#   store = OpportunityStore(".cache/opportunities.parquet")   # one per process
+#   store.replace("devpost", items, field="Technology")        # one partition, normalized to SCHEMA
+#   page, total = store.query(field="Technology", country="India", city="Delhi",
+#                             since=datetime.date.today(), sort="start", limit=20, offset=0)
+#
+# Rows from every feed live in one Arrow table, partitioned by a string key (a
+# source plus its arguments, e.g. "sports:India") so a refresh swaps only its own
+# rows. Filters run as Arrow compute kernels over whole columns, and sorting
+# yields indices so only the requested page is materialized and sent to the UI.
+import os
+import re
+import datetime as dt
+import tempfile
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from tracing import traced
+
+SCHEMA = pa.schema([
+    ("partition", pa.string()),
+    ("field", pa.string()),
+    ("name", pa.string()),
+    ("org", pa.string()),
+    ("category", pa.string()),
+    ("country", pa.string()),
+    ("city", pa.string()),
+    ("start", pa.date32()),
+    ("end", pa.date32()),
+    ("dates", pa.string()),
+    ("link", pa.string()),
+])
+# Columns shown in tables (partition is bookkeeping only).
+DISPLAY_COLUMNS = ["name", "org", "category", "city", "country", "start", "end", "dates", "link"]
+# Rows in these cities are kept whatever city is selected.
+ANY_CITY = ("online", "varies", "")
+
+
+# Devpost's display ranges: "Jan 05 - 12, 2026", "Feb 01 - Mar 03, 2026", "Dec 15, 2025 - Jan 10, 2026", "Jan 05, 2026".
+_DISPLAY_RANGE = re.compile(
+    r"([A-Za-z]{3})[a-z]*\.? (\d{1,2})(?:, (\d{4}))?(?: ?[-–] ?(?:([A-Za-z]{3})[a-z]*\.? )?(\d{1,2}), (\d{4}))?")
+_MONTHS = {m: i for i, m in enumerate(("jan", "feb", "mar", "apr", "may", "jun",
+                                       "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+
+
+def parse_date(value: Any) -> Optional[dt.date]:
+    """ISO-ish date prefix ("2026-01-10", "2026-01-10T09:00:00Z") -> date; anything else -> None."""
+    try:
+        return dt.date.fromisoformat(str(value or "")[:10])
+    except ValueError:
+        return None
+
+def parse_date_range(text: Any) -> Tuple[Optional[dt.date], Optional[dt.date]]:
+    """Devpost-style display range -> (start, end); (None, None) when it is not one."""
+    m = _DISPLAY_RANGE.fullmatch(str(text or "").strip())
+    if not m:
+        return None, None
+    mon1, day1, year1, mon2, day2, year2 = m.groups()
+    try:
+        if day2 is None:                     # a single day: "Jan 05, 2026"
+            if year1 is None:
+                return None, None
+            start = dt.date(int(year1), _MONTHS[mon1.lower()], int(day1))
+            return start, start
+        end = dt.date(int(year2), _MONTHS[(mon2 or mon1).lower()], int(day2))
+        start = dt.date(int(year1 or year2), _MONTHS[mon1.lower()], int(day1))
+        if start > end and year1 is None:    # "Dec 20 - Jan 05, 2026" spans the new year
+            start = start.replace(year=start.year - 1)
+        return start, end
+    except (KeyError, ValueError):
+        return None, None
+
+
+class OpportunityStore:
+    """
+    Process-wide columnar store. The table is immutable and swapped under a lock,
+    so queries never block on a concurrent replace() and can be shared across sessions.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._table = SCHEMA.empty_table()
+        self._stamps: Dict[str, float] = {}
+        if path and os.path.exists(path):
+            try:
+                self._table = pq.read_table(path).cast(SCHEMA)
+            except (OSError, pa.ArrowException):
+                pass
+
+    # ----------------------------- Writing ----------------------------- #
+    def rows_for(self, partition: str, items: List[Dict[str, Any]], **defaults) -> pa.Table:
+        """Feed items (name/org/sport/city/start/end/dates/link dicts) -> one partition's Arrow table."""
+        cols: Dict[str, List[Any]] = {name: [] for name in SCHEMA.names}
+        for item in items:
+            row = {**defaults, **item}
+            cols["partition"].append(partition)
+            start, end = parse_date(row.get("start")), parse_date(row.get("end"))
+            if start is None and end is None:
+                # feeds that only publish a display string ("Jan 05 - 12, 2026"), so past events
+                # are not mistaken for undated ones and kept as upcoming
+                start, end = parse_date_range(row.get("dates") or row.get("start"))
+            cols["start"].append(start)
+            cols["end"].append(end)
+            cols["category"].append(str(row.get("category") or row.get("sport") or ""))
+            for name in ("field", "name", "org", "country", "city", "dates", "link"):
+                cols[name].append(str(row.get(name) or ""))
+        return pa.table(cols, schema=SCHEMA)
+
+    @traced("opportunity_store.replace", attrs=lambda self, partition, items, **kw: {"items": len(items)})
+    def replace(self, partition: str, items: List[Dict[str, Any]], **defaults) -> None:
+        """Swap one partition's rows; `defaults` fills columns the feed lacks (field, country, ...)."""
+        new = self.rows_for(partition, items, **defaults)
+        with self._lock:
+            keep = pc.not_equal(self._table["partition"], partition)
+            self._table = pa.concat_tables([self._table.filter(keep), new]).combine_chunks()
+            table = self._table
+        if self.path:
+            self._save(table)
+
+    def sync(self, partition: str, fetched_at: Optional[float], items: List[Dict[str, Any]], **defaults) -> None:
+        """replace() only when the feed snapshot changed (by its fetch time), so reruns cost nothing."""
+        if fetched_at is None or self._stamps.get(partition) == fetched_at:
+            return
+        self._stamps[partition] = fetched_at
+        self.replace(partition, items, **defaults)
+
+    def _save(self, table: pa.Table) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".parquet.tmp")
+            os.close(fd)
+            pq.write_table(table, tmp)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    # ----------------------------- Reading ----------------------------- #
+    def count(self) -> int:
+        return self._table.num_rows
+
+    def _mask(self, table: pa.Table, field: Optional[str], partitions: Optional[List[str]],
+              country: Optional[str], city: Optional[str], since: Optional[dt.date]):
+        conditions = []
+        if field:
+            conditions.append(pc.equal(table["field"], field))
+        if partitions is not None:
+            conditions.append(pc.is_in(table["partition"], value_set=pa.array(partitions, pa.string())))
+        if country:
+            conditions.append(pc.is_in(table["country"], value_set=pa.array([country, ""])))
+        if city:
+            lowered = pc.utf8_lower(table["city"])
+            conditions.append(pc.or_(pc.equal(lowered, city.lower()),
+                                     pc.is_in(lowered, value_set=pa.array(ANY_CITY))))
+        if since:
+            # undated rows ("Check federation calendar") stay visible
+            upcoming = pc.greater_equal(pc.coalesce(table["end"], table["start"]), pa.scalar(since, pa.date32()))
+            conditions.append(pc.fill_null(upcoming, True))
+        mask = None
+        for cond in conditions:
+            mask = cond if mask is None else pc.and_(mask, cond)
+        return mask
+
+    @traced("opportunity_store.query")
+    def query(self, field: Optional[str] = None, partitions: Optional[List[str]] = None,
+              country: Optional[str] = None, city: Optional[str] = None, since: Optional[dt.date] = None,
+              sort: Optional[str] = None, descending: bool = False,
+              limit: int = 20, offset: int = 0) -> Tuple[pa.Table, int]:
+        """
+        Filter, sort and slice in Arrow. Returns (one page of DISPLAY_COLUMNS, total matches).
+        `country`/`city` also keep online/global rows; `since` keeps rows not yet over.
+        """
+        table = self._table
+        mask = self._mask(table, field, partitions, country, city, since)
+        matched = table if mask is None else table.filter(mask)
+        total = matched.num_rows
+        if sort:
+            order = pc.sort_indices(matched, sort_keys=[(sort, "descending" if descending else "ascending")],
+                                    null_placement="at_end")
+            page = matched.take(order[offset:offset + limit])
+        else:
+            page = matched.slice(offset, limit)
+        return page.select(DISPLAY_COLUMNS), total
+
@@ -0,0 +1,83 @@
+# pipeline.py — Session-scoped, memoized resume analysis
+#
+#   pipe = AnalysisPipeline(resume_cache)          # one per Streamlit session
+#   prof = pipe.profile(digest, text)              # extraction: depends on the resume only
+#   result = pipe.gaps(digest, text, "Business")   # only this stage reruns when the field changes
+#   table = pipe.compare(digest, text)             # every field, from the same single extraction
+#   links = pipe.next_steps("Business")            # course links; depends on the field only
+#
+# Each stage keeps its last few results keyed by exactly the inputs it depends
+# on, so a rerun triggered by a different field reuses the extracted profile and
+# only re-evaluates the field rules, and flipping back to an earlier field is a
+# lookup. Hits and recomputes are recorded per stage as "pipeline.<stage>" spans.
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Callable, Hashable, Optional
+
+from resume_analysis import analyze_gaps
+from field_rules import load_rules
+from job_matching import profile_text
+from resume_cache import text_digest
+from tracing import tracer
+
+
+class AnalysisPipeline:
+    """Memoized stages: profile(resume) -> gaps(resume, field) / compare(resume) / match_text(resume)."""
+
+    def __init__(self, resume_cache, links: Optional[Callable[[str], Dict[str, str]]] = None,
+                 entries_per_stage: int = 16):
+        self.resume_cache = resume_cache
+        self.links = links
+        self.entries_per_stage = entries_per_stage
+        self._memo: Dict[str, "OrderedDict[Hashable, Any]"] = {}
+
+    def _stage(self, name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        memo = self._memo.setdefault(name, OrderedDict())
+        t0 = time.perf_counter()
+        if key in memo:
+            memo.move_to_end(key)
+            tracer.record(f"pipeline.{name}", {"seconds": round(time.perf_counter() - t0, 6), "cache": "hit"})
+            return memo[key]
+        value = memo[key] = compute()
+        while len(memo) > self.entries_per_stage:
+            memo.popitem(last=False)
+        tracer.record(f"pipeline.{name}", {"seconds": round(time.perf_counter() - t0, 6), "cache": "recompute"})
+        return value
+
+    def session_bytes(self) -> int:
+        """This session's memoized results only; the shared resume cache is accounted elsewhere."""
+        from session_memory import deep_size
+        return deep_size(self._memo)
+
+    # ----------------------------- Stages ----------------------------- #
+    @staticmethod
+    def _resume(digest: str, text: str) -> Hashable:
+        """Resume stages key on the text as well: an OCR re-parse changes it under the same digest."""
+        return digest, text_digest(text)
+
+    def profile(self, digest: str, text: str) -> Dict[str, Any]:
+        """Extracted profile; field-independent, so computed once per resume."""
+        return self._stage("profile", self._resume(digest, text),
+                           lambda: self.resume_cache.resume_profile(digest, text))
+
+    def gaps(self, digest: str, text: str, field: str) -> Dict[str, Any]:
+        """analyze_gaps for one field, reusing the memoized profile."""
+        return self._stage("gaps", (self._resume(digest, text), field),
+                           lambda: analyze_gaps(self.profile(digest, text), field))
+
+    def compare(self, digest: str, text: str) -> List[Dict[str, Any]]:
+        """Every field scored from one extraction, best first: [{"field", "score", "gaps", "flags"}, ...]."""
+        def compute():
+            results = load_rules().evaluate_all(self.profile(digest, text))
+            rows = [{"field": name, "score": r["score"], "gaps": len(r["flags"]), "flags": r["flags"]}
+                    for name, r in results.items()]
+            return sorted(rows, key=lambda row: (-row["score"], row["gaps"], row["field"]))
+        return self._stage("compare", self._resume(digest, text), compute)
+
+    def match_text(self, digest: str, text: str) -> str:
+        """Resume text for job matching (see job_matching.profile_text)."""
+        return self._stage("match_text", self._resume(digest, text), lambda: profile_text(self.profile(digest, text), text))
+
+    def next_steps(self, field: str) -> Dict[str, str]:
+        """Course search links for the field's next-steps keyword (`links`, e.g. common.course_search_links)."""
+        return self._stage("next_steps", field, lambda: self.links(load_rules().rule(field).next_steps))
@@ -0,0 +1,371 @@
+# resume_analysis.py — Resume parsing, profile extraction and gap analysis
+# (no Streamlit dependency, shared by the app and the batch engine)
+import io
+import os
+import re
+import json
+import codecs
+import hashlib
+import zipfile
+import xml.etree.ElementTree as ET
+import bisect
+import functools
+import itertools
+import multiprocessing as mp
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Tuple, Optional, Iterator, Callable
+
+# PDF parsing (optional; included in requirements)
+import pdfplumber
+
+import ocr
+from field_rules import load_rules
+from skill_index import SkillIndex
+from tracing import traced
+
+FIELDS: List[str] = load_rules().names
+
+# Uploads above this are refused before parsing (GAP_MAPPER_MAX_UPLOAD_MB, default 10).
+MAX_UPLOAD_BYTES = int(float(os.environ.get("GAP_MAPPER_MAX_UPLOAD_MB", "10")) * 1024 * 1024)
+# Extracted text is cut here (GAP_MAPPER_MAX_TEXT_CHARS); real resumes are a few thousand characters.
+MAX_TEXT_CHARS = int(os.environ.get("GAP_MAPPER_MAX_TEXT_CHARS", "500000"))
+READ_CHUNK = 1 << 20
+
+
+class UploadTooLarge(ValueError):
+    """The upload is bigger than the configured MAX_UPLOAD_BYTES."""
+
+class NamedBytesIO(io.BytesIO):
+    """BytesIO with a .name, which is all parse_resume needs from an upload."""
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+
+# ----------------------------- Resume Parsing ----------------------------- #
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_PART = re.compile(r"word/(header|document|footer)[0-9]*\.xml$")
+
+def _docx_part_text(stream) -> str:
+    """
+    Stream one WordprocessingML part and return its text, matching docx2txt's output:
+    paragraphs open with a blank line, <w:tab/> -> tab, <w:br/>/<w:cr/> -> newline.
+    """
+    out = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == _W + "p":
+                out.append("\n\n")
+            elif tag == _W + "tab":
+                out.append("\t")
+            elif tag in (_W + "br", _W + "cr"):
+                out.append("\n")
+        elif tag == _W + "t":
+            out.append(elem.text or "")
+            elem.clear()
+        elif tag == _W + "p":
+            elem.clear()  # keep memory flat on long documents
+    return "".join(out)
+
+def docx_text(data: bytes) -> str:
+    """
+    Extract text from DOCX bytes entirely in memory (headers, body, then footers).
+    No temp files, so concurrent sessions can never read each other's upload.
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        parts = [n for n in zf.namelist() if _DOCX_PART.match(n)]
+        order = {"header": 0, "document": 1, "footer": 2}
+        parts.sort(key=lambda n: order[_DOCX_PART.match(n).group(1)])
+        texts = []
+        for name in parts:
+            with zf.open(name) as stream:
+                texts.append(_docx_part_text(stream))
+    return "".join(texts).strip()
+
+def _page_text(page, render: bool) -> Tuple[str, Optional[bytes]]:
+    """
+    (text, scan) of a pdfplumber page. `scan` is None when the page has a text layer; for
+    image-only pages it is the rendered PNG (render=True) or b"" when OCR is off.
+    """
+    text = page.extract_text() or ""
+    if not ocr.needs_ocr(page, text):
+        return text, None
+    return "", ocr.render_page(page) if render else b""
+
+def _pdf_pages_slice(data: bytes, start: int, stop: int, render: bool = False) -> List[Tuple[str, Optional[bytes]]]:
+    """Extract pages [start, stop) of a PDF; runs in a worker process for parallel extraction."""
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        out = []
+        for page in pdf.pages[start:stop]:
+            out.append(_page_text(page, render))
+            page.close()  # drop parsed layout objects as we go
+        return out
+
+_pdf_pools: Dict[int, ProcessPoolExecutor] = {}
+
+def _pdf_pool(workers: int) -> ProcessPoolExecutor:
+    """Long-lived pool per size; forkserver/spawn so forking a threaded server is safe."""
+    if workers not in _pdf_pools:
+        method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        _pdf_pools[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context(method))
+    return _pdf_pools[workers]
+
+def iter_pdf_pages(data: bytes, max_pages: Optional[int] = None, workers: int = 1,
+                   chunk_pages: int = 4, render: bool = False) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """
+    Yield (text, scan) for each PDF page, in order, as soon as it is available (see _page_text;
+    only image-only pages are rendered, and only with render=True).
+    With workers > 1 page chunks are extracted in parallel processes; closing the
+    generator early (page/char budget reached) cancels the chunks not yet started.
+    """
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        n_pages = len(pdf.pages)
+        if max_pages is not None:
+            n_pages = min(n_pages, max_pages)
+        if workers <= 1 or n_pages <= chunk_pages:
+            for page in pdf.pages[:n_pages]:
+                yield _page_text(page, render)
+                page.close()
+            return
+
+    pool = _pdf_pool(workers)
+    futures = [pool.submit(_pdf_pages_slice, data, start, min(start + chunk_pages, n_pages), render)
+               for start in range(0, n_pages, chunk_pages)]
+    try:
+        for fut in futures:
+            yield from fut.result()
+    finally:
+        for fut in futures:
+            fut.cancel()
+
+def read_upload(file, max_bytes: int = MAX_UPLOAD_BYTES) -> bytes:
+    """
+    Read an upload from the start in READ_CHUNK pieces, refusing it (UploadTooLarge)
+    from its declared size, or as soon as the bytes read pass `max_bytes`.
+    """
+    size = getattr(file, "size", None)
+    if size is not None and size > max_bytes:
+        raise UploadTooLarge(f"{file.name} is {size} bytes; the limit is {max_bytes}")
+    if hasattr(file, "seek"):
+        file.seek(0)
+    chunks, total = [], 0
+    while True:
+        chunk = file.read(READ_CHUNK)
+        if not chunk:
+            return b"".join(chunks)
+        total += len(chunk)
+        if total > max_bytes:
+            raise UploadTooLarge(f"{file.name} is over the {max_bytes}-byte limit")
+        chunks.append(chunk)
+
+def _read_text(file, max_bytes: int, max_chars: int) -> str:
+    """Decode a text upload chunk by chunk, stopping once max_chars are in hand."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    out, n_chars, total = [], 0, 0
+    while n_chars < max_chars:
+        chunk = file.read(READ_CHUNK)
+        total += len(chunk)
+        if total > max_bytes:
+            raise UploadTooLarge(f"{file.name} is over the {max_bytes}-byte limit")
+        text = decoder.decode(chunk, final=not chunk)
+        out.append(text)
+        n_chars += len(text)
+        if not chunk:
+            break
+    return "".join(out)[:max_chars]
+
+def _upload_attrs(file, *args, **kwargs) -> Dict[str, Any]:
+    if file is None:
+        return {}
+    attrs = {"format": os.path.splitext(file.name)[1].lower().lstrip(".")}
+    if hasattr(file, "getbuffer"):
+        with file.getbuffer() as buf:
+            attrs["bytes"] = buf.nbytes
+    return attrs
+
+def _ocr_pages(full_text: List[str], futures: Dict[int, Future], report: Dict[str, int],
+               progress: Optional[Callable[[int, int], None]]) -> None:
+    """Wait for the queued OCR pages, filling their slots in `full_text` and reporting progress."""
+    if progress:
+        progress(0, len(futures))
+    slot = {fut: i for i, fut in futures.items()}
+    for done, fut in enumerate(as_completed(slot), 1):
+        try:
+            full_text[slot[fut]] = fut.result()
+            report["ocr_pages"] += 1
+        except Exception:
+            report["ocr_failed"] += 1    # engine error or timeout: the page stays empty
+        if progress:
+            progress(done, len(futures))
+
+@traced("parse_resume", attrs=_upload_attrs, result=lambda text: {"chars": len(text)})
+def parse_resume(file, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                 workers: int = 1, max_bytes: int = MAX_UPLOAD_BYTES, ocr_queue: Optional["ocr.OcrQueue"] = None,
+                 report: Optional[Dict[str, int]] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> str:
+    """
+    Return the raw text of a resume file (pdf, docx, txt), at most MAX_TEXT_CHARS long.
+    For PDFs, `max_pages`/`max_chars` stop extraction early (whole pages, so the text may run
+    slightly past max_chars) and `workers` > 1 extracts pages in parallel processes.
+    PDF pages without a text layer (scans) are rendered and OCR'd through `ocr_queue`, if
+    given, while the remaining pages are extracted; `progress(done, total)` follows the OCR
+    pages and `report` is filled with page counts (pages, image_pages, ocr_pages, ocr_failed).
+    Text files are decoded as they are read and stop at max_chars. Uploads larger than
+    `max_bytes` raise UploadTooLarge.
+    """
+    if file is None:
+        return ""
+    name = file.name.lower()
+    limit = min(max_chars or MAX_TEXT_CHARS, MAX_TEXT_CHARS)
+    if report is None:
+        report = {}
+    report.update(pages=0, image_pages=0, ocr_pages=0, ocr_failed=0)
+    if name.endswith(".pdf"):
+        full_text: List[str] = []
+        futures: Dict[int, Future] = {}
+        n_chars = 0
+        pages = iter_pdf_pages(read_upload(file, max_bytes), max_pages=max_pages, workers=workers,
+                               render=ocr_queue is not None)
+        try:
+            for text, scan in pages:
+                report["pages"] += 1
+                if scan is not None:
+                    report["image_pages"] += 1
+                    # blocks while the OCR queue is full, which also paces extraction
+                    fut = ocr_queue.submit(scan) if scan else None
+                    if fut is not None:
+                        futures[len(full_text)] = fut
+                full_text.append(text)
+                n_chars += len(text) + 1
+                if n_chars >= limit:
+                    break
+        finally:
+            pages.close()
+        if futures:
+            _ocr_pages(full_text, futures, report, progress)
+        return "\n".join(full_text)[:MAX_TEXT_CHARS]
+    elif name.endswith(".docx"):
+        return docx_text(read_upload(file, max_bytes))[:MAX_TEXT_CHARS]
+    else:
+        # assume text
+        if hasattr(file, "seek"):
+            file.seek(0)
+        return _read_text(file, max_bytes, limit)
+
+# ----------------------------- Profile & Gaps ----------------------------- #
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SKILLS_FILE = os.path.join(DATA_DIR, "skills.txt")
+ALIASES_FILE = os.path.join(DATA_DIR, "skill_aliases.json")
+NOT_TYPOS_FILE = os.path.join(DATA_DIR, "not_typos.txt")
+
+# Fixed keyword categories (matched as whole, plural-folded words); skills come from SKILLS_FILE.
+KEYWORD_CATEGORIES: Dict[str, List[str]] = {
+    "edu": ["b.tech", "btech", "m.tech", "mtech", "bsc", "msc", "mba", "b.com", "bcom", "mbbs",
+            "md", "bpt", "bba", "phd", "diploma", "high school"],
+    "project": ["project", "capstone", "portfolio", "github"],
+    "intern": ["intern", "internship", "trainee"],
+    "cert": ["certificate", "certification", "certified", "coursera", "udemy", "edx"],
+}
+# "N years"/"N+ yrs": the unit words are index terms, the number is read backwards from the hit.
+EXP_UNITS = ["years", "yrs"]
+# Bump when extract_profile's output changes for the same inputs (invalidates cached profiles).
+EXTRACTOR_REVISION = 3
+
+def load_skill_vocabulary(path: str = SKILLS_FILE) -> List[str]:
+    """Read one skill term per line (blank lines and # comments ignored)."""
+    with open(path, encoding="utf-8") as f:
+        terms = {line.strip().lower() for line in f}
+    return sorted(t for t in terms if t and not t.startswith("#"))
+
+@functools.lru_cache(maxsize=None)
+def load_not_typos(path: str = NOT_TYPOS_FILE) -> Tuple[str, ...]:
+    """Real words never read as one-typo skill matches (() when the file is absent)."""
+    return tuple(load_skill_vocabulary(path)) if os.path.exists(path) else ()
+
+@functools.lru_cache(maxsize=None)
+def load_skill_aliases(path: str = ALIASES_FILE) -> Dict[str, List[str]]:
+    """canonical skill -> other spellings ({} when the file is absent)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return {k.lower(): list(v) for k, v in json.load(f).items()}
+
+@functools.lru_cache(maxsize=None)
+def load_term_index(skills_path: str = SKILLS_FILE, aliases_path: str = ALIASES_FILE) -> SkillIndex:
+    """
+    Build the normalized term index once per vocabulary: every keyword category (including
+    the experience units), the skills and their aliases. Batch workers inherit or prebuild it.
+    """
+    categories = dict(KEYWORD_CATEGORIES, exp=EXP_UNITS, skill=load_skill_vocabulary(skills_path))
+    return SkillIndex(categories, load_skill_aliases(aliases_path), not_typos=load_not_typos())
+
+@functools.lru_cache(maxsize=None)
+def profile_version(skills_path: str = SKILLS_FILE, aliases_path: str = ALIASES_FILE) -> str:
+    """Short fingerprint of the extractor inputs; cached profiles are keyed by it."""
+    h = hashlib.sha256(f"{EXTRACTOR_REVISION}|{KEYWORD_CATEGORIES}|{EXP_UNITS}".encode())
+    h.update("\n".join(load_skill_vocabulary(skills_path)).encode())
+    h.update(json.dumps(load_skill_aliases(aliases_path), sort_keys=True).encode())
+    h.update("\n".join(load_not_typos()).encode())
+    return h.hexdigest()[:12]
+
+def _years_before(lower: str, end: int) -> Optional[int]:
+    """Parse the `N` of `N+ <unit>` ending at `end` (digits, optional '+', optional spaces)."""
+    i = end
+    while i > 0 and lower[i - 1].isspace():
+        i -= 1
+    if i > 0 and lower[i - 1] == "+":
+        i -= 1
+    j = i
+    while j > 0 and lower[j - 1].isdecimal():
+        j -= 1
+    return int(lower[j:i]) if j < i else None
+
+@traced("extract_profile", attrs=lambda text: {"chars": len(text)})
+def extract_profile(text: str) -> Dict[str, Any]:
+    """
+    Super-simple keyword extractor for demo (skills, edu, exp years).
+    All categories are collected in a single scan of the lowered text (see skill_index.py);
+    skills are reported under their canonical names.
+    """
+    lower = text.lower()
+    exp_years = None
+    skills = set()
+    edu_lines: List[int] = []
+    found = {"project": False, "intern": False, "cert": False}
+    line_ends = None
+
+    for start, hits in load_term_index().scan(lower):
+        for category, term in hits:
+            if category == "skill":
+                skills.add(term)
+            elif category == "edu":
+                if line_ends is None:
+                    # lower() never adds or removes line breaks, so line indexes match `text`
+                    line_ends = list(itertools.accumulate(len(l) for l in lower.splitlines(True)))
+                idx = bisect.bisect_right(line_ends, start)
+                if not edu_lines or edu_lines[-1] != idx:
+                    edu_lines.append(idx)
+            elif category == "exp":
+                # naive year-of-experience guess: first "N years" mention
+                if exp_years is None:
+                    exp_years = _years_before(lower, start)
+            else:
+                found[category] = True
+
+    lines = text.splitlines() if edu_lines else []
+    return {
+        "exp_years": exp_years or 0,
+        "skills": sorted(skills),
+        "education": [lines[i].strip() for i in edu_lines[:5]],
+        "has_projects": found["project"],
+        "has_internship": found["intern"],
+        "has_certifications": found["cert"]
+    }
+
+@traced("analyze_gaps", attrs=lambda profile, field: {"field": field})
+def analyze_gaps(profile: Dict[str, Any], field: str) -> Dict[str, Any]:
+    """
+    Produce a basic analysis and recommendations depending on field & profile.
+    Rules live in data/field_rules.json (see field_rules.py).
+    """
+    return load_rules().evaluate(profile, field)
@@ -0,0 +1,243 @@
+# resume_cache.py — Content-hash cache for parsed resume text and extracted profiles
+#
+# Two tiers: an in-memory LRU (per process) and an optional on-disk JSON store
+# with size-based eviction, so the same upload is never parsed twice — across
+# Streamlit reruns, sessions and process restarts. With `ocr_workers` the full
+# parse also OCRs scanned PDF pages (see ocr.py); the OCR text of every page is
+# cached here too, under its image hash.
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+
+import ocr
+from resume_analysis import NamedBytesIO, parse_resume, extract_profile, profile_version
+from tracing import span
+
+
+def content_digest(data: bytes) -> str:
+    """SHA-256 of the uploaded bytes; identical files share cache entries regardless of name."""
+    return hashlib.sha256(data).hexdigest()
+
+def text_digest(text: str) -> str:
+    """Short fingerprint of parsed text: an OCR re-parse of the same upload gets a new one."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+
+class ResumeCache:
+    """
+    Thread-safe two-tier cache of JSON-serialisable values.
+    - memory: LRU with at most `max_items` entries
+    - disk (optional): one file per key under `disk_dir`, evicting least recently used
+      files once the directory exceeds `max_disk_bytes`
+    `ocr_workers` > 0 OCRs image-only PDF pages in full parses, when Tesseract is available.
+    """
+
+    def __init__(self, max_items: int = 128, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = 256 * 1024 * 1024, pdf_workers: int = 1, ocr_workers: int = 0):
+        self.max_items = max_items
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.pdf_workers = pdf_workers
+        self.ocr = ocr.OcrQueue(workers=ocr_workers, cache=self) if ocr_workers > 0 and ocr.available() else None
+        self._pending: Dict[str, Future] = {}
+        self._progress: Dict[str, Tuple[int, int]] = {}
+        self._background = ThreadPoolExecutor(max_workers=2, thread_name_prefix="resume-parse")
+        self._mem: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _p, size, _m in self._disk_entries())
+
+    # ----------------------------- Generic get/put ----------------------------- #
+    def get(self, key: str) -> Optional[Any]:
+        with span(f"resume_cache.{key.split(':', 1)[0]}") as s:
+            with self._lock:
+                if key in self._mem:
+                    self._mem.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    s["cache"] = "memory_hit"
+                    return self._mem[key]
+            value = self._disk_get(key)
+            with self._lock:
+                if value is None:
+                    self.stats["misses"] += 1
+                    s["cache"] = "miss"
+                    return None
+                self.stats["disk_hits"] += 1
+                s["cache"] = "disk_hit"
+                self._mem_put(key, value)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._mem_put(key, value)
+        self._disk_put(key, value)
+
+    def _mem_put(self, key: str, value: Any) -> None:
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_items:
+            self._mem.popitem(last=False)
+
+    # ----------------------------- Disk tier ----------------------------- #
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def _disk_entries(self):
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield entry.path, st.st_size, st.st_mtime
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+            os.utime(path)  # mtime doubles as last-access time for eviction
+        except (OSError, ValueError):
+            return None
+        return payload.get("value") if payload.get("key") == key else None
+
+    def _disk_put(self, key: str, value: Any) -> None:
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "value": value}, f)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, path)  # atomic: concurrent readers never see half a file
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes += size
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Drop least recently used files until the directory is back under 90% of the limit."""
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        total = sum(size for _p, size, _m in entries)
+        target = int(self.max_disk_bytes * 0.9)
+        for path, size, _mtime in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    # ----------------------------- Resume helpers ----------------------------- #
+    def _cached_text(self, digest: str) -> Optional[str]:
+        """Cached full text, unless it was parsed with OCR off and has scanned pages OCR could now read."""
+        text = self.get(f"text:{digest}")
+        if text is not None and self.ocr is not None:
+            report = self.get(f"pages:{digest}")
+            if report and report["image_pages"] > report["ocr_pages"] + report["ocr_failed"]:
+                return None
+        return text
+
+    def _parse_full(self, digest: str, data: bytes, name: str) -> str:
+        report: Dict[str, int] = {}
+        try:
+            text = parse_resume(NamedBytesIO(data, name), workers=self.pdf_workers, ocr_queue=self.ocr,
+                                report=report, progress=lambda done, total: self._set_progress(digest, done, total))
+        finally:
+            self._progress.pop(digest, None)
+        self.put(f"pages:{digest}", report)
+        self.put(f"text:{digest}", text)
+        return text
+
+    def _set_progress(self, digest: str, done: int, total: int) -> None:
+        self._progress[digest] = (done, total)
+
+    def progress(self, digest: str) -> Optional[Tuple[int, int]]:
+        """(done, total) OCR pages of a full parse still running for `digest`, if it is OCRing."""
+        return self._progress.get(digest)
+
+    def page_report(self, digest: str) -> Optional[Dict[str, int]]:
+        """Page counts of the last full parse: pages, image_pages, ocr_pages, ocr_failed."""
+        return self.get(f"pages:{digest}")
+
+    def _parse_in_background(self, digest: str, data: bytes, name: str) -> Future:
+        """Start (or join) the full extraction of an upload; one job per digest."""
+        with self._lock:
+            fut = self._pending.get(digest)
+            if fut is None:
+                fut = self._background.submit(self._parse_full, digest, data, name)
+                self._pending[digest] = fut
+                fut.add_done_callback(lambda _f: self._pending.pop(digest, None))
+        return fut
+
+    def ready(self, digest: str) -> bool:
+        """No background parse of `digest` is running (resume_text() will not wait)."""
+        with self._lock:
+            return digest not in self._pending
+
+    def resume_text(self, data: bytes, name: str) -> Tuple[str, str]:
+        """Return (digest, full text) for an upload, parsing only on a cache miss."""
+        digest = content_digest(data)
+        text = self._cached_text(digest)
+        if text is None:
+            with self._lock:
+                fut = self._pending.get(digest)
+            if fut is not None:
+                text = fut.result()
+            else:
+                # the background job may have finished between the two lookups
+                text = self._cached_text(digest)
+                if text is None:
+                    text = self._parse_full(digest, data, name)
+        return digest, text
+
+    def resume_preview(self, data: bytes, name: str, max_chars: int) -> Tuple[str, str, bool]:
+        """
+        Return (digest, text, complete) quickly for display. Cached or non-PDF uploads come back
+        complete; for a new PDF only the first ~max_chars of pages are extracted now and the
+        full text continues in a background thread (resume_text() later joins it). The preview
+        never OCRs; scanned pages are left to the background parse (see progress()). It is kept
+        in the memory tier, so reruns while the background parse runs do not extract it again.
+        """
+        digest = content_digest(data)
+        text = self._cached_text(digest)
+        if text is not None:
+            return digest, text, True
+        if not name.lower().endswith(".pdf"):
+            return digest, self._parse_full(digest, data, name), True
+        key = f"preview:{max_chars}:{digest}"
+        with self._lock:
+            preview = self._mem.get(key)
+        if preview is None:
+            preview = parse_resume(NamedBytesIO(data, name), max_chars=max_chars)
+            with self._lock:
+                self._mem_put(key, preview)
+        self._parse_in_background(digest, data, name)
+        return digest, preview, False
+
+    def resume_profile(self, digest: str, text: str) -> Dict[str, Any]:
+        """
+        Return extract_profile(text), keyed by content digest, extractor version and a fingerprint
+        of the text, so a profile of the pre-OCR text is not reused once OCR has re-parsed the upload.
+        """
+        key = f"profile:{profile_version()}:{digest}:{text_digest(text)}"
+        prof = self.get(key)
+        if prof is None:
+            prof = extract_profile(text)
+            self.put(key, prof)
+        return prof
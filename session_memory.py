@@ -0,0 +1,89 @@
+# session_memory.py — Per-session memory accounting for the Streamlit app
+#
+#   from session_memory import meter
+#   meter.observe(session_id, st.session_state)     # once per run, after the page rendered
+#
+# Estimates how many bytes each live session keeps in st.session_state (deep
+# size of every key) and exports totals as Prometheus gauges through the
+# tracer, so RSS growth can be traced to sessions and keys. Objects that hold
+# references to process-wide caches report only their own share by defining
+# session_bytes(); sessions not seen for IDLE_SECONDS are forgotten.
+import sys
+import time
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from tracing import tracer
+
+IDLE_SECONDS = 3600
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def deep_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """Approximate bytes held by obj: containers are followed, shared objects counted once."""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if hasattr(obj, "session_bytes") and not isinstance(obj, type):
+        return obj.session_bytes()
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_size(v, seen) for v in obj)
+    return size
+
+
+class SessionMeter:
+    """Latest per-key state size of every live session, exported as gauges."""
+
+    def __init__(self, idle_seconds: float = IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, session_id: str, state) -> Dict[str, int]:
+        """Measure one session's state ({key: bytes}) and remember it for the metrics."""
+        with tracer.span("session_memory.observe") as s:
+            sizes = {str(k): deep_size(v) for k, v in list(state.items())}
+            s["bytes"] = sum(sizes.values())
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = {"sizes": sizes, "seen": now}
+            for sid in [sid for sid, v in self._sessions.items() if now - v["seen"] > self.idle_seconds]:
+                del self._sessions[sid]
+        return sizes
+
+    def stats(self) -> Dict[str, Any]:
+        """{"sessions", "total_bytes", "max_bytes", "by_key": {key: bytes summed over sessions}}."""
+        with self._lock:
+            sessions = [v["sizes"] for v in self._sessions.values()]
+        by_key: Dict[str, int] = {}
+        for sizes in sessions:
+            for k, n in sizes.items():
+                by_key[k] = by_key.get(k, 0) + n
+        totals = [sum(sizes.values()) for sizes in sessions]
+        return {"sessions": len(totals), "total_bytes": sum(totals), "max_bytes": max(totals, default=0),
+                "by_key": dict(sorted(by_key.items(), key=lambda kv: -kv[1]))}
+
+    def prometheus_lines(self, prefix: str) -> List[str]:
+        st = self.stats()
+        lines = [f"# HELP {prefix}_sessions Live sessions seen in the last {self.idle_seconds:.0f} s.",
+                 f"# TYPE {prefix}_sessions gauge",
+                 f"{prefix}_sessions {st['sessions']}",
+                 f"# HELP {prefix}_session_state_bytes Estimated session_state size (total, largest session).",
+                 f"# TYPE {prefix}_session_state_bytes gauge",
+                 f'{prefix}_session_state_bytes{{stat="total"}} {st["total_bytes"]}',
+                 f'{prefix}_session_state_bytes{{stat="max"}} {st["max_bytes"]}',
+                 f"# HELP {prefix}_session_key_bytes Estimated session_state size per key, summed over sessions.",
+                 f"# TYPE {prefix}_session_key_bytes gauge"]
+        lines += [f'{prefix}_session_key_bytes{{key="{_label(k)}"}} {n}' for k, n in st["by_key"].items()]
+        return lines
+
+
+meter = SessionMeter()
+tracer.add_collector(meter.prometheus_lines)
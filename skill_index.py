@@ -0,0 +1,147 @@
+# skill_index.py — Normalized term index behind extract_profile (skills, aliases, keyword categories)
+#
+#   index = SkillIndex({"skill": ["sql", "data analysis"], "cert": ["certification"]},
+#                      aliases={"sql": ["postgres", "ms sql"]})
+#   for start, hits in index.scan(text.lower()):     # hits: ((category, term), ...)
+#       ...
+#
+# Text is split into word tokens (dots, hyphens and slashes separate words, so
+# "b.tech", "node.js" and "ms-excel" become token n-grams) and every token is
+# normalized by folding plural endings. Terms and their aliases are stored the
+# same way in a trie of dicts keyed by normalized token, so one left-to-right
+# pass finds multi-word terms and aliases, longest match first and only at
+# whole-token boundaries ("ml" no longer matches inside "html"). Single skill
+# tokens the trie misses get one more chance against a table of delete-variants
+# (one typo: "pyhton", "pythn", "comunication"), unless they are listed as real words
+# ("docked" is not a typo of docker). Normalization and the typo lookup run once per
+# distinct word and each token costs a dict lookup or two, so a scan is linear in
+# text length whatever the vocabulary size.
+import re
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+# Numbers (with the "+" of "5+ years") and words with the "+"/"#" of c++ and c#. A number
+# ends at the first letter, so "5years" and "3yrs" still give the years unit its own token.
+TOKEN = re.compile(r"\d+\+?|[^\W\d][\w+#]*")
+# split() with the token captured: [gap, token, gap, token, ..., gap]
+_SPLIT = re.compile(f"({TOKEN.pattern})")
+# Shortest skill token that gets the one-typo lookup; shorter words collide too easily.
+FUZZY_MIN_CHARS = 6
+_END = ""      # trie key holding a node's hits; never a token
+
+Hit = Tuple[str, str]    # (category, canonical term)
+
+
+def normalize(token: str) -> str:
+    """Fold plural endings ("internships" -> internship, "companies" -> company, "years" -> year)."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+def tokens(text: str) -> List[str]:
+    """Normalized tokens of already lowered text."""
+    return [normalize(t) for t in TOKEN.findall(text)]
+
+def _deletes(token: str) -> List[str]:
+    """Every variant with one character removed, except the first (typos rarely hit the first letter)."""
+    return [token[:i] + token[i + 1:] for i in range(1, len(token))]
+
+
+class SkillIndex:
+    """Compiled terms of every category plus skill aliases; immutable once built, so safe to share."""
+
+    def __init__(self, categories: Dict[str, List[str]], aliases: Optional[Dict[str, List[str]]] = None,
+                 not_typos: Iterable[str] = ()):
+        self.trie: Dict[str, dict] = {}
+        self.size = 0
+        # real words that are never looked up as typos
+        self.not_typos = frozenset(normalize(w) for w in not_typos)
+        # one-typo tables for canonical skill words; None marks a variant several skills share
+        self.exact: Dict[str, Optional[Hit]] = {}                       # word
+        self.missing: Dict[str, Optional[Hit]] = {}                     # word minus one character
+        self.swapped: Dict[Tuple[str, int], Optional[Hit]] = {}         # (word minus char i, i)
+        for category, terms in categories.items():
+            for term in terms:
+                self._add(term, (category, term))
+                if category == "skill":
+                    self._add_typos(term, (category, term))
+        skills = set(categories.get("skill", ()))
+        for canonical, names in (aliases or {}).items():
+            if canonical not in skills:
+                raise ValueError(f"Alias target {canonical!r} is not in the skill vocabulary")
+            for name in names:
+                self._add(name.lower(), ("skill", canonical))
+
+    def _add(self, term: str, hit: Hit) -> None:
+        toks = tokens(term)
+        if not toks:
+            return
+        node = self.trie
+        for t in toks:
+            node = node.setdefault(t, {})
+        if hit not in node.get(_END, ()):
+            node[_END] = node.get(_END, ()) + (hit,)
+            self.size += 1
+
+    @staticmethod
+    def _put(table: dict, key, hit: Hit) -> None:
+        table[key] = hit if table.get(key, hit) == hit else None
+
+    def _add_typos(self, term: str, hit: Hit) -> None:
+        """Aliases are left out: short or common-word aliases ("captain") would mostly catch other words."""
+        toks = tokens(term)
+        if len(toks) != 1 or len(toks[0]) < FUZZY_MIN_CHARS or not toks[0].isalpha():
+            return
+        word = toks[0]
+        self._put(self.exact, word, hit)
+        for i, variant in enumerate(_deletes(word), 1):
+            self._put(self.missing, variant, hit)
+            self._put(self.swapped, (variant, i), hit)
+
+    def _fuzzy(self, token: str) -> Optional[Hit]:
+        """The single skill one edit (missing, extra, substituted or swapped character) away from `token`."""
+        found = set()
+        if token in self.missing:
+            found.add(self.missing[token])
+        for i, variant in enumerate(_deletes(token), 1):
+            if variant in self.exact:
+                found.add(self.exact[variant])
+            if (variant, i) in self.swapped:
+                found.add(self.swapped[(variant, i)])
+        for i in range(1, len(token) - 1):
+            swap = token[:i] + token[i + 1] + token[i] + token[i + 2:]
+            if swap in self.exact:
+                found.add(self.exact[swap])
+        return found.pop() if len(found) == 1 else None
+
+    def scan(self, lower: str) -> Iterator[Tuple[int, Tuple[Hit, ...]]]:
+        """(offset in `lower`, hits) for every matched term, left to right, longest match first."""
+        parts = _SPLIT.split(lower)
+        words = parts[1::2]
+        # normalization and typo lookups run once per distinct word, not per occurrence
+        norm = {w: normalize(w) for w in set(words)}
+        toks = [norm[w] for w in words]
+        trie, typos = self.trie, {}
+        for t in set(toks):
+            if t not in trie and t not in self.not_typos and len(t) >= FUZZY_MIN_CHARS - 1 and t.isalpha():
+                hit = self._fuzzy(t)
+                if hit:
+                    typos[t] = (hit,)
+        n, end = len(toks), 0
+        at, offset = 0, len(parts[0])       # offset of token `at` in `lower`
+        for i in [i for i, t in enumerate(toks) if t in trie or t in typos]:
+            if i < end:
+                continue                    # inside the previous (longer) match
+            node, j, best, end = trie, i, typos.get(toks[i]), i + 1
+            while j < n:
+                node = node.get(toks[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    best, end = node[_END], j
+            if best:
+                offset += sum(map(len, parts[2 * at + 1:2 * i + 1]))
+                at = i
+                yield offset, best
@@ -0,0 +1,139 @@
+# test_api_server.py — the HTTP API end to end: analyze, batch NDJSON, backpressure, bad arguments
+#
+#   python -m pytest tests/
+import io
+import os
+import sys
+import json
+import tempfile
+import zipfile
+import unittest
+from urllib.parse import urlencode
+
+from tornado.testing import AsyncHTTPTestCase
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_server
+
+RESUME = b"Skills: Python, SQL, Git, data analysis.\nInternship at Acme. Projects: github.com/me.\n"
+JOB = {"id": 1, "title": "Data Analyst Intern", "company_name": "Acme", "candidate_required_location": "India",
+       "category": "Data", "tags": ["sql"], "url": "https://example.com/1",
+       "publication_date": "2026-01-01", "description": "<p>SQL and Python</p>"}
+
+
+def archive(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+class ApiTest(AsyncHTTPTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        # one service (and process pool) for the whole class; each test gets a fresh app around it
+        cls.service = api_server.Service(workers=1, max_pending=2, max_batches=1, cache_dir=cls.tmp.name)
+        cls.service.jobs.ingest([JOB])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.cpu_pool.shutdown()
+        cls.service.io_pool.shutdown()
+        cls.tmp.cleanup()
+
+    def get_app(self):
+        return api_server.make_app(self.service)
+
+    def post(self, path, body, **args):
+        return self.fetch(f"{path}?{urlencode(args)}", method="POST", body=body, request_timeout=60)
+
+    # ----------------------------- analyze ----------------------------- #
+    def test_analyze(self):
+        r = self.post("/v1/analyze", RESUME, filename="cv.txt", field="Technology")
+        self.assertEqual(r.code, 200, r.body)
+        out = json.loads(r.body)
+        self.assertEqual(out["profile"]["skills"], ["data analysis", "git", "python", "sql"])
+        self.assertEqual(out["score"], 95)        # only the certification check fails
+        self.assertEqual(out["flags"], [])
+
+    def test_analyze_all_fields(self):
+        out = json.loads(self.post("/v1/analyze", RESUME, filename="cv.txt", field="all").body)
+        self.assertEqual(set(out["fields"]), set(api_server.load_rules().names))
+
+    def test_analyze_rejects_bad_requests(self):
+        self.assertEqual(self.post("/v1/analyze", RESUME, filename="cv.txt", field="Astrology").code, 400)
+        self.assertEqual(self.post("/v1/analyze", RESUME, filename="cv.png").code, 415)
+        self.assertEqual(self.post("/v1/analyze", RESUME).code, 400)
+        self.assertEqual(self.post("/v1/analyze", RESUME, filename="cv.txt", profile="nope").code, 400)
+
+    # ----------------------------- batch ----------------------------- #
+    def test_batch_streams_ndjson(self):
+        body = archive({"a.txt": RESUME, "b.txt": b"Nursing, clinical rotations", "notes.png": b"x",
+                        "c.pdf": b"not really a pdf"})
+        r = self.post("/v1/batch", body, field="Technology")
+        self.assertEqual(r.code, 200, r.body)
+        self.assertEqual(r.headers["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in r.body.decode().splitlines()]
+        rows, summary = lines[:-1], lines[-1]["summary"]
+        self.assertEqual(sorted(row["file"] for row in rows), ["a.txt", "b.txt", "c.pdf"])
+        self.assertEqual(sorted(row["index"] for row in rows), [0, 1, 2])
+        by_file = {row["file"]: row for row in rows}
+        self.assertEqual(by_file["a.txt"]["score"], 95)
+        self.assertTrue(by_file["c.pdf"]["error"])
+        self.assertEqual(summary["resumes"], 3)
+        self.assertEqual(summary["failed"], 1)
+        self.assertNotIn("error", summary)
+
+    def test_batch_rejects_non_archives(self):
+        self.assertEqual(self.post("/v1/batch", b"just some text", field="Technology").code, 400)
+        self.assertEqual(self.post("/v1/batch", archive({"a.txt": RESUME}), field="all").code, 400)
+
+    # ----------------------------- backpressure ----------------------------- #
+    def test_busy_analyzer_answers_503(self):
+        self.service.pending = self.service.max_pending
+        try:
+            r = self.post("/v1/analyze", RESUME, filename="cv.txt")
+            self.assertEqual(r.code, 503)
+            self.assertEqual(r.headers["Retry-After"], "1")
+            self.assertEqual(self.post("/v1/batch", archive({"a.txt": RESUME})).code, 503)
+        finally:
+            self.service.pending = 0
+        self.assertEqual(self.post("/v1/analyze", RESUME, filename="cv.txt").code, 200)
+
+    def test_too_many_batches_answers_503(self):
+        self.service.batches = self.service.max_batches
+        try:
+            r = self.post("/v1/batch", archive({"a.txt": RESUME}))
+            self.assertEqual(r.code, 503)
+            self.assertEqual(r.headers["Retry-After"], "5")
+        finally:
+            self.service.batches = 0
+
+    # ----------------------------- jobs ----------------------------- #
+    def test_jobs_from_the_index(self):
+        out = json.loads(self.fetch("/v1/jobs?q=data+analyst&location=India&page=1&per_page=5").body)
+        self.assertEqual(out["source"], "index")
+        self.assertEqual(out["total"], 1)
+        self.assertEqual(out["items"][0]["company"], "Acme")
+
+    def test_bad_query_parameters(self):
+        for query in ("page=abc", "per_page=ten", "page=1.5", "per_page="):
+            with self.subTest(query=query):
+                r = self.fetch(f"/v1/jobs?q=data&{query}")
+                self.assertEqual(r.code, 400)
+                self.assertIn("must be an integer", json.loads(r.body)["error"])
+        # out-of-range integers are clamped, not refused
+        out = json.loads(self.fetch("/v1/jobs?q=data&page=-3&per_page=1000").body)
+        self.assertEqual(out["page"], 1)
+
+    def test_health(self):
+        out = json.loads(self.fetch("/healthz").body)
+        self.assertTrue(out["ok"])
+        self.assertEqual(out["max_pending"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# test_cache_backend.py — values, leases and single-flight for the memory and SQLite backends
+#
+#   python -m pytest tests/
+import os
+import sys
+import time
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache_backend import CacheBackend, MemoryBackend, SQLiteBackend, make_backend
+
+
+def in_thread(fn):
+    """Run fn() in another thread and return its result (leases are owned per thread)."""
+    out = []
+    t = threading.Thread(target=lambda: out.append(fn()))
+    t.start()
+    t.join()
+    return out[0]
+
+
+class BackendContract:
+    """Shared checks; subclasses provide make()."""
+
+    def test_values_and_ttl(self):
+        b = self.make()
+        self.assertIsNone(b.get("k"))
+        b.set("k", {"a": [1, 2]})
+        self.assertEqual(b.get("k"), {"a": [1, 2]})
+        b.set("short", 1, ttl=0.05)
+        time.sleep(0.1)
+        self.assertIsNone(b.get("short"))
+        b.delete("k")
+        self.assertIsNone(b.get("k"))
+
+    def test_lease_is_exclusive_and_only_the_owner_releases(self):
+        b = self.make()
+        self.assertTrue(b.acquire("job"))
+        self.assertFalse(in_thread(lambda: b.acquire("job")))
+        in_thread(lambda: b.release("job"))          # not the owner: no effect
+        self.assertFalse(in_thread(lambda: b.acquire("job")))
+        b.release("job")
+        self.assertTrue(in_thread(lambda: b.acquire("job")))
+
+    def test_expired_lease_is_taken_over(self):
+        b = self.make()
+        self.assertTrue(b.acquire("job", lease=0.05))
+        time.sleep(0.1)
+        self.assertTrue(in_thread(lambda: b.acquire("job", lease=30)))
+        b.release("job")                             # the first owner overran: keeps its hands off
+        self.assertFalse(b.acquire("job"))
+
+    def test_single_flight_runs_compute_once(self):
+        b = self.make()
+        calls, ran = [], []
+
+        def compute():
+            time.sleep(0.2)
+            calls.append(1)
+            b.set("result", "done")
+
+        def worker():
+            ran.append(b.single_flight("fetch", compute, done=lambda: b.get("result") is not None))
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(ran), [False] * 5 + [True])
+
+    def test_get_or_set(self):
+        b = self.make()
+        calls = []
+        compute = lambda: calls.append(1) or 42
+        self.assertEqual(b.get_or_set("answer", compute), 42)
+        self.assertEqual(b.get_or_set("answer", compute), 42)
+        self.assertEqual(len(calls), 1)
+
+
+class MemoryBackendTest(BackendContract, unittest.TestCase):
+    def make(self):
+        return MemoryBackend()
+
+
+class SQLiteBackendTest(BackendContract, unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make(self):
+        return SQLiteBackend(self.path)
+
+    def test_one_connection_per_thread(self):
+        b = self.make()
+        self.assertIs(b._connect(), b._connect())
+        other = in_thread(b._connect)
+        self.assertIsNot(other, b._connect())
+        self.assertTrue(in_thread(lambda: b._connect() is b._connect()))
+        mode = b._connect().execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_threads_share_values(self):
+        b = self.make()
+        in_thread(lambda: b.set("k", "from another thread"))
+        self.assertEqual(b.get("k"), "from another thread")
+
+    def test_replicas_share_values_and_leases(self):
+        a, b = self.make(), self.make()
+        a.set("k", 1)
+        self.assertEqual(b.get("k"), 1)
+        self.assertTrue(a.acquire("job"))
+        self.assertFalse(b.acquire("job"))
+        b.release("job")
+        self.assertFalse(b.acquire("job"))
+
+
+class InterfaceTest(unittest.TestCase):
+    def test_incomplete_backend_fails_on_creation(self):
+        class NoRelease(CacheBackend):
+            def get(self, key): return None
+            def set(self, key, value, ttl=None): pass
+            def delete(self, key): pass
+            def acquire(self, key, lease=30.0): return True
+
+        with self.assertRaises(TypeError):
+            NoRelease()
+
+    def test_make_backend(self):
+        self.assertIsInstance(make_backend("memory"), MemoryBackend)
+        with tempfile.TemporaryDirectory() as d:
+            self.assertIsInstance(make_backend("sqlite", cache_dir=d), SQLiteBackend)
+        with self.assertRaises(ValueError):
+            make_backend("redis://x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# test_catalogue.py — catalogue lookups: exact date windows and {city} templates
+#
+#   python -m pytest tests/
+import os
+import sys
+import datetime as dt
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogue import Catalogue, NO_CITY, load_catalogue
+
+D = dt.date
+SPEC = {"entries": [
+    {"kind": "event", "field": "Technology", "name": "Early January", "start": "2026-01-02", "end": "2026-01-04",
+     "city": "Pune"},
+    {"kind": "event", "field": "Technology", "name": "Late January", "start": "2026-01-25", "end": "2026-01-27",
+     "city": "{city}"},
+    {"kind": "event", "field": "Technology", "name": "New Year Hack", "start": "2025-12-28", "end": "2026-01-03",
+     "city": "Online"},
+    {"kind": "event", "field": "Technology", "name": "{city} Startup Week", "start": "2026-03-01",
+     "city": "{city}"},
+    {"kind": "event", "field": "Technology", "name": "Rolling", "city": "Varies"},
+]}
+
+
+class DateWindowTest(unittest.TestCase):
+    def setUp(self):
+        self.cat = Catalogue(SPEC)
+
+    def names(self, **kw):
+        return [e["name"] for e in self.cat.find("event", field="Technology", **kw)]
+
+    def test_same_month_entries_outside_the_window_are_dropped(self):
+        # both January events share the month bucket; only exact dates tell them apart
+        self.assertEqual(self.names(since=D(2026, 1, 10), until=D(2026, 1, 31)),
+                         ["Late January", "Rolling"])
+        self.assertEqual(self.names(since=D(2026, 1, 1), until=D(2026, 1, 5)),
+                         ["Early January", "New Year Hack", "Rolling"])
+
+    def test_past_versus_upcoming(self):
+        self.assertEqual(self.names(since=D(2026, 1, 5)),
+                         ["Late January", "Local Startup Week", "Rolling"])
+        self.assertEqual(self.names(until=D(2025, 12, 31)), ["New Year Hack", "Rolling"])
+        self.assertEqual(len(self.names()), 5)
+
+    def test_ranges_spanning_the_new_year(self):
+        self.assertIn("New Year Hack", self.names(since=D(2026, 1, 3), until=D(2026, 1, 3)))
+        self.assertIn("New Year Hack", self.names(since=D(2025, 12, 31), until=D(2025, 12, 31)))
+        self.assertNotIn("New Year Hack", self.names(since=D(2026, 1, 4)))
+
+    def test_single_day_entries(self):
+        self.assertIn("Local Startup Week", self.names(since=D(2026, 3, 1)))
+        self.assertNotIn("Local Startup Week", self.names(since=D(2026, 3, 2)))
+
+
+class CityTemplateTest(unittest.TestCase):
+    def setUp(self):
+        self.cat = Catalogue(SPEC)
+
+    def by_name(self, **kw):
+        return {e["name"]: e for e in self.cat.find("event", field="Technology", **kw)}
+
+    def test_city_is_filled_in(self):
+        rows = self.by_name(city="Delhi")
+        self.assertEqual(rows["Late January"]["city"], "Delhi")
+        self.assertIn("Delhi Startup Week", rows)
+        self.assertNotIn("Early January", rows)          # in Pune, not Delhi
+        self.assertIn("Rolling", rows)                    # "Varies" matches any city
+
+    def test_without_a_city_templates_are_reworded(self):
+        rows = self.by_name()
+        self.assertEqual(rows["Late January"]["city"], NO_CITY)
+        self.assertIn("Local Startup Week", rows)
+        self.assertFalse(any("{city}" in str(v) for e in rows.values() for v in e.values()))
+
+    def test_curated_catalogue_has_no_unfilled_templates(self):
+        cat = load_catalogue()
+        for kind in ("event", "course", "program", "job"):
+            for entry in cat.find(kind):
+                self.assertFalse(any("{city}" in str(v) for v in entry.values()), entry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+# test_field_rules.py — compiled field rules score exactly like the original per-field analyze_gaps
+#
+#   python -m pytest tests/
+import os
+import sys
+import random
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from field_rules import RuleBook, load_rules
+from resume_analysis import analyze_gaps
+
+FIELDS = ["Technology", "Business", "Medical", "Sports", "Arts", "Other", "Underwater Basket Weaving"]
+SKILLS = ["python", "sql", "git", "data analysis", "excel", "communication", "leadership",
+          "nursing", "clinical", "football", "cricket", "athletics", "docker", "figma"]
+
+
+def baseline(profile, field):
+    """analyze_gaps as it was before data/field_rules.json (the if/elif per field)."""
+    recs, flags = [], []
+    if not profile["has_projects"]:
+        flags.append("No projects/portfolio mentioned.")
+        recs.append("Add 2–3 concise project bullets with outcomes and links (GitHub/Portfolio).")
+    if not profile["has_internship"] and field in ["Technology", "Business", "Medical"]:
+        flags.append("No internships listed.")
+        recs.append("Apply to 1–2 short internships or externships to gain recent practical exposure.")
+    if not profile["has_certifications"]:
+        recs.append("Add at least one verified certification (free or paid) relevant to your field.")
+    if field == "Technology":
+        missing = {"python", "sql", "git", "data analysis"} - set(profile["skills"])
+        if missing:
+            flags.append(f"Missing tech core skills: {', '.join(sorted(missing))}.")
+            recs.append("Complete a focused course in core programming, SQL, and Git basics.")
+    elif field == "Business":
+        missing = {"excel", "communication", "leadership"} - set(profile["skills"])
+        if missing:
+            flags.append(f"Missing essential business skills: {', '.join(sorted(missing))}.")
+            recs.append("Showcase a case-study project (market analysis, P&L model, or go-to-market plan).")
+    elif field == "Medical":
+        missing = {"nursing", "clinical"} - set(profile["skills"])
+        if missing:
+            flags.append(f"Clinical exposure not obvious: {', '.join(sorted(missing))}.")
+            recs.append("Add clinical rotations, CME credits, and patient-care cases (de-identified).")
+    elif field == "Sports":
+        if not set(profile["skills"]) & {"football", "cricket", "athletics"}:
+            flags.append("Specific sport not clear.")
+            recs.append("Specify your primary sport, position/event, stats (PBs), and recent tournaments/trials.")
+    score = 100
+    score -= 10 if not profile["has_projects"] else 0
+    score -= 10 if (field in ["Technology", "Business", "Medical"] and not profile["has_internship"]) else 0
+    score -= 5 if not profile["has_certifications"] else 0
+    return {"score": max(30, score), "flags": flags, "recommendations": recs}
+
+
+def profile(skills=(), projects=False, internship=False, certifications=False):
+    return {"exp_years": 0, "skills": sorted(skills), "education": [], "has_projects": projects,
+            "has_internship": internship, "has_certifications": certifications}
+
+
+def random_profiles(n, seed=7):
+    rng = random.Random(seed)
+    return [profile(rng.sample(SKILLS, rng.randint(0, len(SKILLS))),
+                    rng.random() < 0.5, rng.random() < 0.5, rng.random() < 0.5) for _ in range(n)]
+
+
+class BaselineTest(unittest.TestCase):
+    def test_known_profiles(self):
+        empty = profile()
+        self.assertEqual(analyze_gaps(empty, "Technology"), {
+            "score": 75,
+            "flags": ["No projects/portfolio mentioned.", "No internships listed.",
+                      "Missing tech core skills: data analysis, git, python, sql."],
+            "recommendations": [
+                "Add 2–3 concise project bullets with outcomes and links (GitHub/Portfolio).",
+                "Apply to 1–2 short internships or externships to gain recent practical exposure.",
+                "Add at least one verified certification (free or paid) relevant to your field.",
+                "Complete a focused course in core programming, SQL, and Git basics.",
+            ],
+        })
+        full = profile(["python", "sql", "git", "data analysis"], True, True, True)
+        self.assertEqual(analyze_gaps(full, "Technology"), {"score": 100, "flags": [], "recommendations": []})
+        self.assertEqual(analyze_gaps(profile(["cricket"]), "Sports")["flags"], ["No projects/portfolio mentioned."])
+        self.assertEqual(analyze_gaps(profile(["nursing"], True, True, True), "Medical")["flags"],
+                         ["Clinical exposure not obvious: clinical."])
+        # unknown fields get the default checks: no internship check, no skill requirement
+        self.assertEqual(analyze_gaps(empty, "Underwater Basket Weaving")["score"], 85)
+
+    def test_every_field_matches_the_baseline(self):
+        for p in random_profiles(600) + [profile(), profile(SKILLS, True, True, True)]:
+            for field in FIELDS:
+                self.assertEqual(analyze_gaps(p, field), baseline(p, field), (field, p))
+
+    def test_evaluate_all_matches_evaluate(self):
+        rules = load_rules()
+        for p in random_profiles(100, seed=11):
+            self.assertEqual(rules.evaluate_all(p), {f: rules.evaluate(p, f) for f in rules.names})
+
+
+class ScoreMatrixTest(unittest.TestCase):
+    def test_matches_evaluate_per_field(self):
+        rules = load_rules()
+        profiles = random_profiles(500, seed=3)
+        scores, gaps = rules.score_matrix(profiles)
+        self.assertEqual(scores.shape, (len(profiles), len(rules.names)))
+        for i, p in enumerate(profiles):
+            for j, field in enumerate(rules.names):
+                result = rules.evaluate(p, field)
+                self.assertEqual(scores[i, j], result["score"], (field, p))
+                self.assertEqual(bool(gaps[i, j]), rules.rule(field).skill_gap(rules.encode(p)[1]) != 0)
+
+    def test_empty_batch(self):
+        scores, gaps = load_rules().score_matrix([])
+        self.assertEqual(scores.shape, (0, len(load_rules().names)))
+
+
+class CompileTest(unittest.TestCase):
+    def spec(self, terms):
+        return {"checks": {}, "fields": [{"name": "X", "skills": {"terms": terms, "flag": "{missing}"}}]}
+
+    def test_term_cap(self):
+        RuleBook(self.spec([f"skill{i}" for i in range(62)]))
+        with self.assertRaises(ValueError):
+            RuleBook(self.spec([f"skill{i}" for i in range(63)]))
+
+    def test_unknown_check_and_require_mode(self):
+        with self.assertRaises(ValueError):
+            RuleBook({"checks": {}, "fields": [{"name": "X", "checks": ["nope"]}]})
+        with self.assertRaises(ValueError):
+            RuleBook({"checks": {}, "fields": [{"name": "X", "skills": {"require": "most", "terms": []}}]})
+
+    def test_gap_flag_is_memoized_per_rule(self):
+        book = RuleBook(self.spec(["a", "b", "c"]))
+        rule = book.rule("X")
+        flag = rule.gap_flag(0b101, book.terms)
+        self.assertEqual(flag, "a, c")
+        self.assertIs(rule.gap_flag(0b101, book.terms), flag)
+
+
+if __name__ == "__main__":
+    unittest.main()
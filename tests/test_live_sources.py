@@ -0,0 +1,137 @@
+# test_live_sources.py — fetch_all against a local stub HTTP server (timeouts, failures, breakers)
+#
+#   python -m pytest tests/
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import circuit_breaker
+import live_sources
+
+SLOW_SECONDS = 3.0
+JOBS = {"jobs": [{"id": 1, "title": "Data Analyst", "company_name": "Acme",
+                  "candidate_required_location": "Worldwide", "url": "https://example.com/1"}]}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """/jobs answers at once, /slow after SLOW_SECONDS, /fail with a 500."""
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/slow":
+            time.sleep(SLOW_SECONDS)
+        if path == "/fail":
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = json.dumps(JOBS).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass  # the client gave up on /slow
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchAllTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self._urls = dict(live_sources.SOURCE_URLS)
+        circuit_breaker._registry.clear()
+
+    def tearDown(self):
+        live_sources.SOURCE_URLS.update(self._urls)
+        circuit_breaker._registry.clear()
+
+    def point(self, **paths):
+        live_sources.SOURCE_URLS.update({name: self.base + path for name, path in paths.items()})
+
+    def test_partial_results_within_deadline(self):
+        self.point(remotive="/jobs", devpost="/slow", sports="/fail")
+        t0 = time.perf_counter()
+        out = live_sources.fetch_all({"remotive": {"query": "data", "location": "India"}, "devpost": {}, "sports": {}},
+                                     deadlines={"remotive": 2.0, "devpost": 0.5, "sports": 2.0})
+        elapsed = time.perf_counter() - t0
+        self.assertLess(elapsed, 1.5)
+        self.assertTrue(out["remotive"]["ok"])
+        self.assertEqual(out["remotive"]["items"][0]["title"], "Data Analyst")
+        self.assertFalse(out["devpost"]["ok"])
+        self.assertIn("timeout", out["devpost"]["error"])
+        self.assertFalse(out["sports"]["ok"])
+        self.assertIn("HTTPError", out["sports"]["error"])
+
+    def test_breaker_opens_after_repeated_failures(self):
+        self.point(sports="/fail")
+        for _ in range(circuit_breaker.FAILURE_THRESHOLD):
+            self.assertFalse(live_sources.fetch_all({"sports": {}})["sports"]["ok"])
+        self.point(sports="/jobs")
+        out = live_sources.fetch_all({"sports": {}})["sports"]
+        self.assertIn("circuit open", out["error"])
+        self.assertEqual(circuit_breaker.breaker("sports").state, circuit_breaker.OPEN)
+
+    def test_remotive_feed_has_its_own_breaker(self):
+        self.point(remotive="/fail")
+        for _ in range(circuit_breaker.FAILURE_THRESHOLD):
+            with self.assertRaises(Exception):
+                live_sources.remotive_feed(timeout=2)
+        with self.assertRaises(live_sources.SourceUnavailable):
+            live_sources.remotive_feed(timeout=2)
+        self.assertEqual(circuit_breaker.breaker("remotive-feed").state, circuit_breaker.OPEN)
+        # page searches keep their own breaker and latency samples
+        self.assertEqual(circuit_breaker.breaker("remotive").state, circuit_breaker.CLOSED)
+        self.point(remotive="/jobs")
+        out = live_sources.fetch_all({"remotive": {"query": "", "location": ""}})["remotive"]
+        self.assertTrue(out["ok"])
+
+    def test_slow_feed_does_not_stretch_search_timeouts(self):
+        self.point(remotive="/jobs")
+        for _ in range(5):
+            self.assertTrue(live_sources.fetch_all({"remotive": {"query": "", "location": ""}})["remotive"]["ok"])
+        search = circuit_breaker.breaker("remotive")
+        before = search.timeout(10.0)
+        self.point(remotive="/slow")
+        live_sources.remotive_feed(timeout=SLOW_SECONDS + 2)    # one slow sample would set the p95
+        self.assertEqual(search.timeout(10.0), before)
+
+    def test_cancelled_probe_reopens_the_breaker(self):
+        guard = circuit_breaker.breaker("devpost")
+        for _ in range(circuit_breaker.FAILURE_THRESHOLD):
+            guard.failure()
+        guard.opened_at -= guard.cooldown    # cool-down over: the next fetch is the half-open probe
+        self.point(devpost="/slow")
+
+        async def outer_deadline():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(live_sources.fetch_all_async({"devpost": {}}), timeout=0.3)
+        asyncio.run(outer_deadline())
+        self.assertEqual(guard.state, circuit_breaker.OPEN)
+        self.assertFalse(guard._probing)
+        guard.opened_at -= guard.cooldown
+        self.assertTrue(guard.allow())       # a later probe is let through again
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# test_opportunity_store.py — Devpost display date ranges and upcoming-only queries
+#
+#   python -m pytest tests/
+import os
+import sys
+import datetime as dt
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from opportunity_store import OpportunityStore, parse_date_range
+
+D = dt.date
+
+
+class DateRangeTest(unittest.TestCase):
+    def test_display_ranges(self):
+        cases = {
+            "Jan 05 - 12, 2026": (D(2026, 1, 5), D(2026, 1, 12)),           # within a month
+            "Feb 01 - Mar 03, 2026": (D(2026, 2, 1), D(2026, 3, 3)),        # across months
+            "Dec 15, 2025 - Jan 10, 2026": (D(2025, 12, 15), D(2026, 1, 10)),   # across years, both given
+            "Dec 20 - Jan 05, 2026": (D(2025, 12, 20), D(2026, 1, 5)),      # across years, one given
+            "Jan 05, 2026": (D(2026, 1, 5), D(2026, 1, 5)),                 # a single day
+            "Sept 28 – Oct 02, 2026": (D(2026, 9, 28), D(2026, 10, 2)),     # long month name, en dash
+            "  Mar 1-3, 2026 ": (D(2026, 3, 1), D(2026, 3, 3)),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_date_range(text), expected)
+
+    def test_not_a_range(self):
+        for text in ("", None, "TBA", "Dec 2025", "Jan 05", "Foo 05 - 12, 2026", "Feb 30 - Mar 03, 2026",
+                     "2026-01-05"):
+            with self.subTest(text=text):
+                self.assertEqual(parse_date_range(text), (None, None))
+
+
+class UpcomingTest(unittest.TestCase):
+    def setUp(self):
+        self.store = OpportunityStore()
+        self.store.replace("devpost", [
+            {"name": "Past", "dates": "Nov 01 - 03, 2025"},
+            {"name": "Spans today", "dates": "Dec 20, 2025 - Jan 10, 2026"},
+            {"name": "Upcoming", "dates": "Feb 01 - Mar 03, 2026"},
+            {"name": "Iso past", "start": "2025-10-01", "end": "2025-10-02"},
+            {"name": "Iso upcoming", "start": "2026-04-01"},
+            {"name": "Undated", "dates": "Check the calendar"},
+        ], field="Technology")
+
+    def names(self, **query):
+        page, total = self.store.query(field="Technology", sort="start", **query)
+        return page.column("name").to_pylist()
+
+    def test_since_drops_past_events(self):
+        self.assertEqual(self.names(since=D(2026, 1, 1)),
+                         ["Spans today", "Upcoming", "Iso upcoming", "Undated"])
+        self.assertEqual(self.names(since=D(2026, 1, 11)), ["Upcoming", "Iso upcoming", "Undated"])
+
+    def test_display_dates_fill_start_and_end(self):
+        page, _ = self.store.query(field="Technology", sort="start", limit=1)
+        self.assertEqual(page.column("name")[0].as_py(), "Iso past")
+        row = {k: v[0] for k, v in self.store.query(field="Technology", since=D(2026, 2, 1))[0].to_pydict().items()}
+        self.assertEqual((row["name"], row["start"], row["end"]), ("Upcoming", D(2026, 2, 1), D(2026, 3, 3)))
+
+    def test_without_since_everything_is_listed(self):
+        self.assertEqual(len(self.names()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# test_resume_cache.py — cached profiles follow the parsed text (OCR re-parses, previews)
+#
+#   python -m pytest tests/
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resume_cache
+from pipeline import AnalysisPipeline
+
+SCAN = b"%PDF-1.4 scanned resume"
+OCR_TEXT = "Skills: Python, SQL. Internship at Acme."
+
+
+def fake_parse(text, image_pages=1, ocr_pages=0):
+    """parse_resume stand-in: returns `text` and fills the page report like a real parse."""
+    def parse(file, report=None, **kwargs):
+        report.update(pages=1, image_pages=image_pages, ocr_pages=ocr_pages, ocr_failed=0)
+        return text
+    return parse
+
+
+class OcrReparseTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = resume_cache.ResumeCache(disk_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_profile_is_rebuilt_after_ocr_reparse(self):
+        pipe = AnalysisPipeline(self.cache)
+        with mock.patch.object(resume_cache, "parse_resume", fake_parse("")):
+            digest, text = self.cache.resume_text(SCAN, "cv.pdf")      # no OCR: empty text
+        self.assertEqual(pipe.profile(digest, text)["skills"], [])
+        stale = pipe.gaps(digest, text, "Technology")
+
+        # Tesseract becomes available: a fresh process (same disk cache) re-parses with OCR
+        cache = resume_cache.ResumeCache(disk_dir=self.tmp.name)
+        cache.ocr = object()
+        with mock.patch.object(resume_cache, "parse_resume", fake_parse(OCR_TEXT, ocr_pages=1)):
+            digest2, text = cache.resume_text(SCAN, "cv.pdf")
+        self.assertEqual(digest2, digest)
+        self.assertEqual(text, OCR_TEXT)
+        self.assertEqual(cache.resume_profile(digest, text)["skills"], ["python", "sql"])
+
+        # the same session's pipeline must not serve its memoized pre-OCR profile either
+        pipe.resume_cache = cache
+        self.assertEqual(pipe.profile(digest, text)["skills"], ["python", "sql"])
+        self.assertNotEqual(pipe.gaps(digest, text, "Technology"), stale)
+
+    def test_same_text_reuses_the_cached_profile(self):
+        digest = resume_cache.content_digest(SCAN)
+        with mock.patch.object(resume_cache, "extract_profile", return_value={"skills": ["x"]}) as extract:
+            self.cache.resume_profile(digest, OCR_TEXT)
+            self.cache.resume_profile(digest, OCR_TEXT)
+        self.assertEqual(extract.call_count, 1)
+
+
+class PreviewTest(unittest.TestCase):
+    def test_preview_is_extracted_once_while_the_full_parse_runs(self):
+        cache = resume_cache.ResumeCache()
+        release, previews = threading.Event(), []
+
+        def parse(file, max_chars=None, report=None, **kwargs):
+            if max_chars:
+                previews.append(max_chars)
+                return "first page"
+            release.wait(10)                     # the background full parse is still running
+            report.update(pages=3, image_pages=0, ocr_pages=0, ocr_failed=0)
+            return "first page\nsecond page\nthird page"
+
+        with mock.patch.object(resume_cache, "parse_resume", parse):
+            for _rerun in range(5):
+                digest, text, complete = cache.resume_preview(SCAN, "cv.pdf", 2000)
+                self.assertEqual((text, complete), ("first page", False))
+            self.assertEqual(previews, [2000])
+            release.set()
+            self.assertEqual(cache.resume_text(SCAN, "cv.pdf")[1], "first page\nsecond page\nthird page")
+            self.assertTrue(cache.resume_preview(SCAN, "cv.pdf", 2000)[2])
+        self.assertEqual(previews, [2000])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# test_skill_index.py — skill extraction recall and false positives (boundaries, aliases, typos)
+#
+#   python -m pytest tests/
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resume_analysis
+from resume_analysis import extract_profile, load_not_typos, profile_version
+from skill_index import FUZZY_MIN_CHARS, SkillIndex
+
+
+def skills(text):
+    return extract_profile(text)["skills"]
+
+def hits(index, text):
+    return [hit for _start, found in index.scan(text.lower()) for hit in found]
+
+
+class BoundaryTest(unittest.TestCase):
+    def test_whole_words_only(self):
+        self.assertEqual(skills("HTML and CSS"), [])
+        self.assertEqual(skills("ML engineer"), ["ml"])
+        profile = extract_profile("Built internal tools for an international team.")
+        self.assertFalse(profile["has_internship"])
+        self.assertTrue(extract_profile("Summer Internships: 2")["has_internship"])
+
+    def test_multi_word_terms_and_plurals(self):
+        self.assertEqual(skills("data analysis, Power BI dashboards"), ["data analysis", "power bi"])
+        self.assertEqual(skills("data and analysis"), [])
+
+    def test_years_split_from_units(self):
+        self.assertEqual(extract_profile("5years of Python")["exp_years"], 5)
+        self.assertEqual(extract_profile("3yrs")["exp_years"], 3)
+        self.assertEqual(extract_profile("4+ years")["exp_years"], 4)
+
+
+class AliasTest(unittest.TestCase):
+    def test_aliases_map_to_canonical_skills(self):
+        self.assertEqual(skills("github.com/me"), ["git"])
+        self.assertEqual(skills("Registered Nurse"), ["nursing"])
+        self.assertEqual(skills("nurse"), ["nursing"])
+
+    def test_alias_target_must_be_a_skill(self):
+        with self.assertRaises(ValueError):
+            SkillIndex({"skill": ["python"]}, aliases={"cobol": ["cbl"]})
+
+
+class TypoTest(unittest.TestCase):
+    def test_one_typo_matches(self):
+        for typo, skill in [("pyhton", "python"), ("pythn", "python"), ("comunication", "communication"),
+                            ("kubernets", "kubernetes"), ("javasript", "javascript"), ("leadrship", "leadership")]:
+            with self.subTest(typo=typo):
+                self.assertEqual(skills(f"Skills: {typo}"), [skill])
+
+    def test_not_typos_are_never_read_as_skills(self):
+        words = load_not_typos()
+        self.assertIn("docked", words)
+        for word in words:
+            with self.subTest(word=word):
+                self.assertEqual(skills(f"The {word} was here"), [])
+
+    def test_not_typos_list_is_what_stops_them(self):
+        index = SkillIndex({"skill": ["docker", "finance"]})
+        self.assertEqual(hits(index, "docked"), [("skill", "docker")])
+        index = SkillIndex({"skill": ["docker", "finance"]}, not_typos=["docked", "financed"])
+        self.assertEqual(hits(index, "docked financed"), [])
+        self.assertEqual(hits(index, "dockr"), [("skill", "docker")])
+
+    def test_fuzzy_min_chars_cutoff(self):
+        long_term = "abcdefgh"[:FUZZY_MIN_CHARS]           # just long enough for typo lookups
+        short_term = "mnopqrst"[:FUZZY_MIN_CHARS - 1]      # one character short
+        index = SkillIndex({"skill": [long_term, short_term]})
+        self.assertEqual(hits(index, long_term[:-1] + "x"), [("skill", long_term)])
+        self.assertEqual(hits(index, short_term[:-1] + "x"), [])
+        self.assertEqual(hits(index, short_term), [("skill", short_term)])
+        self.assertEqual(skills("exel"), [])                # "excel" is under the cutoff
+
+    def test_ambiguous_typos_match_nothing(self):
+        index = SkillIndex({"skill": ["parser", "parsec"]})
+        self.assertEqual(hits(index, "parsez"), [])
+
+
+class VersionTest(unittest.TestCase):
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_vocabulary_changes_bump_profile_version(self):
+        base = profile_version()
+        self.assertEqual(profile_version(), base)
+        with open(resume_analysis.SKILLS_FILE, encoding="utf-8") as f:
+            vocab = f.read()
+        self.assertEqual(profile_version(self.write("same.txt", vocab)), base)
+        self.assertNotEqual(profile_version(self.write("more.txt", vocab + "\nrust\n")), base)
+        self.assertNotEqual(profile_version(aliases_path=self.write("aliases.json", '{"sql": ["pg"]}')), base)
+
+    def test_extractor_revision_bumps_profile_version(self):
+        base = profile_version()
+        with mock.patch.object(resume_analysis, "EXTRACTOR_REVISION", resume_analysis.EXTRACTOR_REVISION + 1):
+            self.assertNotEqual(profile_version.__wrapped__(), base)     # skip the per-process cache
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# test_tips_index.py — the Tips Bot answers common questions from the right part of the knowledge base
+#
+#   python -m pytest tests/
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tips_index
+
+# question -> topic tag every one of the top-3 tips must carry
+INTENTS = {
+    "how do I write my resume": "resume",
+    "how can I improve my resume?": "resume",
+    "which course should I take": "course",
+    "what courses should I do next": "course",
+    "how do I find an internship": "internship",
+    "internship ideas": "internship",
+}
+
+
+class IntentTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tips = tips_index.read_tips(tips_index.TIPS_FILE)
+        cls.index = tips_index.load_index(directory=None)
+
+    def topics(self, hits):
+        return [self.tips[h["id"]].get("topics", []) for h in hits]
+
+    def test_top_answers_match_the_intent(self):
+        for question, topic in INTENTS.items():
+            with self.subTest(question=question):
+                hits = self.index.search(question, k=3)
+                self.assertEqual(len(hits), 3)
+                for tags in self.topics(hits):
+                    self.assertIn(topic, tags)
+
+    def test_intent_survives_field_and_city_reranking(self):
+        for field in ("Technology", "Medical", "Arts"):
+            with self.subTest(field=field):
+                hits = self.index.search("how do I find an internship", field=field, city="Pune", k=3)
+                for tags in self.topics(hits):
+                    self.assertIn("internship", tags)
+
+
+class BuildDirectoryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.tmp.name, "index")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def kb(self, name, *texts):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"tips": [{"text": t, "topics": ["resume"]} for t in texts]}, f)
+        return path
+
+    def test_rebuild_prunes_only_its_own_builds(self):
+        first = self.kb("first.json", "Quantify resume bullets.")
+        second = self.kb("second.json", "Keep resumes to one page.")
+        first_build = tips_index.build_index(first, self.out)
+        second_build = tips_index.build_index(second, self.out)
+        self.assertTrue(os.path.isdir(first_build))      # the second build left the first alone
+
+        reader = tips_index.TipsIndex.open(second_build)
+        self.kb("first.json", "Quantify resume bullets.", "Lead with results.")
+        rebuilt = tips_index.build_index(first, self.out)
+        self.assertNotEqual(rebuilt, first_build)
+        self.assertFalse(os.path.exists(first_build))    # the stale build of the same source goes
+        self.assertTrue(os.path.isdir(second_build))
+        self.assertEqual(reader.search("one page resume", k=1)[0]["text"], "Keep resumes to one page.")
+        self.assertEqual(sorted(os.listdir(self.out)), sorted(map(os.path.basename, [rebuilt, second_build])))
+
+
+if __name__ == "__main__":
+    unittest.main()
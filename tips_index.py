@@ -0,0 +1,331 @@
+# tips_index.py — BM25 retrieval over the Career Tips knowledge base (data/tips.json)
+#
+#   python tips_index.py build                                  # offline: data/tips.json -> .cache/tips_index/
+#   python tips_index.py build kb.jsonl -o /srv/tips_index      # any JSON / JSON-lines file of tips
+#   python tips_index.py search "internship ideas" --field Medical --city Pune
+#
+#   index = load_index(directory=".cache/tips_index")           # memory-maps the prebuilt arrays
+#   hits = index.search("internship", field="Medical", city="Pune", profile=profile, k=3)
+#
+# The builder tokenizes every tip (text + topics, the topic tags counted TOPIC_WEIGHT
+# times) and writes the inverted index as flat NumPy arrays: per-term posting ranges
+# (CSR), the posting doc ids with their precomputed BM25 weights, per-tip field / gap
+# bitmasks, and the tip texts as one UTF-8 blob with offsets; the vocabulary is a
+# sorted blob too, binary-searched per query term. load_index() opens them with
+# mmap_mode="r", so startup only parses a small manifest whatever the knowledge base
+# size, and a query touches just its own terms' postings. Scores are then re-ranked by
+# the user's field, resume gaps (checks from field_rules.json the profile fails) and
+# city. Each build lives in a directory named after the source file's path and digest,
+# so an edited knowledge base is rebuilt on next load, a stale index is never served,
+# and rebuilding one knowledge base never removes another's build.
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import functools
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from field_rules import load_rules
+from tracing import traced
+
+TIPS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "tips.json")
+DEFAULT_DIR = os.path.join(".cache", "tips_index")
+INDEX_VERSION = 3          # bump when terms() or the array layout changes
+K1, B = 1.2, 0.75
+# A tip's topic tags count this many times its own words, so the tags decide what it is about.
+TOPIC_WEIGHT = 3
+# Re-ranking multipliers: tips for the user's field / for a gap they have / with a {city} slot.
+FIELD_BOOST, OFF_FIELD = 1.5, 0.3
+GAP_BOOST, NO_GAP = 1.3, 0.8
+CITY_BOOST = 1.2
+# Most a tip matching the question gains from also matching the profile's gaps (+30%).
+CONTEXT_WEIGHT = 0.3
+ARRAYS = ("term_off", "term_text", "term_ptr", "post_doc", "post_weight",
+          "doc_fields", "doc_needs", "doc_local", "text_off", "text")
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#]*")
+# Stopwords include question filler ("how do I write good tips") that would otherwise outrank the topic.
+STOPWORDS = frozenset("""a about also am an and any are as at be best better can could do does find for
+from get give good help how i idea ideas if improve in into is it just know like make me more my need next
+now of on or please should so some suggest take than that the their them there this tip tips to want was
+what when where which who why will with would write you your""".split())
+
+
+def _stem(word: str) -> str:
+    """Crude plural folding so "internships" finds "internship" (applied to tips and questions alike)."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+def terms(text: str) -> List[str]:
+    """Folded non-stopword words plus adjacent-word bigrams ("data analysis" -> data, analysi, data_analysi)."""
+    words = [_stem(w) for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+    return words + [f"{a}_{b}" for a, b in zip(words, words[1:])]
+
+def read_tips(path: str) -> List[Dict[str, Any]]:
+    """{"tips": [...]} / a JSON list / JSON lines; each tip {"text", "topics"?, "fields"?, "needs"?}."""
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    if path.endswith(".jsonl"):
+        return [json.loads(line) for line in raw.splitlines() if line.strip()]
+    data = json.loads(raw)
+    return data["tips"] if isinstance(data, dict) else data
+
+def source_key(path: str) -> str:
+    """Which knowledge base a build belongs to: the source path, so several can share a directory."""
+    return hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:8]
+
+def source_digest(path: str) -> str:
+    h = hashlib.sha256(f"{INDEX_VERSION}|{K1}|{B}|{TOPIC_WEIGHT}|".encode())
+    with open(path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+# ----------------------------- Building ----------------------------- #
+def _blob(items: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """Byte strings -> (offsets, concatenated bytes); item i is blob[offsets[i]:offsets[i + 1]]."""
+    offsets = np.zeros(len(items) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in items])
+    return offsets, np.frombuffer(b"".join(items), dtype=np.uint8)
+
+@traced("tips_index.build", attrs=lambda tips: {"tips": len(tips)})
+def build_arrays(tips: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Tips -> (manifest, arrays) of a BM25 inverted index; weights already include IDF and length norm."""
+    fields: List[str] = []
+    needs: List[str] = []
+    doc_terms: List[Counter] = []
+    doc_fields, doc_needs, doc_local, texts = [], [], [], []
+    for tip in tips:
+        text = tip["text"]
+        counts = Counter(terms(text))
+        for _ in range(TOPIC_WEIGHT):
+            counts.update(terms(" ".join(tip.get("topics", []))))
+        doc_terms.append(counts)
+        mask = 0
+        for name in tip.get("fields", []):
+            if name not in fields:
+                fields.append(name)
+            mask |= 1 << fields.index(name)
+        doc_fields.append(mask)
+        mask = 0
+        for name in tip.get("needs", []):
+            if name not in needs:
+                needs.append(name)
+            mask |= 1 << needs.index(name)
+        doc_needs.append(mask)
+        doc_local.append("{city}" in text)
+        texts.append(text.encode("utf-8"))
+    if len(fields) > 32 or len(needs) > 8:
+        raise ValueError("tips_index supports at most 32 fields and 8 needs")
+
+    n = len(tips)
+    # term id = rank in sorted order (str order == UTF-8 byte order), so lookups can bisect the blob
+    vocab = {t: i for i, t in enumerate(sorted(set().union(*doc_terms)))}
+    lengths = np.array([sum(c.values()) for c in doc_terms], dtype=np.float32)
+    avgdl = float(lengths.mean()) if n else 1.0
+    df = np.zeros(len(vocab), dtype=np.int64)
+    postings: List[List[Tuple[int, int]]] = [[] for _ in vocab]
+    for d, counts in enumerate(doc_terms):
+        for t, tf in counts.items():
+            tid = vocab[t]
+            df[tid] += 1
+            postings[tid].append((d, tf))
+    idf = np.log1p((n - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    term_ptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+    term_ptr[1:] = np.cumsum(df)
+    post_doc = np.empty(int(term_ptr[-1]), dtype=np.int32)
+    tf = np.empty(int(term_ptr[-1]), dtype=np.float32)
+    for tid, plist in enumerate(postings):
+        lo = term_ptr[tid]
+        post_doc[lo:lo + len(plist)] = [d for d, _ in plist]
+        tf[lo:lo + len(plist)] = [c for _, c in plist]
+    norm = K1 * (1 - B + B * lengths[post_doc] / avgdl)
+    post_weight = (np.repeat(idf, df) * tf * (K1 + 1) / (tf + norm)).astype(np.float32)
+
+    term_off, term_text = _blob([t.encode("utf-8") for t in vocab])
+    text_off, text = _blob(texts)
+    manifest = {"version": INDEX_VERSION, "docs": n, "terms": len(vocab), "fields": fields, "needs": needs}
+    arrays = {
+        "term_off": term_off, "term_text": term_text,
+        "term_ptr": term_ptr, "post_doc": post_doc, "post_weight": post_weight,
+        "doc_fields": np.array(doc_fields, dtype=np.uint32),
+        "doc_needs": np.array(doc_needs, dtype=np.uint8),
+        "doc_local": np.array(doc_local, dtype=bool),
+        "text_off": text_off, "text": text,
+    }
+    return manifest, arrays
+
+def build_index(source: str = TIPS_FILE, directory: str = DEFAULT_DIR) -> str:
+    """
+    Build `source` into <directory>/<source key>-<source digest>/ (written to a temp dir, then
+    renamed, so readers never see half an index) and drop older builds of the same source;
+    other knowledge bases built into `directory` are left alone. Returns the build's path.
+    """
+    prefix = f"{source_key(source)}-"
+    target = os.path.join(directory, prefix + source_digest(source))
+    if os.path.exists(os.path.join(target, "manifest.json")):
+        return target
+    manifest, arrays = build_arrays(read_tips(source))
+    os.makedirs(directory, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=directory, prefix=".build-")
+    try:
+        for name, arr in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), arr)
+        with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.rename(tmp, target)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.exists(os.path.join(target, "manifest.json")):   # lost a race: keep the winner's
+            raise
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name != os.path.basename(target):
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+    return target
+
+
+# ----------------------------- Querying ----------------------------- #
+class TipsIndex:
+    """A built index (memory-mapped or in memory); read-only, so one instance serves every session."""
+
+    def __init__(self, manifest: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.docs = manifest["docs"]
+        self.n_terms = manifest["terms"]
+        self.fields: List[str] = manifest["fields"]
+        self.needs: List[str] = manifest["needs"]
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def open(cls, path: str) -> "TipsIndex":
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        return cls(manifest, {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in ARRAYS})
+
+    def context_terms(self, field: Optional[str], profile: Optional[Dict[str, Any]]) -> Tuple[List[str], int]:
+        """The profile's failed checks and missing field skills as query terms, plus its gap bitmask."""
+        if not profile:
+            return [], 0
+        rules = load_rules()
+        failed = [cid for cid, key in zip(rules.check_ids, rules.requires) if not profile.get(key)]
+        words = list(failed)
+        if field:
+            _, have = rules.encode(profile)
+            gap = rules.rule(field).skill_gap(have)
+            words += [t for i, t in enumerate(rules.terms) if gap >> i & 1]
+        mask = sum(1 << self.needs.index(c) for c in failed if c in self.needs)
+        return [t for w in words for t in terms(w)], mask
+
+    def term_id(self, term: str) -> Optional[int]:
+        """Binary search of the sorted vocabulary blob; None for a term no tip contains."""
+        key = term.encode("utf-8")
+        off, blob = self.term_off, self.term_text
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if bytes(blob[off[mid]:off[mid + 1]]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self.n_terms and bytes(blob[off[lo]:off[lo + 1]]) == key else None
+
+    def _scores(self, words: List[str]) -> np.ndarray:
+        """BM25 score of every tip for `words` (repeated words count again, unknown ones are skipped)."""
+        ids = (self.term_id(t) for t in words)
+        weighted = Counter(tid for tid in ids if tid is not None)
+        scores = np.zeros(self.docs, dtype=np.float32)
+        for tid, weight in weighted.items():
+            lo, hi = self.term_ptr[tid], self.term_ptr[tid + 1]
+            # a term lists each doc once, so fancy-index += needs no np.add.at
+            scores[self.post_doc[lo:hi]] += np.float32(weight) * self.post_weight[lo:hi]
+        return scores
+
+    def text_of(self, doc: int) -> str:
+        return bytes(self.text[self.text_off[doc]:self.text_off[doc + 1]]).decode("utf-8")
+
+    @traced("tips_index.search", attrs=lambda self, query, **kw: {"chars": len(query)})
+    def search(self, query: str, field: Optional[str] = None, city: Optional[str] = None,
+               profile: Optional[Dict[str, Any]] = None, k: int = 3) -> List[Dict[str, Any]]:
+        """
+        Top-k tips for `query` as [{"id", "score", "text"}], best first, with "{city}" filled in.
+        The profile (extract_profile output) breaks ties among matching tips towards what the
+        resume lacks, and answers a question that matches nothing with tips for those gaps.
+        """
+        scores = self._scores(terms(query))
+        extra, gaps = self.context_terms(field, profile)
+        if extra:
+            context = self._scores(extra)
+            if not scores.any():
+                scores = context
+            elif context.any():
+                scores *= 1 + CONTEXT_WEIGHT * context / context.max()
+
+        if field in self.fields:
+            bit = np.uint32(1 << self.fields.index(field))
+            scores *= np.where(self.doc_fields == 0, 1.0, np.where(self.doc_fields & bit, FIELD_BOOST, OFF_FIELD))
+        if profile:
+            scores *= np.where(self.doc_needs == 0, 1.0, np.where(self.doc_needs & np.uint8(gaps), GAP_BOOST, NO_GAP))
+        if city:
+            scores *= np.where(self.doc_local, CITY_BOOST, 1.0)
+
+        hits = np.flatnonzero(scores > 0)
+        if len(hits) > k:
+            hits = hits[np.argpartition(-scores[hits], k - 1)[:k]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        fill = city or "your city"
+        return [{"id": int(d), "score": round(float(scores[d]), 4), "text": self.text_of(d).replace("{city}", fill)}
+                for d in hits]
+
+
+@functools.lru_cache(maxsize=4)
+def load_index(source: str = TIPS_FILE, directory: Optional[str] = DEFAULT_DIR) -> TipsIndex:
+    """
+    Memory-map the build of `source` under `directory`, building it first if the knowledge
+    base changed since (or was never built). directory=None builds in memory.
+    """
+    if directory is None:
+        return TipsIndex(*build_arrays(read_tips(source)))
+    return TipsIndex.open(build_index(source, directory))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Career Tips knowledge-base index (BM25, memory-mapped).")
+    ap.add_argument("-o", "--dir", default=DEFAULT_DIR, help="Index directory")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="Build the index for a tips file")
+    b.add_argument("source", nargs="?", default=TIPS_FILE)
+    s = sub.add_parser("search", help="Query the index")
+    s.add_argument("query")
+    s.add_argument("--source", default=TIPS_FILE)
+    s.add_argument("--field", default=None)
+    s.add_argument("--city", default=None)
+    s.add_argument("-k", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    if args.cmd == "build":
+        path = build_index(args.source, args.dir)
+        print(f"Index for {args.source} at {path} in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+        return 0
+    index = load_index(args.source, args.dir)
+    t1 = time.perf_counter()
+    for hit in index.search(args.query, field=args.field, city=args.city, k=args.k):
+        print(f"{hit['score']:.3f}  {hit['text']}")
+    print(f"{index.docs} tips; loaded in {(t1 - t0) * 1000:.1f} ms, searched in "
+          f"{(time.perf_counter() - t1) * 1000:.2f} ms", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+# tracing.py — Lightweight per-stage timings, sizes and cache outcomes
+#
+#   from tracing import tracer, traced
+#   @traced("extract_profile", attrs=lambda text: {"chars": len(text)})
+#   def extract_profile(text): ...
+#   with tracer.span("http.get", host=host) as s:
+#       ...; s["bytes"] = len(body)
+#
+# Every finished span updates in-process aggregates (count, errors, latency
+# histogram, bytes, cache outcomes) and a ring buffer of recent spans. Export
+# them as Prometheus text (prometheus_text / write_prometheus) or as JSON log
+# lines on the "gap_mapper.trace" logger (GAP_MAPPER_TRACE_LOG=path, or "-" for
+# stderr). GAP_MAPPER_TRACE=0 turns recording off. profiled() / sampled()
+# capture a cProfile or stack-sampling report for one block of work.
+import io
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import tempfile
+import threading
+import functools
+import contextlib
+from collections import deque, Counter
+from typing import Dict, Any, List, Optional, Callable
+
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+log = logging.getLogger("gap_mapper.trace")
+
+
+def _new_stage() -> Dict[str, Any]:
+    return {"count": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0,
+            "buckets": [0] * len(BUCKETS), "cache": Counter()}
+
+
+class Tracer:
+    """Thread-safe span recorder shared by the app, the API and the batch engine (per process)."""
+
+    def __init__(self, enabled: bool = True, keep_recent: int = 200):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._recent: deque = deque(maxlen=keep_recent)
+        self._collectors: List[Callable[[str], List[str]]] = []
+
+    # ----------------------------- Recording ----------------------------- #
+    def record(self, name: str, span: Dict[str, Any]) -> None:
+        """Fold one finished span ({"seconds", optional "bytes", "cache", "error", ...}) into the stats."""
+        if not self.enabled:
+            return
+        seconds = span.get("seconds", 0.0)
+        with self._lock:
+            s = self._stages.get(name)
+            if s is None:
+                s = self._stages[name] = _new_stage()
+            s["count"] += 1
+            s["seconds"] += seconds
+            s["max_seconds"] = max(s["max_seconds"], seconds)
+            s["bytes"] += span.get("bytes") or 0
+            s["errors"] += bool(span.get("error"))
+            if span.get("cache"):
+                s["cache"][span["cache"]] += 1
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    s["buckets"][i] += 1
+                    break
+            self._recent.append(dict(span, name=name, at=time.time()))
+        if log.isEnabledFor(logging.INFO):
+            log.info(json.dumps(dict(span, name=name), default=str))
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs):
+        """Time a block; the yielded dict can be annotated (bytes, cache, ...) before it closes."""
+        span = dict(attrs)
+        if not self.enabled:
+            yield span
+            return
+        t0 = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span["error"] = type(e).__name__
+            raise
+        finally:
+            span["seconds"] = round(time.perf_counter() - t0, 6)
+            self.record(name, span)
+
+    def traced(self, name: Optional[str] = None, attrs: Optional[Callable[..., Dict[str, Any]]] = None,
+               result: Optional[Callable[[Any], Dict[str, Any]]] = None):
+        """
+        Decorator: one span per call. `attrs(*args, **kwargs)` annotates from the arguments,
+        `result(value)` from the return value (e.g. output size).
+        """
+        def wrap(fn):
+            label = name or fn.__qualname__
+
+            @functools.wraps(fn)
+            def inner(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with self.span(label, **(attrs(*args, **kwargs) if attrs else {})) as span:
+                    value = fn(*args, **kwargs)
+                    if result:
+                        span.update(result(value))
+                    return value
+            return inner
+        return wrap
+
+    def add_collector(self, collector: Callable[[str], List[str]]) -> None:
+        """Extra exposition lines (e.g. gauges owned by another module), called with the metric prefix."""
+        self._collectors.append(collector)
+
+    # ----------------------------- Reading ----------------------------- #
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage summary: count, errors, total/mean/max seconds, bytes and cache outcomes."""
+        out = {}
+        with self._lock:
+            for name, s in sorted(self._stages.items()):
+                out[name] = {
+                    "count": s["count"], "errors": s["errors"],
+                    "total_s": round(s["seconds"], 4),
+                    "mean_ms": round(s["seconds"] / s["count"] * 1000, 3) if s["count"] else 0.0,
+                    "max_ms": round(s["max_seconds"] * 1000, 3),
+                    "bytes": s["bytes"],
+                    "cache": dict(s["cache"]),
+                }
+        return out
+
+    def recent(self, n: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._recent)[-n:][::-1]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._recent.clear()
+
+    def prometheus_text(self, prefix: str = "gap_mapper") -> str:
+        """Prometheus text exposition (histogram per stage, plus bytes, errors and cache counters)."""
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        with self._lock:
+            stages = {name: dict(s, buckets=list(s["buckets"]), cache=Counter(s["cache"]))
+                      for name, s in sorted(self._stages.items())}
+        for name, s in stages.items():
+            cumulative = 0
+            for bound, n in zip(BUCKETS, s["buckets"]):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {s["seconds"]:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {s["count"]}')
+        for metric, key, help_text in (("stage_bytes_total", "bytes", "Bytes processed per stage."),
+                                       ("stage_errors_total", "errors", "Failed calls per stage.")):
+            lines += [f"# HELP {prefix}_{metric} {help_text}", f"# TYPE {prefix}_{metric} counter"]
+            lines += [f'{prefix}_{metric}{{stage="{name}"}} {s[key]}' for name, s in stages.items()]
+        lines += [f"# HELP {prefix}_cache_total Cache outcomes per stage.", f"# TYPE {prefix}_cache_total counter"]
+        for name, s in stages.items():
+            for outcome, n in sorted(s["cache"].items()):
+                lines.append(f'{prefix}_cache_total{{stage="{name}",result="{outcome}"}} {n}')
+        for collector in self._collectors:
+            lines += collector(prefix)
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically write prometheus_text() to `path` (node_exporter textfile collector style)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".prom.tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp, path)
+
+
+tracer = Tracer(enabled=os.environ.get("GAP_MAPPER_TRACE", "1") != "0")
+span = tracer.span
+traced = tracer.traced
+
+def configure_logging(target: Optional[str] = None) -> None:
+    """Emit one JSON line per span to `target` (a file path, or "-" for stderr)."""
+    target = target or os.environ.get("GAP_MAPPER_TRACE_LOG")
+    if not target or log.handlers:
+        return
+    handler = logging.StreamHandler(sys.stderr) if target == "-" else logging.FileHandler(target)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+configure_logging()
+
+# ----------------------------- Profilers (opt-in, one block of work) ----------------------------- #
+@contextlib.contextmanager
+def profiled(top: int = 30, sort: str = "cumulative"):
+    """cProfile the block; the yielded dict gets a "report" (pstats text, top N functions)."""
+    out: Dict[str, Any] = {}
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield out
+    finally:
+        prof.disable()
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).strip_dirs().sort_stats(sort).print_stats(top)
+        out["report"] = buf.getvalue()
+
+@contextlib.contextmanager
+def sampled(interval: float = 0.005, top: int = 30):
+    """
+    Sample the calling thread's stack every `interval` seconds; the yielded dict gets a
+    "report" of the hottest frames. Far lower overhead than cProfile on C-heavy code.
+    """
+    out: Dict[str, Any] = {}
+    target = threading.get_ident()
+    counts: Counter = Counter()
+    samples = [0]
+    stop = threading.Event()
+
+    def sampler():
+        while not stop.wait(interval):
+            frame = sys._current_frames().get(target)
+            samples[0] += 1
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}({code.co_name})"
+                if key not in seen:  # count each function once per sample (inclusive time)
+                    counts[key] += 1
+                    seen.add(key)
+                frame = frame.f_back
+
+    thread = threading.Thread(target=sampler, name="trace-sampler", daemon=True)
+    t0 = time.perf_counter()
+    thread.start()
+    try:
+        yield out
+    finally:
+        stop.set()
+        thread.join()
+        elapsed = time.perf_counter() - t0
+        total = max(1, samples[0])
+        rows = [f"{n / total:6.1%}  {key}" for key, n in counts.most_common(top)]
+        out["report"] = f"{elapsed:.3f}s, {samples[0]} samples every {interval * 1000:g} ms (inclusive)\n" + "\n".join(rows)